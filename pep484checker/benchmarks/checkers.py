@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""Time of a single check by every checker, for growing hints and values.
+
+Results are seconds per check, keyed by "<mode>/<group>/<case>", e.g. "compiled/list/1000".
+
+    python -m pep484checker.benchmarks.checkers [--output results.json]
+        [--baseline baseline.json] [--threshold 0.2] [--max-size 1000000] [--filter list]
+
+With --baseline, cases slower than the baseline by more than `threshold` (relative)
+are reported as regressions, and the exit status is 1 if there are any.
+Timings depend on the machine, so the baseline has to be recorded with --output on the same one,
+results are only compared when it's given.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from collections import OrderedDict
+from typing import (Any, ByteString, Callable, Container, Dict, FrozenSet, Iterable, Iterator, List,
+                    Mapping, Sequence, Set, Sized, Tuple, TypeVar, Union)
+
+from pep484checker.checker.func import check_type, compile_checker
+
+
+class Base(object):
+    pass
+
+
+class Derived(Base):
+    pass
+
+
+def _sizes(max_size):
+    size = 10
+    while size <= max_size:
+        yield size
+        size *= 10
+
+
+def _nested_hint(depth):
+    hint = int
+    for _ in range(depth):
+        hint = List[hint]
+    return hint
+
+
+def _nested_value(depth):
+    value = 1
+    for _ in range(depth):
+        value = [value, value]
+    return value
+
+
+def _callback(name: str, count: int) -> bool:
+    pass
+
+
+def _unannotated_callback(name, count):
+    pass
+
+
+def get_cases(max_size):
+    """Returns (group, case, hint, value) for every benchmarked check."""
+    cases = [
+        ('simple', 'int', int, 1),
+        ('simple', 'subclass', Base, Derived()),
+        ('simple', 'none', type(None), None),
+        ('any', 'int', Any, 1),
+        ('any', 'list', Any, [1]),
+        ('abc', 'sized', Sized, [1]),
+        ('abc', 'container', Container[int], [1]),
+        ('abc', 'bytestring', ByteString, b'a'),
+        ('abc', 'iterator', Iterator[int], iter([1])),
+    ]
+
+    classes = [type('Member{0}'.format(i), (object,), {}) for i in range(16)]
+    for width in (2, 4, 8, 16):
+        cases.append(('union', str(width), Union[tuple(classes[:width])], classes[width - 1]()))
+
+    for arity in (1, 4, 16, 64):
+        cases.append(('tuple', str(arity), Tuple[(int,) * arity], (1,) * arity))
+
+    for size in _sizes(max_size):
+        cases.append(('list', str(size), List[int], list(range(size))))
+        cases.append(('list-union', str(size), List[Union[int, str]], [1, 'a'] * (size // 2)))
+        cases.append(('dict', str(size), Dict[str, int], {str(i): i for i in range(size)}))
+        cases.append(('set', str(size), Set[int], set(range(size))))
+        cases.append(('tuple-ellipsis', str(size), Tuple[int, ...], tuple(range(size))))
+        cases.append(('frozenset', str(size), FrozenSet[int], frozenset(range(size))))
+        cases.append(('iterable', str(size), Iterable[int], list(range(size))))
+        cases.append(('sequence', str(size), Sequence[int], tuple(range(size))))
+        cases.append(('mapping', str(size), Mapping[str, int], {str(i): i for i in range(size)}))
+
+    for depth in (1, 2, 4, 8):
+        cases.append(('nesting', str(depth), _nested_hint(depth), _nested_value(depth)))
+
+    cases.append(('callable', 'annotated', Callable[[str, int], bool], _callback))
+    cases.append(('callable', 'unannotated', Callable[[str, int], bool], _unannotated_callback))
+    cases.append(('callable', 'ellipsis', Callable[..., bool], _callback))
+
+    cases.append(('typevar', 'bound', TypeVar('B', bound=Base), Base()))
+    for count in (2, 4, 8):
+        constraints = tuple(classes[:count])
+        cases.append(('typevar', 'constraints-{0}'.format(count),
+                      TypeVar('C{0}'.format(count), *constraints), constraints[-1]()))
+    return cases
+
+
+MODES = OrderedDict([
+    ('interpreted', lambda hint: lambda value: check_type(value, hint)),
+    ('compiled', lambda hint: compile_checker(hint)),
+])
+
+
+def time_check(check, value, min_time=0.05, repeat=3):
+    """Seconds per check(value), the best of `repeat` runs of at least `min_time` each."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            check(value)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed > min_time / 10 else 10
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            check(value)
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def run(max_size=10 ** 6, pattern=None, min_time=0.05, modes=tuple(MODES)):
+    results = OrderedDict()
+    for group, case, hint, value in get_cases(max_size):
+        for mode in modes:
+            key = '{0}/{1}/{2}'.format(mode, group, case)
+            if pattern is not None and pattern not in key:
+                continue
+            results[key] = time_check(MODES[mode](hint), value, min_time=min_time)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Returns (key, baseline seconds, seconds) of cases slower by more than `threshold`."""
+    return [(key, baseline[key], seconds) for key, seconds in results.items()
+            if key in baseline and seconds > baseline[key] * (1 + threshold)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output', help='file to write JSON results to, stdout by default')
+    parser.add_argument('--baseline', help='JSON results recorded on this machine to compare with')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed relative slowdown against baseline, 0.2 by default')
+    parser.add_argument('--max-size', type=int, default=10 ** 6, help='largest container size')
+    parser.add_argument('--filter', dest='pattern', help='only cases with the substring in key')
+    parser.add_argument('--min-time', type=float, default=0.05, help='seconds per timing run')
+    parser.add_argument('--modes', default=','.join(MODES), help='comma-separated modes')
+    args = parser.parse_args(argv)
+
+    results = run(args.max_size, args.pattern, args.min_time, args.modes.split(','))
+    report = OrderedDict([
+        ('python', platform.python_version()),
+        ('implementation', platform.python_implementation()),
+        ('results', results),
+    ])
+
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+
+    if args.baseline is not None:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)['results']
+
+        regressions = compare(results, baseline, args.threshold)
+        for key, before, after in regressions:
+            sys.stderr.write('REGRESSION {0}: {1:.3g}s -> {2:.3g}s (x{3:.2f})\n'
+                             .format(key, before, after, after / before))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Throughput of concurrent checks with growing number of threads.
+
+Every thread checks values against hints of the same origins with different parameters,
+so the run also verifies that concurrent checks don't see each other's parameters.
+
+    python -m pep484checker.benchmarks.threads [--checks N] [--threads 1,2,4,8]
+"""
+import argparse
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from pep484checker.checker.func import is_consistent, compile_checker
+
+
+CASES = [
+    # value, hint, verdict
+    ([1, 2, 3] * 10, List[int], True),
+    (['a', 'b'] * 15, List[str], True),
+    ([1, 2, 3] * 10, List[str], False),
+    ([[1, 2], [3]] * 10, List[List[int]], True),
+    ([[1, 2], ['3']] * 10, List[List[int]], False),
+    ({'a': [1], 'b': [2]}, Dict[str, List[int]], True),
+    ({1: ['a']}, Dict[int, List[str]], True),
+    ({'a': ['b']}, Dict[str, List[int]], False),
+    ((1, 'a', 2.0), Tuple[int, str, float], True),
+]
+
+
+def _interpreted_check(value, hint):
+    return is_consistent(value, hint)
+
+
+def _compiled_check(value, hint):
+    return compile_checker(hint).is_consistent(value)
+
+
+def _worker(check, checks, shift, barrier, errors):
+    cases = CASES[shift % len(CASES):] + CASES[:shift % len(CASES)]
+    barrier.wait()
+    for i in range(checks):
+        value, hint, verdict = cases[i % len(cases)]
+        if check(value, hint) != verdict:
+            errors.append((value, hint))
+
+
+def run(check, threads_count, checks):
+    """Returns (checks per second over all threads, wrong verdicts)."""
+    errors = []
+    barrier = threading.Barrier(threads_count + 1)
+    threads = [threading.Thread(target=_worker, args=(check, checks, shift, barrier, errors))
+               for shift in range(threads_count)]
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return threads_count * checks / elapsed, len(errors)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--checks', type=int, default=20000, help='checks per thread')
+    parser.add_argument('--threads', default='1,2,4,8', help='comma-separated numbers of threads')
+    args = parser.parse_args(argv)
+
+    for name, check in (('interpreted', _interpreted_check), ('compiled', _compiled_check)):
+        single = None
+        for threads_count in map(int, args.threads.split(',')):
+            throughput, errors = run(check, threads_count, args.checks)
+            single = single or throughput
+            print('{0:<12} threads={1:<3} {2:>12.0f} checks/s  x{3:.2f}  wrong verdicts: {4}'
+                  .format(name, threads_count, throughput, throughput / single, errors))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+from ._lazy import _raise_mismatch
+from ._shared import _Check
+
+
+class Cooperation(object):
+    """Counts checked elements, and gives control back to the event loop after every `every` of them."""
+    def __init__(self, every):
+        if every < 1:
+            raise ValueError('Number of elements between yields has to be positive.')
+        self.every = every
+        self.count = 0
+        # verdicts for containers within the check, see check_shared_async()
+        self.check = _Check()
+
+    async def checkpoint(self, elements):
+        self.count += elements
+        if self.count >= self.every:
+            self.count = 0
+            await asyncio.sleep(0)
+
+
+class CheckedAwaitable(object):
+    """Awaitable proxy, which checks the awaited result."""
+    def __init__(self, awaitable, result_hint, check_result):
+        self.awaitable = awaitable
+        self.result_hint = result_hint
+        self.check_result = check_result
+
+    def __await__(self):
+        result = yield from self.awaitable.__await__()
+        if not self.check_result(result):
+            _raise_mismatch(result, self.result_hint, 'Awaited value {0} have type {1}. Expected {2}',
+                            result, type(result), self.result_hint)
+        return result
+
+
+class CheckedAsyncIterator(object):
+    """Async iterator over `async_iterator`, every element is checked when it's pulled."""
+    def __init__(self, async_iterator, elem_hint, check_elem):
+        self.async_iterator = async_iterator
+        self.elem_hint = elem_hint
+        self.check_elem = check_elem
+        self.position = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        elem = await self.async_iterator.__anext__()
+        if not self.check_elem(elem):
+            _raise_mismatch(elem, self.elem_hint, 'Element {0} at position {1} of async iterator have type {2}. '
+                                                  'Expected {3}', elem, self.position, type(elem), self.elem_hint)
+        self.position += 1
+        return elem
+
+
+class CheckedAsyncIterable(object):
+    """Every async iteration over the proxy checks elements of `async_iterable`."""
+    def __init__(self, async_iterable, elem_hint, check_elem):
+        self.async_iterable = async_iterable
+        self.elem_hint = elem_hint
+        self.check_elem = check_elem
+
+    def __aiter__(self):
+        return CheckedAsyncIterator(self.async_iterable.__aiter__(), self.elem_hint, self.check_elem)
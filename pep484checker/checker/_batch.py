@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+from collections.abc import Mapping, Sequence
+from itertools import islice
+from operator import attrgetter, itemgetter
+
+from ._checkers import _are_types_consistent
+from ._result_funcs import bad_match, bad_element_match, IsValidType
+from ._shared import start_check, finish_check
+
+
+# rows checked within one check scope, whose verdicts for shared containers are kept until it ends
+ROWS_PER_SCOPE = 1024
+
+
+def find_first_mismatch(values, check, check_deep, type_predicate=None):
+    """Position of the first value, which check(value) finds inconsistent, or None.
+
+    Values nested deeper than recursion limit allows are checked by check_deep(value).
+    If consistency is decided by classes alone, every distinct class is checked once,
+    values are checked one by one only to find the mismatched one.
+    """
+    if type_predicate is not None and iter(values) is not values:
+        if _are_types_consistent(values, type_predicate):
+            return None
+
+    positions = enumerate(values)
+    while True:
+        rows = list(islice(positions, ROWS_PER_SCOPE))
+        if not rows:
+            return None
+
+        started = start_check()
+        try:
+            position = _find_first_mismatch(rows, check, check_deep)
+        finally:
+            if started:
+                finish_check()
+        if position is not None:
+            return position
+
+
+def _find_first_mismatch(rows, check, check_deep):
+    rows = iter(rows)
+    while True:
+        try:
+            for i, value in rows:
+                if not check(value):
+                    return i
+            return None
+        except RecursionError:
+            if not check_deep(value):
+                return i
+
+
+def get_verdicts(values, check, check_deep):
+    """List of check(value) for every value: True, or falsy verdict with the errors."""
+    verdicts = []
+    values = iter(values)
+    while True:
+        rows = list(islice(values, ROWS_PER_SCOPE))
+        if not rows:
+            break
+
+        started = start_check()
+        try:
+            _add_verdicts(verdicts, rows, check, check_deep)
+        finally:
+            if started:
+                finish_check()
+
+    # verdicts may be cached and shared, so the returned ones are fresh objects, as in validate()
+    return [verdict or IsValidType(False, errors=verdict.errors) for verdict in verdicts]
+
+
+def _add_verdicts(verdicts, rows, check, check_deep):
+    rows = iter(rows)
+    while True:
+        try:
+            for value in rows:
+                verdicts.append(check(value))
+            return
+        except RecursionError:
+            verdicts.append(check_deep(value))
+
+
+def get_rows(rows):
+    # columns are traversed one by one
+    return rows if isinstance(rows, Sequence) else list(rows)
+
+
+def get_column(rows, field):
+    """Values of the field in every row, and positions of the rows without it.
+
+    Fields are looked up by index, e.g. in mappings, tuples and rows of database drivers,
+    and string fields of other rows, which can't be indexed by them, by attribute, e.g. of named tuples.
+    Fields of mappings are only their keys, e.g. not methods of dicts.
+    Rows without the field have None in the column.
+    """
+    try:
+        return list(map(itemgetter(field), rows)), []
+    except (LookupError, TypeError):
+        pass
+
+    if isinstance(field, str) and not any(isinstance(row, Mapping) for row in rows):
+        try:
+            return list(map(attrgetter(field), rows)), []
+        except AttributeError:
+            pass
+
+    column, missing = [], []
+    for i, row in enumerate(rows):
+        try:
+            column.append(_get_field(row, field))
+        except (LookupError, AttributeError):
+            column.append(None)
+            missing.append(i)
+    return column, missing
+
+
+def _get_field(row, field):
+    try:
+        return row[field]
+    except (LookupError, TypeError):
+        if not isinstance(field, str) or isinstance(row, Mapping):
+            raise LookupError(field)
+        return getattr(row, field)
+
+
+def get_field_verdict(row, field, value, hint, verdict, missing):
+    if missing:
+        return bad_match(row, hint, 'Row has no field {0}', field)
+    return bad_element_match(verdict, field, value, hint, 'Field {0}: {1}', field, verdict)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import sys
+from array import array
+
+
+# class of container -> function(container), which returns class of its elements,
+# or None if it can't be told without iterating
+_element_type_getters = {}
+
+
+def register_buffer_type(cls, get_element_type):
+    """Elements of `cls` instances are checked by their class only,
+    as returned by get_element_type(container), without iterating over them."""
+    _element_type_getters[cls] = get_element_type
+
+
+def get_buffer_element_type(container):
+    get_element_type = _element_type_getters.get(container.__class__)
+    if get_element_type is None:
+        if not _numpy_registered and 'numpy' in sys.modules:
+            _register_numpy()
+            return get_buffer_element_type(container)
+        return None
+
+    return get_element_type(container)
+
+
+# formats of arrays and memoryviews, whose elements are of builtin types
+_format_types = {}
+_format_types.update((code, int) for code in 'bBhHiIlLqQnN')
+_format_types.update((code, float) for code in 'efd')
+_format_types.update((('?', bool), ('c', bytes), ('u', str), ('w', str)))
+
+
+def _get_array_element_type(array_):
+    return _format_types.get(array_.typecode)
+
+
+def _get_memoryview_element_type(view):
+    if view.ndim != 1:
+        return None
+
+    format_ = view.format
+    if len(format_) == 2 and format_[0] in '@=<>!':
+        format_ = format_[1]
+    return _format_types.get(format_)
+
+
+def _get_int_element_type(container):
+    return int
+
+
+register_buffer_type(array, _get_array_element_type)
+register_buffer_type(memoryview, _get_memoryview_element_type)
+register_buffer_type(range, _get_int_element_type)
+register_buffer_type(bytes, _get_int_element_type)
+register_buffer_type(bytearray, _get_int_element_type)
+
+
+# numpy is registered on the first check after it was imported by someone else
+_numpy_registered = False
+
+
+def _get_ndarray_element_type(ndarray):
+    # elements are numpy scalars, e.g. numpy.int64, of the class of the dtype, and any objects for
+    # object arrays
+    if ndarray.ndim != 1 or ndarray.dtype.kind == 'O':
+        return None
+    return ndarray.dtype.type
+
+
+def _register_numpy():
+    global _numpy_registered
+    _numpy_registered = True
+
+    import numpy
+    register_buffer_type(numpy.ndarray, _get_ndarray_element_type)
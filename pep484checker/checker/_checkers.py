@@ -1,31 +1,54 @@
 # -*- coding: utf-8 -*-
+import collections.abc
 import inspect
-from typing import _gorg
+from functools import partial
+from itertools import islice
+from operator import attrgetter
+from weakref import WeakKeyDictionary
+from typing import _gorg, GenericMeta, TypeVar
 
 from abc import ABCMeta, abstractmethod
 
-from pep484checker.checker._helpers import is_consistent_types
-from ._result_funcs import good_match, bad_match
+from pep484checker.checker._helpers import is_consistent_types, get_type_predicate, get_type_verdicts
+from ._result_funcs import good_match, bad_match, bad_element_match, _UNKNOWN_KEY
+from ._sampling import sample_elements
+from ._buffers import get_buffer_element_type
+from ._lazy import CheckedIterator, CheckedGenerator
+from ._async import CheckedAwaitable, CheckedAsyncIterator, CheckedAsyncIterable
+from ._memo import memoize_immutable
+from . import _instrumentation
+from ._collect import get_collector, uncollected, run_uncollected, collect_mismatches
+from ._shared import check_shared
+from ._members import MembersIndex, get_members_index
+from ._instrumentation import count_elements
 
 
-class _FunctionRegistry():
-    def __init__(self):
-        self._registry = dict()
+# id(origin) of generic hints, class of other typing hints -> checker instance
+_check_funcs = {}
 
-    def __setitem__(self, key, value):
-        if not isinstance(key, str) or not isinstance(value, str):
-            raise ValueError
-        self._registry[key] = value
+# unregistered generic origin -> checker, found through its MRO
+_derived_check_funcs = WeakKeyDictionary()
 
-    def __getitem__(self, item):
-        _check_func = self._registry[item] # is it free to raise KeyError and propagate it up
-        if isinstance(_check_func, str): # still path to class
-            _check_func = eval(_check_func)() # initialize, then instantiate
-            self._registry[item] = _check_func
 
-        return _check_func
+def _get_dispatch_key(hint):
+    if isinstance(hint, GenericMeta):
+        return id(_gorg(hint))
+    return hint.__class__ # Union[...] -> UnionMeta, TypeVar('T') -> TypeVar etc.
 
-_check_func_registry = _FunctionRegistry()
+
+def _get_check_func(hint):
+    check_func = _check_funcs.get(_get_dispatch_key(hint))
+    if check_func is not None:
+        return check_func
+
+    if not isinstance(hint, GenericMeta):
+        raise KeyError(hint)
+
+    origin = _gorg(hint)
+    check_func = _derived_check_funcs.get(origin)
+    if check_func is None:
+        check_func = _derived_check_funcs[origin] = _find_derived_check_func(origin)
+    return check_func
 
 
 class _CheckTypeMeta(ABCMeta):
@@ -37,7 +60,9 @@ class _CheckTypeMeta(ABCMeta):
         if not hasattr(cls, 'type_') or getattr(cls, 'type_') is None:
             raise ValueError('type_ class variable must be filled.')
 
-        _check_func_registry[cls.type_.__name__] = cls.__qualname__
+        # TypeVar itself is a TypingMeta instance, while hints are TypeVar instances
+        key = TypeVar if cls.type_ is TypeVar else _get_dispatch_key(cls.type_)
+        _check_funcs[key] = cls()
         return cls
 
 
@@ -46,18 +71,61 @@ class _CheckTypeBase(metaclass=_CheckTypeMeta):
     def __call__(self, argument, hint):
         pass
 
+    def compile(self, hint):
+        # returns plan(argument) with `hint` pre-bound, checkers with nested hints
+        # override it to pre-bind the plans of their parameters as well
+        return partial(self, hint=hint)
+
+    def compile_lazy(self, hint):
+        # returns plan(argument) -> (result, argument or its proxy), checkers of iterators
+        # override it to check elements when they are pulled from the proxy, instead of right away
+        check = self.compile(hint)
+
+        def check_eagerly(argument):
+            return check(argument), argument
+        return check_eagerly
+
+    async def check_async(self, argument, hint, cooperation):
+        # checkers of containers override it to check elements in parts,
+        # giving control back to the event loop in between, see is_checked_in_parts()
+        return _compile_checker_func(hint)(argument)
+
 
 _original_check_type = None
 def _check_type_func(argument, hint, covariant=True, contravariant=False):
     global _original_check_type
     if _original_check_type is None:
-        from .func import check_type
-        _original_check_type = check_type
+        from .func import _check_type
+        _original_check_type = _check_type
 
     return _original_check_type(argument, hint,
                                 covariant=covariant, contravariant=contravariant)
 
 
+_original_check_type_async = None
+async def _check_type_async_func(argument, hint, cooperation, covariant=True, contravariant=False):
+    global _original_check_type_async
+    if _original_check_type_async is None:
+        from .func import _check_type_async
+        _original_check_type_async = _check_type_async
+
+    return await _original_check_type_async(argument, hint, cooperation,
+                                            covariant=covariant, contravariant=contravariant)
+
+
+_original_compile_checker = None
+def _compile_checker_func(hint, covariant=True, contravariant=False):
+    global _original_compile_checker
+    if _original_compile_checker is None:
+        from .func import compile_checker
+        _original_compile_checker = compile_checker
+
+    compiled = _original_compile_checker(hint, covariant=covariant, contravariant=contravariant)
+    if _instrumentation.is_compiling_measured():
+        return compiled.measured_check
+    return compiled.check
+
+
 # ********************************************************
 # Any, Callable, Generic, Optional, TypeVar, Union, Tuple
 # ********************************************************
@@ -65,9 +133,40 @@ from typing import Any, Callable, Generic, Optional, TypeVar, Union, Tuple
 from typing import AnyMeta, CallableMeta, GenericMeta, OptionalMeta, UnionMeta, TupleMeta
 
 
+# function -> (its __annotations__, {(hint, is bound method): verdict}), entries go away with the functions;
+# verdicts are dropped when __annotations__ are replaced, but not when they are changed in place
+_signature_verdicts = WeakKeyDictionary()
+
+
 class CheckCallableSignatureMixin(object):
     def _check_callable_signature(self, callable_, hint):
-        sign = inspect.signature(callable_)
+        # bound methods are short-lived, so their function is the key; self is not in the signature
+        if inspect.ismethod(callable_):
+            owner, key = callable_.__func__, (hint, True)
+        else:
+            owner, key = callable_, (hint, False)
+
+        try:
+            entry = _signature_verdicts.get(owner)
+        except TypeError:
+            # can't be weakly referenced, or unhashable
+            return self._get_signature_verdict(callable_, hint)
+        annotations = getattr(owner, '__annotations__', None)
+        if entry is None or entry[0] is not annotations:
+            entry = _signature_verdicts[owner] = annotations, {}
+        verdicts = entry[1]
+
+        verdict = verdicts.get(key)
+        if verdict is None:
+            verdict = verdicts[key] = self._get_signature_verdict(callable_, hint)
+        return verdict
+
+    def _get_signature_verdict(self, callable_, hint):
+        try:
+            sign = inspect.signature(callable_)
+        except (ValueError, TypeError):
+            # builtins without text signature, nothing to check against
+            return good_match()
         parameters = list(sign.parameters.items())
 
         if hint.__args__ != Ellipsis:
@@ -83,27 +182,128 @@ class CheckCallableSignatureMixin(object):
                     # check_type()
                     if not is_consistent_types(param.annotation, hinted_type):
                         return bad_match(param.annotation, hinted_type,
-                                         'Argument on position {0} has incorrect type {1}. Expected {2}'
-                                         .format(i, param.annotation, hinted_type))
+                                         'Argument on position {0} has incorrect type {1}. Expected {2}',
+                                         i, param.annotation, hinted_type)
 
         # check return type
         if not sign.return_annotation == sign.empty:
             if not is_consistent_types(sign.return_annotation, hint.__result__):
                 return bad_match(sign.return_annotation, hint.__result__,
-                                 'Type of return value has incorrect type {0}. Expected {1}'
-                                 .format(sign.return_annotation, hint.__result__))
+                                 'Type of return value has incorrect type {0}. Expected {1}',
+                                 sign.return_annotation, hint.__result__)
 
         return good_match()
 
 
+_get_class = attrgetter('__class__')
+
+
+def _are_types_consistent(values, type_predicate):
+    # one pass over values in C, then single check per distinct type
+    return all(map(type_predicate, set(map(_get_class, values))))
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
 class CheckIterableMixin(object):
-    def _check_iterable(self, iterable_, elem_hint):
+    # if consistency of elements depends only on their types, check every distinct type once,
+    # elements are checked one by one only to find the mismatched one
+    distinct_types_prepass = True
+
+    def _check_iterable(self, iterable_, elem_hint, check_elem, elem_type_predicate=None):
+        verdict = self._check_buffer(iterable_, elem_hint, elem_type_predicate)
+        if verdict is not None:
+            return verdict
+
+        iterable_, start = self._get_elements(iterable_)
+        return self._check_elements(iterable_, elem_hint, check_elem, elem_type_predicate, start)
+
+    # steps shared with the iterative engine, see _iterative._traverse_elements()
+
+    def _check_buffer(self, iterable_, elem_hint, elem_type_predicate):
+        """Verdict of the array, buffer etc. by the type of its elements, or None for other iterables."""
+        if elem_type_predicate is None:
+            return None
+        # arrays, buffers etc. know the type of their elements without iterating
+        buffer_elem_type = get_buffer_element_type(iterable_)
+        if buffer_elem_type is None:
+            return None
+        if not elem_type_predicate(buffer_elem_type):
+            return bad_match(iterable_, elem_hint, 'Elements of {0} have type {1}. Expected {2}',
+                             type(iterable_), buffer_elem_type, elem_hint)
+        return good_match()
+
+    def _get_elements(self, iterable_):
+        """Returns elements to check, all or sampled, and position of the first one in the iterable."""
+        sample = sample_elements(iterable_)
+        if sample is not None:
+            # positions of sampled elements in the container are unknown
+            return sample, None
+        return iterable_, 0
+
+    def _are_elements_consistent(self, iterable_, elem_type_predicate):
+        """Whether the elements are consistent by their types alone."""
+        if _instrumentation.enabled:
+            count_elements(iterable_)
+
+        return (self.distinct_types_prepass and elem_type_predicate is not None
+                and iter(iterable_) is not iterable_ # iterators can't be traversed twice
+                and _are_types_consistent(iterable_, elem_type_predicate))
+
+    def _check_elements(self, iterable_, elem_hint, check_elem, elem_type_predicate=None, start=0):
+        if self._are_elements_consistent(iterable_, elem_type_predicate):
+            return good_match()
+
+        if get_collector() is not None:
+            return collect_mismatches(enumerate(iterable_),
+                                      partial(self._check_indexed_element, elem_hint, check_elem, start))
+
+        for i, elem in enumerate(iterable_):
+            result = check_elem(elem)
+            if not result:
+                return self._element_mismatch(result, i, elem, elem_hint, start)
+        return good_match()
+
+    def _check_indexed_element(self, elem_hint, check_elem, start, indexed_elem):
+        i, elem = indexed_elem
+        result = check_elem(elem)
+        if not result:
+            return self._element_mismatch(result, i, elem, elem_hint, start)
+        return good_match()
+
+    def _element_mismatch(self, result, i, elem, elem_hint, start=0):
+        return bad_element_match(result, _UNKNOWN_KEY if start is None else start + i,
+                                 elem, elem_hint, 'Element {0} of iterable have type {1}. '
+                                                  'Expected {2}', elem, type(elem), elem_hint)
+
+    async def _check_iterable_async(self, iterable_, elem_hint, check_elem, elem_type_predicate,
+                                    cooperation):
+        verdict = self._check_buffer(iterable_, elem_hint, elem_type_predicate)
+        if verdict is not None:
+            return verdict
+
+        iterable_, start = self._get_elements(iterable_)
+
+        if not is_checked_in_parts(elem_hint):
+            for chunk in _chunks(iterable_, cooperation.every):
+                result = self._check_elements(chunk, elem_hint, check_elem, elem_type_predicate, start)
+                if not result:
+                    return result
+                await cooperation.checkpoint(len(chunk))
+                if start is not None:
+                    start += len(chunk)
+            return good_match()
+
         for i, elem in enumerate(iterable_):
-            try:
-                _check_type_func(elem, elem_hint)
-            except TypeError as e:
-                return bad_match(elem, elem_hint, 'Element {0} of iterable have type {1}. '
-                                                  'Expected {2}'.format(elem, type(elem), elem_hint))
+            result = await _check_type_async_func(elem, elem_hint, cooperation)
+            if not result:
+                return self._element_mismatch(result, i, elem, elem_hint, start)
         return good_match()
 
 
@@ -126,11 +326,23 @@ class CheckCallable(_CheckTypeBase, CheckCallableSignatureMixin): # Done.
         return self._check_callable_signature(argument, hint)
 
 
+def _is_instance_of_generic(argument, origin):
+    if origin.__module__ == 'typing':
+        # typing ABCs are checked against their collections.abc counterparts
+        return isinstance(argument, origin)
+    # isinstance() would accept instances of __extra__ class inherited from typing bases,
+    # e.g. lists for class Rows(List[T])
+    return origin in argument.__class__.__mro__
+
+
 class CheckGeneric(_CheckTypeBase):
     type_ = Generic
 
     def __call__(self, argument, hint: GenericMeta):
-        pass
+        # parameters of user generics can't be checked, without knowing what they apply to
+        if not _is_instance_of_generic(argument, _gorg(hint)):
+            return bad_match(argument, hint)
+        return good_match()
 
 
 class CheckOptional(_CheckTypeBase): # Done.
@@ -144,43 +356,125 @@ class CheckOptional(_CheckTypeBase): # Done.
 class CheckTypeVar(_CheckTypeBase):
     type_ = TypeVar
 
+    # as for unions, only the mismatch of the typevar is reported
     def __call__(self, argument, hint: TypeVar):
+        if get_collector() is not None:
+            return run_uncollected(self._check_typevar, argument, hint)
+        return self._check_typevar(argument, hint)
+
+    def _check_typevar(self, argument, hint: TypeVar):
         if hint.__bound__ is not None:
             consistent = _check_type_func(argument, hint.__bound__,
                                               covariant=hint.__covariant__,
                                               contravariant=hint.__contravariant__)
             if not consistent:
-                return bad_match(argument, hint, "Type {0} doesn't satisfy TypeVar's bound {1}"
-                                 .format(type(argument), hint))
+                return bad_match(argument, hint, "Type {0} doesn't satisfy TypeVar's bound {1}",
+                                 type(argument), hint)
             else:
                 return good_match()
 
         if len(hint.__constraints__) != 0:
-            for c in hint.__constraints__:
-                try:
-                    _check_type_func(argument, c, covariant=hint.__covariant__,
-                                        contravariant=hint.__contravariant__)
-                except TypeError as e:
-                    pass
-                else:
+            index = get_members_index(hint, hint.__constraints__,
+                                      covariant=hint.__covariant__, contravariant=hint.__contravariant__)
+            positions = index.get_positions(argument)
+            if positions is None:
+                return good_match()
+
+            for i in positions:
+                if _check_type_func(argument, index.members[i], covariant=hint.__covariant__,
+                                    contravariant=hint.__contravariant__):
                     return good_match()
 
-            return bad_match(argument, hint, "Doesn't satisfy TypeVar's constraints {0}."
-                                 .format(hint.__constraints__))
+            return bad_match(argument, hint, "Doesn't satisfy TypeVar's constraints {0}.",
+                             hint.__constraints__)
 
         return good_match()
 
+    def compile(self, hint: TypeVar):
+        if hint.__bound__ is not None:
+            check_bound = _compile_checker_func(hint.__bound__,
+                                                covariant=hint.__covariant__,
+                                                contravariant=hint.__contravariant__)
+
+            def check_typevar_bound(argument):
+                if not check_bound(argument):
+                    return bad_match(argument, hint, "Type {0} doesn't satisfy TypeVar's bound {1}",
+                                     type(argument), hint)
+                else:
+                    return good_match()
+            return uncollected(check_typevar_bound)
+
+        if len(hint.__constraints__) != 0:
+            index = MembersIndex(hint.__constraints__,
+                                 covariant=hint.__covariant__, contravariant=hint.__contravariant__)
+            check_constraints = [_compile_checker_func(c, covariant=hint.__covariant__,
+                                                       contravariant=hint.__contravariant__)
+                                 for c in index.members]
+
+            def check_typevar_constraints(argument):
+                positions = index.get_positions(argument)
+                if positions is None:
+                    return good_match()
+
+                for i in positions:
+                    if check_constraints[i](argument):
+                        return good_match()
+
+                return bad_match(argument, hint, "Doesn't satisfy TypeVar's constraints {0}.",
+                                 hint.__constraints__)
+            return uncollected(check_typevar_constraints)
+
+        return super().compile(hint)
+
 
 class CheckUnion(_CheckTypeBase): # Done.
     type_ = Union
 
+    # mismatches of the possible types aren't collected, only the one of the union is reported
     def __call__(self, argument, hint: UnionMeta):
-        for possible_type in hint.__union_set_params__:
-            try:
-                _check_type_func(argument, possible_type)
-            except TypeError:
-                pass
-            else: # match
+        if get_collector() is not None:
+            return run_uncollected(self._check_possible_types, argument, hint)
+        return self._check_possible_types(argument, hint)
+
+    # possible types are looked up by the class of the argument, only generics are tried one by one,
+    # see MembersIndex
+    def _check_possible_types(self, argument, hint):
+        index = get_members_index(hint, hint.__union_set_params__)
+        positions = index.get_positions(argument)
+        if positions is None:
+            return good_match()
+
+        for i in positions:
+            if _check_type_func(argument, index.members[i]): # match
+                return good_match()
+
+        return bad_match(argument, hint)
+
+    def compile(self, hint: UnionMeta):
+        index = MembersIndex(hint.__union_set_params__)
+        check_possible_types = [_compile_checker_func(possible_type)
+                                for possible_type in index.members]
+
+        def check_union(argument):
+            positions = index.get_positions(argument)
+            if positions is None:
+                return good_match()
+
+            for i in positions:
+                if check_possible_types[i](argument): # match
+                    return good_match()
+
+            return bad_match(argument, hint)
+        return uncollected(check_union)
+
+    async def check_async(self, argument, hint: UnionMeta, cooperation):
+        index = get_members_index(hint, hint.__union_set_params__)
+        positions = index.get_positions(argument)
+        if positions is None:
+            return good_match()
+
+        for i in positions:
+            if await _check_type_async_func(argument, index.members[i], cooperation): # match
                 return good_match()
 
         return bad_match(argument, hint)
@@ -196,45 +490,242 @@ class CheckTuple(_CheckTypeBase, CheckIterableMixin): # Done.
         if hint.__tuple_params__ is None or len(hint.__tuple_params__) == 0:
             return good_match()
 
+        if not hint.__tuple_use_ellipsis__:
+            if len(argument) != len(hint.__tuple_params__):
+                return bad_match(argument, hint, 'Wrong number of elements in tuple.')
+
+            if get_collector() is not None:
+                return self._collect_positions(argument, hint, [partial(_check_type_func, hint=elem_hint)
+                                                                for elem_hint in hint.__tuple_params__])
+
+            for i, (elem, elem_hint) in enumerate(zip(argument, hint.__tuple_params__)):
+                result = _check_type_func(elem, elem_hint)
+                if not result:
+                    return self._position_mismatch(result, i, argument, hint)
+
+            return good_match()
+
+        else:
+            elem_hint = hint.__tuple_params__[0]
+            return self._check_iterable(argument, elem_hint,
+                                        partial(_check_type_func, hint=elem_hint),
+                                        get_type_predicate(elem_hint))
+
+    def compile(self, hint: TupleMeta):
+        if hint.__tuple_params__ is None or len(hint.__tuple_params__) == 0:
+            return super().compile(hint)
+
+        if not hint.__tuple_use_ellipsis__:
+            check_elems = [_compile_checker_func(elem_hint)
+                           for elem_hint in hint.__tuple_params__]
+            types_only = all(get_type_predicate(elem_hint) is not None
+                             for elem_hint in hint.__tuple_params__)
+
+            def check_tuple(argument):
+                if type(argument) != tuple:
+                    return bad_match(argument, hint)
+
+                if len(argument) != len(check_elems):
+                    return bad_match(argument, hint, 'Wrong number of elements in tuple.')
+
+                if get_collector() is not None:
+                    return self._collect_positions(argument, hint, check_elems)
+
+                for i, (elem, check_elem) in enumerate(zip(argument, check_elems)):
+                    result = check_elem(elem)
+                    if not result:
+                        return self._position_mismatch(result, i, argument, hint)
+
+                return good_match()
+            return memoize_immutable(check_tuple) if types_only else check_tuple
+
+        else:
+            elem_hint = hint.__tuple_params__[0]
+            check_elem = _compile_checker_func(elem_hint)
+            elem_type_predicate = get_type_predicate(elem_hint)
+
+            def check_tuple_ellipsis(argument):
+                if type(argument) != tuple:
+                    return bad_match(argument, hint)
+
+                return self._check_iterable(argument, elem_hint, check_elem, elem_type_predicate)
+            if elem_type_predicate is not None:
+                return memoize_immutable(check_tuple_ellipsis)
+            return check_tuple_ellipsis
+
+    async def check_async(self, argument, hint: TupleMeta, cooperation):
+        if type(argument) != tuple:
+            return bad_match(argument, hint)
+
+        if hint.__tuple_params__ is None or len(hint.__tuple_params__) == 0:
+            return good_match()
+
         if not hint.__tuple_use_ellipsis__:
             if len(argument) != len(hint.__tuple_params__):
                 return bad_match(argument, hint, 'Wrong number of elements in tuple.')
 
             for i, (elem, elem_hint) in enumerate(zip(argument, hint.__tuple_params__)):
-                try:
-                    _check_type_func(elem, elem_hint)
-                except TypeError as e:
-                    return bad_match(argument, hint, 'At position {0} in tuple: '.format(i) + e.args[0])
+                result = await _check_type_async_func(elem, elem_hint, cooperation)
+                if not result:
+                    return self._position_mismatch(result, i, argument, hint)
 
             return good_match()
 
         else:
-            return self._check_iterable(argument, hint.__tuple_params__[0])
+            elem_hint = hint.__tuple_params__[0]
+            return await self._check_iterable_async(argument, elem_hint, _compile_checker_func(elem_hint),
+                                                    get_type_predicate(elem_hint), cooperation)
+
+    def _position_mismatch(self, result, i, argument, hint):
+        return bad_element_match(result, i, argument, hint, 'At position {0} in tuple: {1}', i, result)
+
+    def _collect_positions(self, argument, hint, check_elems):
+        def check_position(position):
+            i, (elem, check_elem) = position
+            result = check_elem(elem)
+            if not result:
+                return self._position_mismatch(result, i, argument, hint)
+            return good_match()
+
+        return collect_mismatches(enumerate(zip(argument, check_elems)), check_position)
 
 # ********************************************************
 # ABCs (from collections.abc)
 # ********************************************************
 class CheckABCTypeMixin(object):
+    # builtin class the argument has to be an instance of, instead of the ABC
+    builtin_type_ = None
+
     def _is_consistent_with_abc(self, argument, hint):
+        if self.builtin_type_ is not None:
+            return isinstance(argument, self.builtin_type_)
+
         abc_class = hint.__extra__
-        return isinstance(argument, abc_class)
+        arg_type = argument.__class__
+        if arg_type is not type(argument):
+            # proxies, isinstance() looks at both classes
+            return isinstance(argument, abc_class)
+
+        type_verdicts = get_type_verdicts()
+        key = (arg_type, abc_class)
+        consistent = type_verdicts.get(key)
+        if consistent is None:
+            consistent = type_verdicts[key] = isinstance(argument, abc_class)
+        return consistent
 
 
 class CheckMappingMixin(object):
-    def _check_mapping(self, mapping_, k_type: TypeVar, v_type: TypeVar):
-        for k, v in mapping_.items():
-            try:
-                _check_type_func(k, k_type)
-            except TypeError as e:
-                return bad_match(k, k_type, 'Type of key {0} for mapping is incorrect. Expected {1}'
-                                 .format(k, k_type.__bound__))
+    # same as for CheckIterableMixin, keys and values are prechecked separately
+    distinct_types_prepass = True
+
+    def _check_mapping(self, mapping_, k_type, v_type, check_key, check_value,
+                       key_type_predicate=None, value_type_predicate=None):
+        items, keys, values = self._get_items(mapping_)
+        return self._check_items(items, keys, values, k_type, v_type, check_key, check_value,
+                                 key_type_predicate, value_type_predicate)
+
+    # steps shared with the iterative engine, see _iterative._traverse_mapping()
+
+    def _get_items(self, mapping_):
+        """Returns items to check, all or sampled, their keys and their values."""
+        items = sample_elements(mapping_.items())
+        if items is None:
+            return mapping_.items(), mapping_.keys(), mapping_.values()
+        return items, [k for k, _ in items], [v for _, v in items]
+
+    def _are_items_consistent(self, items, keys, values, key_type_predicate, value_type_predicate):
+        """Returns whether the keys, and the values, are consistent by their types alone."""
+        if _instrumentation.enabled:
+            count_elements(items)
+
+        if not self.distinct_types_prepass:
+            return False, False
+        keys_checked = (key_type_predicate is not None
+                        and _are_types_consistent(keys, key_type_predicate))
+        values_checked = (value_type_predicate is not None
+                          and _are_types_consistent(values, value_type_predicate))
+        return keys_checked, values_checked
+
+    def _check_items(self, items, keys, values, k_type, v_type, check_key, check_value,
+                     key_type_predicate=None, value_type_predicate=None):
+        keys_checked, values_checked = self._are_items_consistent(items, keys, values,
+                                                                  key_type_predicate, value_type_predicate)
+        if keys_checked and values_checked:
+            return good_match()
+
+        if get_collector() is not None:
+            return collect_mismatches(items, partial(self._check_item, k_type, v_type, check_key, check_value,
+                                                     keys_checked, values_checked))
+
+        for k, v in items:
+            if not keys_checked:
+                result = check_key(k)
+                if not result:
+                    return self._key_mismatch(result, k, k_type)
+            if not values_checked:
+                result = check_value(v)
+                if not result:
+                    return self._value_mismatch(result, k, v, v_type)
+        return good_match()
+
+    def _check_item(self, k_type, v_type, check_key, check_value, keys_checked, values_checked, item):
+        # both the key and the value are checked, as mismatches of both are collected
+        k, v = item
+        key_mismatch = value_mismatch = None
+        if not keys_checked:
+            result = check_key(k)
+            if not result:
+                key_mismatch = self._key_mismatch(result, k, k_type)
+        if not values_checked:
+            result = check_value(v)
+            if not result:
+                value_mismatch = self._value_mismatch(result, k, v, v_type)
+
+        if key_mismatch is None:
+            return good_match() if value_mismatch is None else value_mismatch
+        if value_mismatch is not None:
+            key_mismatch.errors.extend(value_mismatch.errors)
+        return key_mismatch
+
+    def _key_mismatch(self, result, k, k_type):
+        return bad_element_match(result, k, k, k_type,
+                                 'Type of key {0} for mapping is incorrect. Expected {1}', k, k_type)
+
+    def _value_mismatch(self, result, k, v, v_type):
+        return bad_element_match(result, k, v, v_type,
+                                 'Type of value `{0}` for key `{1}` for mapping '
+                                 'is incorrect. Expected `{2}`', v, k, v_type)
+
+    async def _check_mapping_async(self, mapping_, k_type, v_type, check_key, check_value,
+                                   key_type_predicate, value_type_predicate, cooperation):
+        items, _, _ = self._get_items(mapping_)
+
+        keys_in_parts, values_in_parts = is_checked_in_parts(k_type), is_checked_in_parts(v_type)
+        if not keys_in_parts and not values_in_parts:
+            for chunk in _chunks(items, cooperation.every):
+                result = self._check_items(chunk, [k for k, _ in chunk], [v for _, v in chunk],
+                                           k_type, v_type, check_key, check_value,
+                                           key_type_predicate, value_type_predicate)
+                if not result:
+                    return result
+                await cooperation.checkpoint(len(chunk))
+            return good_match()
+
+        for k, v in items:
+            if keys_in_parts:
+                key_result = await _check_type_async_func(k, k_type, cooperation)
+            else:
+                key_result = check_key(k)
+            if not key_result:
+                return self._key_mismatch(key_result, k, k_type)
+
+            if values_in_parts:
+                value_result = await _check_type_async_func(v, v_type, cooperation)
             else:
-                try:
-                    _check_type_func(v, v_type)
-                except TypeError as e:
-                    return bad_match(v, v_type, 'Type of value `{0}` for key `{1}` for mapping '
-                                                'is incorrect. Expected `{2}`'
-                                     .format(v, k, v_type.__bound__))
+                value_result = check_value(v)
+                await cooperation.checkpoint(1)
+            if not value_result:
+                return self._value_mismatch(value_result, k, v, v_type)
         return good_match()
 
 from typing import Container, Sized, Iterable, Sequence, MutableSequence
@@ -267,19 +758,27 @@ class CheckSized(_CheckABCBase):
 
 
 class BoundTypeVarsMixin(object):
+    # parameters of the hint are paired with typevars of its origin only to read their variance,
+    # nothing is stored on typevars or on the checker, so checks may run concurrently
     def _is_unannotated(self, hint):
-        if not hasattr(self, 'origin_typevars'):
-            self.origin_typevars = _gorg(hint).__parameters__
+        return hint.__parameters__ == _gorg(hint).__parameters__
 
-        return hint.__parameters__ == self.origin_typevars
+    def _get_parameters_variance(self, hint):
+        """List of (parameter, covariant, contravariant) of the parametrized hint."""
+        return [(param, origin_typevar.__covariant__, origin_typevar.__contravariant__)
+                for origin_typevar, param in zip(_gorg(hint).__parameters__, hint.__parameters__)]
 
-    def _get_bounded_typevars(self, hint):
-        if not hasattr(self, 'origin_typevars'):
-            self.origin_typevars = _gorg(hint).__parameters__
+    def _get_parameters_checks(self, hint):
+        return [partial(_check_type_func, hint=param, covariant=covariant, contravariant=contravariant)
+                for param, covariant, contravariant in self._get_parameters_variance(hint)]
 
-        for origin_typevar, param in zip(self.origin_typevars, hint.__parameters__):
-            origin_typevar.__bound__ = param
-        return self.origin_typevars
+    def _compile_parameters(self, hint):
+        return [_compile_checker_func(param, covariant=covariant, contravariant=contravariant)
+                for param, covariant, contravariant in self._get_parameters_variance(hint)]
+
+    def _get_type_predicates(self, hint):
+        return [get_type_predicate(param, covariant=covariant, contravariant=contravariant)
+                for param, covariant, contravariant in self._get_parameters_variance(hint)]
 
 
 class CheckIterable(_CheckTypeBase, CheckABCTypeMixin, BoundTypeVarsMixin, CheckIterableMixin):
@@ -293,8 +792,55 @@ class CheckIterable(_CheckTypeBase, CheckABCTypeMixin, BoundTypeVarsMixin, Check
             # unannotated iterable
             return good_match()
 
-        bounded_typevars = self._get_bounded_typevars(hint)
-        return self._check_iterable(argument, bounded_typevars[0])
+        elem_hint, = hint.__parameters__
+        check_elem, = self._get_parameters_checks(hint)
+        elem_type_predicate, = self._get_type_predicates(hint)
+        return check_shared(argument, hint, self._check_iterable,
+                            argument, elem_hint, check_elem, elem_type_predicate)
+
+    def compile(self, hint: GenericMeta):
+        if self._is_unannotated(hint):
+            return super().compile(hint)
+
+        elem_hint, = hint.__parameters__
+        check_elem, = self._compile_parameters(hint)
+        elem_type_predicate, = self._get_type_predicates(hint)
+
+        def check_iterable(argument):
+            if not self._is_consistent_with_abc(argument, hint):
+                return bad_match(argument, hint)
+
+            return check_shared(argument, hint, self._check_iterable,
+                                argument, elem_hint, check_elem, elem_type_predicate)
+        return check_iterable
+
+    def compile_lazy(self, hint: GenericMeta):
+        if self._is_unannotated(hint):
+            return super().compile_lazy(hint)
+
+        check_iterable = self.compile(hint)
+        elem_hint, = hint.__parameters__
+        check_elem, = self._compile_parameters(hint)
+
+        def wrap_iterable(argument):
+            # one-shot iterators are checked lazily, other iterables can be traversed twice
+            if isinstance(argument, collections.abc.Iterator) and self._is_consistent_with_abc(argument, hint):
+                return good_match(), CheckedIterator(argument, elem_hint, check_elem)
+            return check_iterable(argument), argument
+        return wrap_iterable
+
+    async def check_async(self, argument, hint: GenericMeta, cooperation):
+        if not self._is_consistent_with_abc(argument, hint):
+            return bad_match(argument, hint)
+
+        if self._is_unannotated(hint):
+            return good_match()
+
+        elem_hint, = hint.__parameters__
+        check_elem, = self._compile_parameters(hint)
+        elem_type_predicate, = self._get_type_predicates(hint)
+        return await self._check_iterable_async(argument, elem_hint, check_elem, elem_type_predicate,
+                                                cooperation)
 
 
 class CheckSequence(CheckIterable):
@@ -324,8 +870,40 @@ class CheckMapping(_CheckTypeBase, CheckABCTypeMixin, BoundTypeVarsMixin, CheckM
             # unannotated iterable
             return good_match()
 
-        bounded_typevars = self._get_bounded_typevars(hint)
-        return self._check_mapping(argument, bounded_typevars[0], bounded_typevars[1])
+        k_type, v_type = hint.__parameters__
+        check_key, check_value = self._get_parameters_checks(hint)
+        key_type_predicate, value_type_predicate = self._get_type_predicates(hint)
+        return check_shared(argument, hint, self._check_mapping, argument, k_type, v_type,
+                            check_key, check_value, key_type_predicate, value_type_predicate)
+
+    def compile(self, hint: GenericMeta):
+        if self._is_unannotated(hint):
+            return super().compile(hint)
+
+        k_type, v_type = hint.__parameters__
+        check_key, check_value = self._compile_parameters(hint)
+        key_type_predicate, value_type_predicate = self._get_type_predicates(hint)
+
+        def check_mapping(argument):
+            if not self._is_consistent_with_abc(argument, hint):
+                return bad_match(argument, hint)
+
+            return check_shared(argument, hint, self._check_mapping, argument, k_type, v_type,
+                                check_key, check_value, key_type_predicate, value_type_predicate)
+        return check_mapping
+
+    async def check_async(self, argument, hint: GenericMeta, cooperation):
+        if not self._is_consistent_with_abc(argument, hint):
+            return bad_match(argument, hint)
+
+        if self._is_unannotated(hint):
+            return good_match()
+
+        k_type, v_type = hint.__parameters__
+        check_key, check_value = self._compile_parameters(hint)
+        key_type_predicate, value_type_predicate = self._get_type_predicates(hint)
+        return await self._check_mapping_async(argument, k_type, v_type, check_key, check_value,
+                                               key_type_predicate, value_type_predicate, cooperation)
 
 
 class CheckMutableMapping(CheckMapping):
@@ -336,24 +914,79 @@ class CheckByteString(_CheckABCBase):
     type_ = ByteString
 
 
-class CheckIterator(_CheckABCBase):
+class CheckIterator(_CheckABCBase, BoundTypeVarsMixin):
     type_ = Iterator
 
+    def compile_lazy(self, hint: GenericMeta):
+        if self._is_unannotated(hint):
+            return super().compile_lazy(hint)
+
+        elem_hint, = hint.__parameters__
+        check_elem, = self._compile_parameters(hint)
+
+        def wrap_iterator(argument):
+            if not self._is_consistent_with_abc(argument, hint):
+                return bad_match(argument, hint), argument
+            return good_match(), CheckedIterator(argument, elem_hint, check_elem)
+        return wrap_iterator
+
 
-class CheckAwaitable(_CheckABCBase):
+class CheckAwaitable(_CheckABCBase, BoundTypeVarsMixin):
     type_ = Awaitable
 
+    def compile_lazy(self, hint: GenericMeta):
+        if self._is_unannotated(hint):
+            return super().compile_lazy(hint)
+
+        result_hint, = hint.__parameters__
+        check_result, = self._compile_parameters(hint)
+
+        def wrap_awaitable(argument):
+            if not self._is_consistent_with_abc(argument, hint):
+                return bad_match(argument, hint), argument
+            return good_match(), CheckedAwaitable(argument, result_hint, check_result)
+        return wrap_awaitable
 
-class CheckAsyncIterable(_CheckABCBase):
+
+class CheckAsyncIterable(_CheckABCBase, BoundTypeVarsMixin):
     type_ = AsyncIterable
 
+    def compile_lazy(self, hint: GenericMeta):
+        if self._is_unannotated(hint):
+            return super().compile_lazy(hint)
+
+        elem_hint, = hint.__parameters__
+        check_elem, = self._compile_parameters(hint)
+
+        def wrap_async_iterable(argument):
+            if not self._is_consistent_with_abc(argument, hint):
+                return bad_match(argument, hint), argument
+            if isinstance(argument, collections.abc.AsyncIterator):
+                return good_match(), CheckedAsyncIterator(argument, elem_hint, check_elem)
+            return good_match(), CheckedAsyncIterable(argument, elem_hint, check_elem)
+        return wrap_async_iterable
+
 
-class CheckAsyncIterator(_CheckABCBase):
+class CheckAsyncIterator(CheckAsyncIterable):
     type_ = AsyncIterator
 
 
-class CheckGenerator(_CheckABCBase):
+class CheckGenerator(_CheckABCBase, BoundTypeVarsMixin):
     type_ = Generator
+
+    def compile_lazy(self, hint: GenericMeta):
+        if self._is_unannotated(hint):
+            return super().compile_lazy(hint)
+
+        yield_hint, send_hint, return_hint = hint.__parameters__
+        check_yield, check_send, check_return = self._compile_parameters(hint)
+
+        def wrap_generator(argument):
+            if not self._is_consistent_with_abc(argument, hint):
+                return bad_match(argument, hint), argument
+            return good_match(), CheckedGenerator(argument, yield_hint, check_yield, send_hint, check_send,
+                                                  return_hint, check_return)
+        return wrap_generator
 # ********************************************************
 # Python data structures (Dict, List, Set, FrozenSet, Generator)
 # ********************************************************
@@ -361,39 +994,103 @@ class CheckGenerator(_CheckABCBase):
 from typing import Dict, Set, List, FrozenSet
 class CheckDict(CheckMutableMapping):
     type_ = Dict
-
-    def __call__(self, argument, hint):
-        if not isinstance(argument, dict):
-            return bad_match(argument, hint)
-
-        return super().__call__(argument, hint)
+    builtin_type_ = dict
 
 
 class CheckList(CheckMutableSequence):
     type_ = List
-
-    def __call__(self, argument, hint):
-        if not isinstance(argument, list):
-            return bad_match(argument, hint)
-
-        return super().__call__(argument, hint)
+    builtin_type_ = list
 
 
 class CheckSet(CheckMutableSet):
     type_ = Set
-
-    def __call__(self, argument, hint):
-        if not isinstance(argument, set):
-            return bad_match(argument, hint)
-
-        return super().__call__(argument, hint)
+    builtin_type_ = set
 
 
 class CheckFrozenSet(CheckAbstractSet):
     type_ = FrozenSet
+    builtin_type_ = frozenset
+
+    def compile(self, hint: GenericMeta):
+        check_frozenset = super().compile(hint)
+        if self._is_unannotated(hint) or None in self._get_type_predicates(hint):
+            return check_frozenset
+        # verdict depends only on the types of the elements
+        return memoize_immutable(check_frozenset)
+
+
+def is_checked_in_parts(hint):
+    """Whether checking `hint` iterates over elements of containers,
+    such checks give control back to the event loop in check_type_async()."""
+    if isinstance(hint, UnionMeta):
+        return any(map(is_checked_in_parts, hint.__union_set_params__))
+
+    if isinstance(hint, TupleMeta):
+        params = hint.__tuple_params__
+        if not params:
+            return False
+        return hint.__tuple_use_ellipsis__ or any(map(is_checked_in_parts, params))
+
+    if isinstance(hint, GenericMeta) and hint.__parameters__:
+        try:
+            check_func = _get_check_func(hint)
+        except KeyError:
+            return False
+        return isinstance(check_func, (CheckIterable, CheckMapping))
+
+    return False
+
+
+class _CheckDerivedGeneric(object):
+    """Checker of generics without registered checkers, such as user subclasses of List[T].
+
+    Argument has to be an instance of the generic, and is checked by the checker of the nearest
+    registered base, parametrized the same way the hint parametrizes the generic,
+    e.g. Rows[int] for class Rows(List[T]) is checked as List[int].
+    """
+    def __init__(self, base, base_check_func):
+        self.base = base
+        self.base_check_func = base_check_func
+
+    def _get_base_hint(self, hint):
+        base = self.base
+        if not isinstance(base, GenericMeta) or not base.__parameters__:
+            return base
+
+        substitutions = dict(zip(_gorg(hint).__parameters__, hint.__parameters__))
+        params = tuple(substitutions.get(param, param) for param in base.__parameters__)
+        if params == base.__parameters__:
+            return base
+        return _gorg(base)[params]
 
     def __call__(self, argument, hint):
-        if not isinstance(argument, frozenset):
+        if not _is_instance_of_generic(argument, _gorg(hint)):
             return bad_match(argument, hint)
+        return self.base_check_func(argument, self._get_base_hint(hint))
+
+    def compile(self, hint):
+        origin = _gorg(hint)
+        check_base = self.base_check_func.compile(self._get_base_hint(hint))
+
+        def check_derived_generic(argument):
+            if not _is_instance_of_generic(argument, origin):
+                return bad_match(argument, hint)
+            return check_base(argument)
+        return check_derived_generic
+
+    def compile_lazy(self, hint):
+        return _CheckTypeBase.compile_lazy(self, hint)
+
+    async def check_async(self, argument, hint, cooperation):
+        return self.compile(hint)(argument)
+
+
+def _find_derived_check_func(origin):
+    for base in origin.__mro__[1:]:
+        check_func = _check_funcs.get(_get_dispatch_key(base) if isinstance(base, GenericMeta) else None)
+        if check_func is not None:
+            if isinstance(check_func, CheckGeneric):
+                return check_func
+            return _CheckDerivedGeneric(base, check_func)
 
-        return super().__call__(argument, hint)
+    return _check_funcs[_get_dispatch_key(Generic)]
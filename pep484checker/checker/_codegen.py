@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+from functools import lru_cache
+from typing import TypingMeta, Callable, _type_check, _gorg, _ForwardRef
+
+from pep484checker.checker._helpers import evaluate_forward_reference, get_type_predicate
+from ._buffers import get_buffer_element_type
+from ._checkers import (_get_check_func, _compile_checker_func,
+                        CheckAny, CheckUnion, CheckTypeVar, CheckTuple, CheckCallable,
+                        CheckIterable, CheckMapping, _CheckABCBase)
+
+
+GENERATED_VALIDATORS_CACHE_SIZE = 256
+
+
+class _ValidatorSource(object):
+    """Source of validate(argument) -> bool, specialized for a single hint.
+
+    Checks are emitted as flat statements, every mismatch is `return False`.
+    Hints which can't be inlined are bound as globals of the generated function,
+    either as other generated functions or as compiled plans.
+    """
+    def __init__(self):
+        self.namespace = {}
+        self.functions = []
+        self._counter = 0
+
+    def _new_name(self, prefix):
+        self._counter += 1
+        return '{0}{1}'.format(prefix, self._counter)
+
+    def bind(self, obj, prefix='_c'):
+        name = self._new_name(prefix)
+        self.namespace[name] = obj
+        return name
+
+    def add_function(self, hint, covariant, contravariant):
+        name = self._new_name('_validate')
+        lines = ['def {0}(v):'.format(name)]
+        self.emit_check(lines, 'v', hint, covariant, contravariant, 1)
+        lines.append('    return True')
+        self.functions.append('\n'.join(lines))
+        return name
+
+    def emit(self, lines, indent, line):
+        lines.append('    ' * indent + line)
+
+    def emit_fallback(self, lines, var, hint, covariant, contravariant, indent):
+        check = _compile_checker_func(hint, covariant=covariant, contravariant=contravariant)
+        name = self.bind(check, '_fallback')
+        self.emit(lines, indent, 'if not {0}({1}): return False'.format(name, var))
+
+    def simple_type_expr(self, var, hint, covariant, contravariant):
+        cls = self.bind(hint, '_t')
+        if covariant and contravariant:
+            return '(isinstance({0}, {1}) or issubclass({1}, {0}.__class__))'.format(var, cls)
+        elif covariant:
+            return 'isinstance({0}, {1})'.format(var, cls)
+        elif contravariant:
+            return '({0}.__class__ is {1} or issubclass({1}, {0}.__class__))'.format(var, cls)
+        else:
+            return '{0}.__class__ is {1}'.format(var, cls)
+
+    def alternatives_expr(self, var, hints, covariant, contravariant):
+        # isinstance() against tuple of classes for the simple members,
+        # the rest are separate generated functions
+        simple_types, exprs = [], []
+        for hint in hints:
+            hint = _type_check(hint, '`hint` argument is not an instance of `type`.')
+            if hint == type(None):
+                exprs.append('{0} is None'.format(var))
+            elif not isinstance(hint, TypingMeta) and covariant and not contravariant:
+                simple_types.append(hint)
+            elif not isinstance(hint, TypingMeta):
+                exprs.append(self.simple_type_expr(var, hint, covariant, contravariant))
+            else:
+                name = self.add_function(hint, covariant, contravariant)
+                exprs.append('{0}({1})'.format(name, var))
+
+        if simple_types:
+            exprs.insert(0, 'isinstance({0}, {1})'.format(var, self.bind(tuple(simple_types), '_ts')))
+        return ' or '.join(exprs)
+
+    def emit_check(self, lines, var, hint, covariant, contravariant, indent):
+        hint = _type_check(hint, '`hint` argument is not an instance of `type`.')
+        if isinstance(hint, _ForwardRef):
+            try:
+                hint = evaluate_forward_reference(hint)
+            except NameError:
+                return self.emit_fallback(lines, var, hint, covariant, contravariant, indent)
+            # possibly recursive hint, validator is generated on the first check
+            validate = _LazyValidator(hint, covariant, contravariant)
+            self.emit(lines, indent, 'if not {0}({1}): return False'.format(self.bind(validate, '_ref'), var))
+            return
+
+        if hint == type(None):
+            self.emit(lines, indent, 'if {0} is not None: return False'.format(var))
+            return
+
+        if not isinstance(hint, TypingMeta):
+            self.emit(lines, indent, 'if not {0}: return False'
+                      .format(self.simple_type_expr(var, hint, covariant, contravariant)))
+            return
+
+        check_func = _get_check_func(hint)
+        if isinstance(check_func, CheckAny):
+            return
+
+        elif isinstance(check_func, CheckUnion):
+            if hint.__union_set_params__ is None:
+                return self.emit_fallback(lines, var, hint, covariant, contravariant, indent)
+            self.emit(lines, indent, 'if not ({0}): return False'
+                      .format(self.alternatives_expr(var, hint.__union_set_params__, True, False)))
+
+        elif isinstance(check_func, CheckTypeVar):
+            if hint.__bound__ is not None:
+                self.emit_check(lines, var, hint.__bound__,
+                                hint.__covariant__, hint.__contravariant__, indent)
+            elif len(hint.__constraints__) != 0:
+                self.emit(lines, indent, 'if not ({0}): return False'
+                          .format(self.alternatives_expr(var, hint.__constraints__,
+                                                         hint.__covariant__, hint.__contravariant__)))
+
+        elif isinstance(check_func, CheckTuple):
+            self.emit(lines, indent, 'if type({0}) is not tuple: return False'.format(var))
+            params = hint.__tuple_params__
+            if params is None or len(params) == 0:
+                return
+
+            if not hint.__tuple_use_ellipsis__:
+                self.emit(lines, indent, 'if len({0}) != {1}: return False'.format(var, len(params)))
+                for i, elem_hint in enumerate(params):
+                    elem_var = self._new_name('v')
+                    self.emit(lines, indent, '{0} = {1}[{2}]'.format(elem_var, var, i))
+                    self.emit_check(lines, elem_var, elem_hint, True, False, indent)
+            else:
+                elem_var = self._new_name('v')
+                self.emit(lines, indent, 'for {0} in {1}:'.format(elem_var, var))
+                self.emit_check(lines, elem_var, params[0], True, False, indent + 1)
+
+        elif isinstance(check_func, CheckCallable):
+            self.emit(lines, indent, 'if not callable({0}): return False'.format(var))
+            if hint != Callable:
+                # signature checks stay in CheckCallable
+                self.emit_fallback(lines, var, hint, covariant, contravariant, indent)
+
+        elif isinstance(check_func, (CheckIterable, CheckMapping)):
+            abc_class = check_func.builtin_type_ or hint.__extra__
+            self.emit(lines, indent, 'if not isinstance({0}, {1}): return False'
+                      .format(var, self.bind(abc_class, '_abc')))
+            if check_func._is_unannotated(hint):
+                return
+
+            variances = [(typevar.__covariant__, typevar.__contravariant__)
+                         for typevar in _gorg(hint).__parameters__]
+            if isinstance(check_func, CheckMapping):
+                k_var, v_var = self._new_name('k'), self._new_name('v')
+                self.emit(lines, indent, 'for {0}, {1} in {2}.items():'.format(k_var, v_var, var))
+                for elem_var, elem_hint, (co, contra) in zip((k_var, v_var), hint.__parameters__, variances):
+                    self.emit_check(lines, elem_var, elem_hint, co, contra, indent + 1)
+            else:
+                (co, contra), = variances
+                elem_hint = hint.__parameters__[0]
+                type_predicate = get_type_predicate(elem_hint, covariant=co, contravariant=contra)
+                if type_predicate is not None:
+                    # arrays, buffers etc. are checked by the type of their elements, as by the checkers
+                    elem_type_var = self._new_name('t')
+                    self.emit(lines, indent, '{0} = {1}({2})'
+                              .format(elem_type_var, self.bind(get_buffer_element_type, '_buffer'), var))
+                    self.emit(lines, indent, 'if {0} is not None:'.format(elem_type_var))
+                    self.emit(lines, indent + 1, 'if not {0}({1}): return False'
+                              .format(self.bind(type_predicate, '_p'), elem_type_var))
+                    self.emit(lines, indent, 'else:')
+                    indent += 1
+
+                elem_var = self._new_name('v')
+                self.emit(lines, indent, 'for {0} in {1}:'.format(elem_var, var))
+                self.emit_check(lines, elem_var, elem_hint, co, contra, indent + 1)
+
+        elif isinstance(check_func, _CheckABCBase):
+            self.emit(lines, indent, 'if not isinstance({0}, {1}): return False'
+                      .format(var, self.bind(hint.__extra__, '_abc')))
+
+        else:
+            self.emit_fallback(lines, var, hint, covariant, contravariant, indent)
+
+    def build(self, hint, covariant, contravariant):
+        name = self.add_function(hint, covariant, contravariant)
+        source = '\n\n'.join(self.functions)
+        exec(compile(source, '<validator of {0!r}>'.format(hint), 'exec'), self.namespace)
+
+        validate = self.namespace[name]
+        validate.__source__ = source
+        return validate
+
+
+class _LazyValidator(object):
+    def __init__(self, hint, covariant, contravariant):
+        self.hint = hint
+        self.covariant = covariant
+        self.contravariant = contravariant
+        self.validate = None
+
+    def __call__(self, argument):
+        if self.validate is None:
+            self.validate = generate_validator(self.hint, self.covariant, self.contravariant)
+        return self.validate(argument)
+
+
+def generate_validator(hint, covariant=True, contravariant=False):
+    hint = _type_check(hint, '`hint` argument is not an instance of `type`.')
+    try:
+        hash(hint)
+    except TypeError:
+        return _ValidatorSource().build(hint, covariant, contravariant)
+
+    # see compile_checker() for why repr() is in the key
+    return _cached_generate_validator(hint, repr(hint), covariant, contravariant)
+
+
+@lru_cache(maxsize=GENERATED_VALIDATORS_CACHE_SIZE)
+def _cached_generate_validator(hint, hint_repr, covariant, contravariant):
+    return _ValidatorSource().build(hint, covariant, contravariant)
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+from ._result_funcs import good_match, IsValidType
+
+
+class ErrorCollector(object):
+    """Budget of validate_all(): at most `max_errors` mismatches, found within `max_time` seconds.
+
+    `truncated` tells if the budget ran out before the whole value was traversed.
+    """
+    def __init__(self, max_errors=100, max_time=None):
+        if max_errors < 1:
+            raise ValueError('Maximum number of errors has to be positive.')
+        self.max_errors = max_errors
+        self.max_time = max_time
+        self.errors = 0
+        self.deadline = None
+        self.truncated = False
+
+    def start(self):
+        self.restart()
+        if self.max_time is not None:
+            self.deadline = time.monotonic() + self.max_time
+
+    def restart(self):
+        # the value is traversed again, within the same time budget
+        self.errors = 0
+        self.truncated = False
+
+    def is_exhausted(self):
+        return (self.errors >= self.max_errors
+                or self.deadline is not None and time.monotonic() > self.deadline)
+
+
+class _CollectingState(threading.local):
+    collector = None
+    # number of collecting scopes entered in the thread, checks within them
+    # may still run uncollected, e.g. of union members, with collector None
+    scopes = 0
+
+
+_state = _CollectingState()
+
+
+class collecting_scope(object):
+    """Mismatches within the scope are collected by `collector`,
+    containers are traversed past their first mismatch."""
+    def __init__(self, collector):
+        self.collector = collector
+
+    def __enter__(self):
+        _state.scopes += 1
+        self.previous, _state.collector = _state.collector, self.collector
+        self.collector.start()
+        return self.collector
+
+    def __exit__(self, *exc_info):
+        _state.collector = self.previous
+        _state.scopes -= 1
+
+
+def get_collector():
+    return _state.collector
+
+
+def is_active():
+    """Tells if the thread is within some collecting scope."""
+    return _state.scopes > 0
+
+
+def uncollected(plan):
+    """Returns `plan`, which checks the argument only up to its first mismatch.
+
+    For checks whose mismatches may be expected, such as members of unions,
+    as they are tried one by one.
+    """
+    def check_uncollected(argument):
+        if _state.collector is None:
+            return plan(argument)
+        return run_uncollected(plan, argument)
+    return check_uncollected
+
+
+def run_uncollected(check, *args):
+    collector = _state.collector
+    if collector is None:
+        return check(*args)
+
+    _state.collector = None
+    try:
+        return check(*args)
+    finally:
+        _state.collector = collector
+
+
+def collect_mismatches(items, check_item):
+    """Verdict with all mismatches check_item(item) finds among `items` of a container.
+
+    check_item() returns the match result, whose errors have paths starting with the key of the item.
+    """
+    collector = _state.collector
+    errors = []
+    for item in items:
+        if collector.is_exhausted():
+            collector.truncated = True
+            break
+
+        result = check_item(item)
+        if not result:
+            add_mismatch(errors, collector, result)
+
+    return get_collected_verdict(errors)
+
+
+def add_mismatch(errors, collector, mismatch):
+    # only errors found right at this container count against the budget,
+    # the nested ones were counted by the containers they were found in
+    errors.extend(mismatch.errors)
+    collector.errors += sum(len(error.path) == 1 for error in mismatch.errors)
+
+
+def get_collected_verdict(errors):
+    if errors:
+        return IsValidType(False, errors=errors)
+    return good_match()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+import builtins
+
+from typing import _type_check
+
+
+class ForwardRefResolver(object):
+    """Evaluates forward references against given namespaces.
+
+    Expressions resolved from module globals are cached by (module, expression).
+    Expressions which failed with NameError are evaluated again only after
+    one of their missing names appears in the namespaces.
+    """
+    def __init__(self):
+        self._resolved = {} # (module, expression) -> hint
+        self._missing_names = {} # (module, expression) -> names, which weren't in namespaces
+
+    def resolve(self, expression, globalns, localns=None, code=None):
+        """Returns the hint `expression` evaluates to, raises NameError if it can't be evaluated yet."""
+        if localns is None or localns is globalns:
+            localns = {}
+        key = (globalns.get('__name__'), expression)
+
+        hint = self._resolved.get(key)
+        if hint is not None:
+            return hint
+
+        if code is None:
+            code = compile(expression, '<string>', 'eval')
+
+        missing_names = self._missing_names.get(key)
+        if missing_names is not None and not any(_is_defined(name, globalns, localns)
+                                                 for name in missing_names):
+            raise NameError('Names {0} of forward reference {1!r} are not defined yet'
+                            .format(', '.join(sorted(missing_names)), expression))
+
+        try:
+            hint = eval(code, globalns, localns)
+        except NameError:
+            self._missing_names[key] = frozenset(name for name in code.co_names
+                                                 if not _is_defined(name, globalns, localns))
+            raise
+        hint = _type_check(hint, 'Forward references must evaluate to types.')
+
+        self._missing_names.pop(key, None)
+        if key[0] is not None and not any(name in localns for name in code.co_names):
+            # names of local scopes differ between references with the same expression
+            self._resolved[key] = hint
+        return hint
+
+    def clear(self):
+        self._resolved.clear()
+        self._missing_names.clear()
+
+
+def _is_defined(name, globalns, localns):
+    return name in localns or name in globalns or hasattr(builtins, name)
+
+
+_resolver = ForwardRefResolver()
+
+
+def resolve_forward_reference(expression, globalns, localns=None):
+    """Evaluates `expression` with the default resolver, see ForwardRefResolver."""
+    return _resolver.resolve(expression, globalns, localns)
+
+
+def resolve_forward_ref_object(hint):
+    """Evaluates typing's _ForwardRef in the namespaces of the frame it was created in,
+    the frame is not referenced any more once the reference is resolved."""
+    frame = hint.__forward_frame__
+    if frame is None:
+        raise NameError('Forward reference {0!r} has no namespace to be evaluated in'
+                        .format(hint.__forward_arg__))
+
+    hint.__forward_value__ = _resolver.resolve(hint.__forward_arg__, frame.f_globals, frame.f_locals,
+                                               code=hint.__forward_code__)
+    hint.__forward_evaluated__ = True
+    hint.__forward_frame__ = None
+    return hint.__forward_value__
@@ -1,22 +1,64 @@
 # -*- coding: utf-8 -*-
-from typing import _type_check, _ForwardRef
+from abc import get_cache_token
+from functools import partial
+from typing import _type_check, _ForwardRef, TypingMeta, TypeVar, AnyMeta, UnionMeta
 
 from pep484checker.checker._result_funcs import bad_match
+from ._forward_refs import resolve_forward_ref_object
 
 
 def evaluate_forward_reference(hint):
     if isinstance(hint, _ForwardRef):
         if not hint.__forward_evaluated__:
-            globalns = hint.__forward_frame__.f_globals
-            localns = hint.__forward_frame__.f_locals
-            hint._eval_type(globalns, localns)
+            return resolve_forward_ref_object(hint)
 
+        # could be evaluated by typing itself
+        hint.__forward_frame__ = None
         hint = hint.__forward_value__
     return hint
 
 
+TYPE_VERDICTS_MAXSIZE = 4096
+
+# verdicts which depend only on classes, e.g. (arg_type, hint, covariant, contravariant) -> bool,
+# valid until some class is registered with an ABC
+_type_verdicts = {}
+_type_verdicts_token = None
+
+
+def get_type_verdicts():
+    """Returns the table of verdicts decided by classes alone, for current ABC registrations."""
+    global _type_verdicts, _type_verdicts_token
+    token = get_cache_token()
+    if token != _type_verdicts_token or len(_type_verdicts) >= TYPE_VERDICTS_MAXSIZE:
+        # new table, so that concurrent checks only ever write to the old one
+        _type_verdicts = {}
+        _type_verdicts_token = token
+    return _type_verdicts
+
+
 def is_consistent_types(arg_type, hint,
                         covariant=True, contravariant=False):
+    if isinstance(hint, TypingMeta) or isinstance(arg_type, TypingMeta):
+        # some of them are equal while being different, e.g. Tuple[int] == Tuple[int, ...]
+        return _is_consistent_types(arg_type, hint, covariant, contravariant)
+
+    type_verdicts = get_type_verdicts()
+    key = (arg_type, hint, covariant, contravariant)
+    try:
+        return type_verdicts[key]
+    except KeyError:
+        pass
+    except TypeError: # unhashable annotation
+        return _is_consistent_types(arg_type, hint, covariant, contravariant)
+
+    consistent = _is_consistent_types(arg_type, hint, covariant, contravariant)
+    if consistent is True or consistent is False:
+        type_verdicts[key] = consistent
+    return consistent
+
+
+def _is_consistent_types(arg_type, hint, covariant, contravariant):
     # TODO: add support for TypingMeta subclasses
     consistent = False
     hint = _type_check(hint, '`hint` argument is not an instance of `type`.')
@@ -26,8 +68,7 @@ def is_consistent_types(arg_type, hint,
     try:
         hint = evaluate_forward_reference(hint)
     except NameError:
-        return bad_match(arg_type, hint, "Too early evaluation of {0}"
-                         .format(hint))
+        return bad_match(arg_type, hint, "Too early evaluation of {0}", hint)
 
     if not consistent:
         consistent = (arg_type == hint)
@@ -40,3 +81,52 @@ def is_consistent_types(arg_type, hint,
 
     return consistent
 
+
+def _consistent_with_any_type(arg_type):
+    return True
+
+
+def get_type_predicate(hint, covariant=True, contravariant=False):
+    """Returns predicate(arg_type) -> bool, if consistency with the hint
+    is decided by the class of the argument alone, otherwise None."""
+    hint = _type_check(hint, '`hint` argument is not an instance of `type`.')
+    try:
+        hint = evaluate_forward_reference(hint)
+    except NameError:
+        return None
+
+    if isinstance(hint, TypeVar):
+        if hint.__bound__ is not None:
+            return get_type_predicate(hint.__bound__,
+                                      covariant=hint.__covariant__,
+                                      contravariant=hint.__contravariant__)
+        if len(hint.__constraints__) != 0:
+            if hint.__covariant__ or hint.__contravariant__:
+                return None
+            return _get_any_of_predicate(hint.__constraints__,
+                                         covariant=False, contravariant=False)
+        return _consistent_with_any_type
+
+    if isinstance(hint, AnyMeta):
+        return _consistent_with_any_type
+
+    if isinstance(hint, UnionMeta) and hint.__union_set_params__ is not None:
+        return _get_any_of_predicate(hint.__union_set_params__)
+
+    if isinstance(hint, TypingMeta):
+        # generic types depend on the contents of the argument
+        return None
+
+    return partial(is_consistent_types, hint=hint,
+                   covariant=covariant, contravariant=contravariant)
+
+
+def _get_any_of_predicate(hints, covariant=True, contravariant=False):
+    predicates = [get_type_predicate(hint, covariant=covariant, contravariant=contravariant)
+                  for hint in hints]
+    if None in predicates:
+        return None
+
+    def any_of_predicate(arg_type):
+        return any(predicate(arg_type) for predicate in predicates)
+    return any_of_predicate
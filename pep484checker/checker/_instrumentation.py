@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+
+# upper bounds of latency histogram buckets in seconds, the last bucket is unbounded
+LATENCY_BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+# checked before anything else is done, so that disabled instrumentation costs a single lookup
+enabled = False
+
+
+class HintStats(object):
+    __slots__ = ('checks', 'failures', 'elements', 'total_time', 'histogram')
+
+    def __init__(self):
+        self.checks = self.failures = self.elements = 0
+        self.total_time = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def as_dict(self):
+        labels = ['<={0:g}s'.format(bound) for bound in LATENCY_BUCKETS]
+        labels.append('>{0:g}s'.format(LATENCY_BUCKETS[-1]))
+        return {'checks': self.checks, 'failures': self.failures, 'elements': self.elements,
+                'total_time': self.total_time, 'histogram': dict(zip(labels, self.histogram))}
+
+
+class _ElementsCounter(threading.local):
+    elements = 0
+
+
+class _CompilationState(threading.local):
+    measured = False
+
+
+_counter = _ElementsCounter()
+_compilation = _CompilationState()
+_stats = {} # repr(hint) -> HintStats
+_lock = threading.Lock()
+_dump_hook = None
+_dump_interval = None
+_last_dump = 0.0
+
+
+def enable_instrumentation(dump_hook=None, dump_interval=60.0):
+    """Starts collecting per hint statistics of checks done by check_type(), is_consistent(),
+    validate(), compiled checkers and @typechecked functions, for their hints and typing hints
+    nested in them. Statistics of a hint include the ones of hints nested in it.
+
+    `dump_hook(stats)` is called with get_check_stats() at most every `dump_interval` seconds,
+    from the thread which happens to finish a check then.
+    """
+    global enabled, _dump_hook, _dump_interval, _last_dump
+    _dump_hook, _dump_interval = dump_hook, dump_interval
+    _last_dump = time.monotonic()
+    enabled = True
+
+
+def disable_instrumentation():
+    global enabled, _dump_hook
+    enabled = False
+    _dump_hook = None
+
+
+def reset_check_stats():
+    with _lock:
+        _stats.clear()
+
+
+def get_check_stats():
+    """Returns {repr(hint): {'checks', 'failures', 'elements', 'total_time', 'histogram'}}."""
+    with _lock:
+        return {hint_repr: stats.as_dict() for hint_repr, stats in _stats.items()}
+
+
+def get_hot_hints(count=10, key='total_time'):
+    """Returns [(repr(hint), stats)] of `count` hints with the largest `key` statistic."""
+    return sorted(get_check_stats().items(), key=lambda item: item[1][key], reverse=True)[:count]
+
+
+def count_elements(container):
+    """Called by container checkers, for the elements they are going to check."""
+    try:
+        _counter.elements += len(container)
+    except TypeError: # iterators
+        pass
+
+
+def measure(hint, check, argument):
+    """Returns check(argument), recording its statistics for the hint."""
+    outer_elements = _counter.elements
+    _counter.elements = 0
+    start = time.perf_counter()
+    try:
+        result = check(argument)
+    finally:
+        elapsed = time.perf_counter() - start
+        elements = _counter.elements
+        _counter.elements = outer_elements + elements
+
+    hint_repr = repr(hint)
+    with _lock:
+        stats = _stats.get(hint_repr)
+        if stats is None:
+            stats = _stats[hint_repr] = HintStats()
+        stats.checks += 1
+        stats.failures += not result
+        stats.elements += elements
+        stats.total_time += elapsed
+        stats.histogram[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+    _maybe_dump()
+    return result
+
+
+def measured(hint, plan):
+    """Returns `plan`, which records its statistics for the hint."""
+    def check_measured(argument):
+        return measure(hint, plan, argument)
+    return check_measured
+
+
+@contextmanager
+def compiling_measured():
+    """Plans compiled within the scope measure the hints nested in them, see measured()."""
+    previous = _compilation.measured
+    _compilation.measured = True
+    try:
+        yield
+    finally:
+        _compilation.measured = previous
+
+
+def is_compiling_measured():
+    return _compilation.measured
+
+
+def _maybe_dump():
+    global _last_dump
+    hook = _dump_hook
+    if hook is None:
+        return
+
+    now = time.monotonic()
+    with _lock:
+        if now - _last_dump < _dump_interval:
+            return
+        _last_dump = now
+    hook(get_check_stats())
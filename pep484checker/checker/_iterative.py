@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+from typing import TypingMeta, _type_check, _gorg
+
+from ._checkers import (CheckUnion, CheckTypeVar, CheckTuple, CheckIterable, CheckMapping,
+                        _CheckDerivedGeneric, _get_check_func, _check_type_func, _is_instance_of_generic)
+from ._collect import get_collector, run_uncollected, add_mismatch, get_collected_verdict
+from ._helpers import evaluate_forward_reference, get_type_predicate
+from ._members import get_members_index
+from ._result_funcs import good_match, bad_match
+from ._shared import start_check, finish_check, get_node_key, get_node_verdict, set_node_verdict
+
+
+def check_iteratively(argument, hint, covariant=True, contravariant=False):
+    """Same as _check_type(), but values nested in containers are traversed with an explicit stack,
+    instead of recursion, so there's no limit on their depth.
+
+    Every container, union and typevar being checked is a generator on the stack, which yields
+    (value, hint, covariant, contravariant) of the nested checks, and is sent back their results.
+    Other hints are checked by their checkers right away.
+    Verdicts are remembered for every container, so cycles are traversed once, see check_shared().
+    Checks of the containers share their steps with the checkers, only the loops over elements differ.
+    """
+    started = start_check()
+    try:
+        return _traverse(argument, hint, covariant, contravariant)
+    finally:
+        if started:
+            finish_check()
+
+
+def _traverse(argument, hint, covariant, contravariant):
+    started = _start(argument, hint, covariant, contravariant, get_collector())
+    if type(started) is not tuple:
+        return started
+
+    stack = [started]
+    result = None
+    while stack:
+        traversal, collector, node_key = stack[-1]
+        try:
+            value, value_hint, covariant, contravariant = traversal.send(result)
+        except StopIteration as stop:
+            stack.pop()
+            result = stop.value
+            if node_key is not None:
+                set_node_verdict(node_key, None, None, result)
+            continue
+
+        result = _start(value, value_hint, covariant, contravariant, collector)
+        if type(result) is tuple:
+            stack.append(result)
+            result = None
+    return result
+
+
+def _start(argument, hint, covariant, contravariant, collector):
+    """Returns the match result, or (traversal, collector for the nested checks, key of its verdict)."""
+    checked_hint = _type_check(hint, '`hint` argument is not an instance of `type`.')
+    try:
+        checked_hint = evaluate_forward_reference(checked_hint)
+    except NameError:
+        return _check_directly(argument, hint, covariant, contravariant, collector)
+
+    if not isinstance(checked_hint, TypingMeta):
+        return _check_directly(argument, hint, covariant, contravariant, collector)
+
+    try:
+        check_func = _get_check_func(checked_hint)
+    except KeyError:
+        return _check_directly(argument, hint, covariant, contravariant, collector)
+
+    if isinstance(check_func, _CheckDerivedGeneric):
+        if not _is_instance_of_generic(argument, _gorg(checked_hint)):
+            return bad_match(argument, checked_hint)
+        check_func, checked_hint = check_func.base_check_func, check_func._get_base_hint(checked_hint)
+
+    traverse = _get_traverser(check_func)
+    if traverse is None:
+        return _check_directly(argument, hint, covariant, contravariant, collector)
+    if traverse in _uncollected_traversers:
+        collector = None
+
+    node_key = None
+    if traverse in _shared_traversers:
+        # same as check_shared() in the checkers
+        node_key = get_node_key(argument, checked_hint)
+        if node_key is not None:
+            verdict = get_node_verdict(node_key)
+            if verdict is not None:
+                return verdict
+            set_node_verdict(node_key, argument, checked_hint, True)
+    return traverse(check_func, argument, checked_hint, collector), collector, node_key
+
+
+def _check_directly(argument, hint, covariant, contravariant, collector):
+    if collector is None and get_collector() is not None:
+        return run_uncollected(_check_type_func, argument, hint, covariant, contravariant)
+    return _check_type_func(argument, hint, covariant=covariant, contravariant=contravariant)
+
+
+def _traverse_union(checker, argument, hint, collector):
+    index = get_members_index(hint, hint.__union_set_params__)
+    positions = index.get_positions(argument)
+    if positions is None:
+        return good_match()
+
+    for i in positions:
+        if (yield argument, index.members[i], True, False): # match
+            return good_match()
+
+    return bad_match(argument, hint)
+
+
+def _traverse_typevar(checker, argument, hint, collector):
+    if hint.__bound__ is not None:
+        if not (yield argument, hint.__bound__, hint.__covariant__, hint.__contravariant__):
+            return bad_match(argument, hint, "Type {0} doesn't satisfy TypeVar's bound {1}",
+                             type(argument), hint)
+        return good_match()
+
+    if len(hint.__constraints__) != 0:
+        index = get_members_index(hint, hint.__constraints__,
+                                  covariant=hint.__covariant__, contravariant=hint.__contravariant__)
+        positions = index.get_positions(argument)
+        if positions is None:
+            return good_match()
+
+        for i in positions:
+            if (yield argument, index.members[i], hint.__covariant__, hint.__contravariant__):
+                return good_match()
+
+        return bad_match(argument, hint, "Doesn't satisfy TypeVar's constraints {0}.",
+                         hint.__constraints__)
+
+    return good_match()
+
+
+def _traverse_tuple(checker, argument, hint, collector):
+    if type(argument) != tuple:
+        return bad_match(argument, hint)
+
+    params = hint.__tuple_params__
+    if params is None or len(params) == 0:
+        return good_match()
+
+    if hint.__tuple_use_ellipsis__:
+        elem_hint = params[0]
+        return (yield from _traverse_elements(checker, argument, elem_hint, True, False,
+                                              get_type_predicate(elem_hint), collector))
+
+    if len(argument) != len(params):
+        return bad_match(argument, hint, 'Wrong number of elements in tuple.')
+
+    errors = []
+    for i, (elem, elem_hint) in enumerate(zip(argument, params)):
+        if collector is not None and collector.is_exhausted():
+            collector.truncated = True
+            break
+
+        result = yield elem, elem_hint, True, False
+        if not result:
+            mismatch = checker._position_mismatch(result, i, argument, hint)
+            if collector is None:
+                return mismatch
+            add_mismatch(errors, collector, mismatch)
+    return get_collected_verdict(errors)
+
+
+def _traverse_iterable(checker, argument, hint, collector):
+    if not checker._is_consistent_with_abc(argument, hint):
+        return bad_match(argument, hint)
+
+    if checker._is_unannotated(hint):
+        return good_match()
+
+    (elem_hint, covariant, contravariant), = checker._get_parameters_variance(hint)
+    elem_type_predicate, = checker._get_type_predicates(hint)
+    return (yield from _traverse_elements(checker, argument, elem_hint, covariant, contravariant,
+                                          elem_type_predicate, collector))
+
+
+def _traverse_elements(checker, iterable_, elem_hint, covariant, contravariant, elem_type_predicate,
+                       collector):
+    verdict = checker._check_buffer(iterable_, elem_hint, elem_type_predicate)
+    if verdict is not None:
+        return verdict
+
+    iterable_, start = checker._get_elements(iterable_)
+    if checker._are_elements_consistent(iterable_, elem_type_predicate):
+        return good_match()
+
+    errors = []
+    for i, elem in enumerate(iterable_):
+        if collector is not None and collector.is_exhausted():
+            collector.truncated = True
+            break
+
+        result = yield elem, elem_hint, covariant, contravariant
+        if not result:
+            mismatch = checker._element_mismatch(result, i, elem, elem_hint, start)
+            if collector is None:
+                return mismatch
+            add_mismatch(errors, collector, mismatch)
+    return get_collected_verdict(errors)
+
+
+def _traverse_mapping(checker, argument, hint, collector):
+    if not checker._is_consistent_with_abc(argument, hint):
+        return bad_match(argument, hint)
+
+    if checker._is_unannotated(hint):
+        return good_match()
+
+    (k_type, k_covariant, k_contravariant), (v_type, v_covariant, v_contravariant) = \
+        checker._get_parameters_variance(hint)
+    key_type_predicate, value_type_predicate = checker._get_type_predicates(hint)
+
+    items, keys, values = checker._get_items(argument)
+    keys_checked, values_checked = checker._are_items_consistent(items, keys, values,
+                                                                 key_type_predicate, value_type_predicate)
+    if keys_checked and values_checked:
+        return good_match()
+
+    errors = []
+    for k, v in items:
+        if collector is not None and collector.is_exhausted():
+            collector.truncated = True
+            break
+
+        if not keys_checked:
+            result = yield k, k_type, k_covariant, k_contravariant
+            if not result:
+                mismatch = checker._key_mismatch(result, k, k_type)
+                if collector is None:
+                    return mismatch
+                add_mismatch(errors, collector, mismatch)
+        if not values_checked:
+            result = yield v, v_type, v_covariant, v_contravariant
+            if not result:
+                mismatch = checker._value_mismatch(result, k, v, v_type)
+                if collector is None:
+                    return mismatch
+                add_mismatch(errors, collector, mismatch)
+    return get_collected_verdict(errors)
+
+
+# mismatches of the nested checks aren't collected, as in the checkers
+_uncollected_traversers = (_traverse_union, _traverse_typevar)
+
+# verdicts are remembered for the containers, see check_shared()
+_shared_traversers = (_traverse_iterable, _traverse_mapping)
+
+# class of checker -> traversal, or None if it's checked right away
+_traversers = {}
+
+
+def _get_traverser(check_func):
+    checker_class = check_func.__class__
+    try:
+        return _traversers[checker_class]
+    except KeyError:
+        pass
+
+    for base, traverse in ((CheckUnion, _traverse_union), (CheckTypeVar, _traverse_typevar),
+                           (CheckTuple, _traverse_tuple), (CheckIterable, _traverse_iterable),
+                           (CheckMapping, _traverse_mapping)):
+        if isinstance(check_func, base):
+            break
+    else:
+        traverse = None
+    _traversers[checker_class] = traverse
+    return traverse
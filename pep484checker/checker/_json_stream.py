@@ -0,0 +1,544 @@
+# -*- coding: utf-8 -*-
+import codecs
+import re
+from functools import partial
+from json.decoder import scanstring
+from json.scanner import NUMBER_RE
+
+from typing import AnyMeta, GenericMeta, TupleMeta, TypeVar, TypingMeta, UnionMeta, _type_check
+
+from ._checkers import CheckIterable, CheckMapping, _get_check_func
+from ._helpers import evaluate_forward_reference
+from ._result_funcs import good_match, bad_match, IsValidType
+
+
+JSON_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_LITERALS = (('true', True), ('false', False), ('null', None),
+             ('NaN', float('nan')), ('Infinity', float('inf')), ('-Infinity', float('-inf')))
+# numbers and literals shorter than this are never split between reads
+_SCALAR_LOOKAHEAD = 32
+
+# kinds of tokens, besides the punctuation
+STRING = 'string'
+SCALAR = 'scalar'
+
+
+class JSONReader(object):
+    """Tokens of the JSON document read from `stream` by `chunk_size` characters or bytes.
+
+    Only the unconsumed part of the last chunk is kept, and the token being read,
+    so memory doesn't depend on the size of the document, but on the longest string in it.
+    """
+    def __init__(self, stream, chunk_size=JSON_CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.offset = 0 # position of the buffer in the document
+        self.eof = False
+        self._decoder = None
+        self._scanned = 0 # position in the document, up to which the string being read has no end
+
+    def fill(self, size=None):
+        """Reads next chunk, of `size` if given, returns False at the end of the stream."""
+        size = size or self.chunk_size
+        data = self.stream.read(size)
+        if isinstance(data, bytes):
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder('utf-8-sig')()
+            text = self._decoder.decode(data, final=not data)
+            while data and not text:
+                # the chunk ended within a character
+                data = self.stream.read(size)
+                text = self._decoder.decode(data, final=not data)
+            data = text
+
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        if not data:
+            self.eof = True
+        return bool(data)
+
+    def error(self, message, pos=None):
+        return ValueError('{0} at offset {1} of JSON document'
+                          .format(message, self.offset + (self.pos if pos is None else pos)))
+
+    def next_token(self):
+        """Returns (kind, value) of the next token, kind is one of '{}[]:,', STRING or SCALAR,
+        or None at the end of the document."""
+        while True:
+            buffer, pos = self.buffer, self.pos
+            if pos < len(buffer) and buffer[pos] in ' \t\n\r':
+                pos = self.pos = _WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer):
+                if self.eof or not self.fill():
+                    return None, None
+                continue
+
+            char = buffer[pos]
+            if char in '{}[]:,':
+                self.pos = pos + 1
+                return char, None
+
+            if char == '"':
+                if not self._has_string_end(buffer, pos + 1) and not self.eof:
+                    # string continues in the next chunks, which get longer,
+                    # so that the part read so far is copied only a few times
+                    self.fill(max(self.chunk_size, len(buffer) - pos))
+                    continue
+                try:
+                    value, end = scanstring(buffer, pos + 1)
+                except ValueError as e:
+                    raise self.error(e.msg, e.pos)
+                self.pos = end
+                return STRING, value
+
+            if len(buffer) - pos < _SCALAR_LOOKAHEAD and not self.eof:
+                self.fill()
+                continue
+
+            if char in 'tfnNI-':
+                for literal, value in _LITERALS:
+                    if buffer.startswith(literal, pos):
+                        self.pos = pos + len(literal)
+                        return SCALAR, value
+
+            match = NUMBER_RE.match(buffer, pos)
+            if match is None:
+                raise self.error('Expecting value')
+            end = match.end()
+            if end == len(buffer) and not self.eof:
+                self.fill()
+                continue
+
+            self.pos = end
+            integer, fraction, exponent = match.groups()
+            if fraction or exponent:
+                return SCALAR, float(integer + (fraction or '') + (exponent or ''))
+            return SCALAR, int(integer)
+
+    def _has_string_end(self, buffer, start):
+        # whether the buffer has the closing quote of the string starting at `start`,
+        # the part searched before isn't searched again
+        i = max(start, self._scanned - self.offset)
+        while True:
+            i = buffer.find('"', i)
+            if i == -1:
+                self._scanned = self.offset + len(buffer)
+                return False
+            escapes = i
+            while escapes > start and buffer[escapes - 1] == '\\':
+                escapes -= 1
+            if (i - escapes) % 2 == 0:
+                return True
+            i += 1
+
+
+# events of the document
+START_MAP = 'start_map'
+END_MAP = 'end_map'
+START_ARRAY = 'start_array'
+END_ARRAY = 'end_array'
+KEY = 'key'
+VALUE = 'value'
+
+# what the parser expects next
+_VALUE, _ELEMENT_OR_END, _KEY, _KEY_OR_END, _COLON, _COMMA_OR_END, _DONE = range(7)
+
+
+def iterate_events(reader):
+    """Yields (event, value) of the document, values are given for KEY and VALUE events only."""
+    stack = [] # '}' and ']' closing the containers being parsed
+    state = _VALUE
+    while True:
+        kind, value = reader.next_token()
+        if kind is None and state != _DONE:
+            raise reader.error('Unexpected end of data')
+
+        if state == _VALUE or state == _ELEMENT_OR_END:
+            if kind == '{':
+                stack.append('}')
+                yield START_MAP, None
+                state = _KEY_OR_END
+                continue
+            if kind == '[':
+                stack.append(']')
+                yield START_ARRAY, None
+                state = _ELEMENT_OR_END
+                continue
+
+            if kind == STRING or kind == SCALAR:
+                yield VALUE, value
+            elif kind == ']' and state == _ELEMENT_OR_END:
+                stack.pop()
+                yield END_ARRAY, None
+            else:
+                raise reader.error('Expecting value')
+
+        elif state == _KEY or state == _KEY_OR_END:
+            if kind == STRING:
+                yield KEY, value
+                state = _COLON
+                continue
+            if kind == '}' and state == _KEY_OR_END:
+                stack.pop()
+                yield END_MAP, None
+            else:
+                raise reader.error('Expecting property name enclosed in double quotes')
+
+        elif state == _COLON:
+            if kind != ':':
+                raise reader.error("Expecting ':' delimiter")
+            state = _VALUE
+            continue
+
+        elif state == _COMMA_OR_END:
+            if kind == ',':
+                state = _KEY if stack[-1] == '}' else _VALUE
+                continue
+            if kind != stack[-1]:
+                raise reader.error("Expecting ',' delimiter")
+            stack.pop()
+            yield (END_MAP if kind == '}' else END_ARRAY), None
+
+        else:
+            if kind is not None:
+                raise reader.error('Extra data')
+            return
+
+        # a value has ended
+        state = _COMMA_OR_END if stack else _DONE
+
+
+# hints of values, which are consistent whatever they are, and the ones
+# which are parsed whole and checked by their checkers
+_SKIP = object()
+_BUILD = object()
+
+
+class _Frame(object):
+    """Container being parsed, `key` is the key or position of its current value.
+
+    Containers, which have to be reported whole, e.g. elements of tuples, keep their values
+    in `value`, as a list or dict.
+    """
+    key = None
+    value = None
+
+    def get_child(self):
+        """Returns (hint, check) of the next value."""
+        return _SKIP, None
+
+    def add(self, value):
+        if isinstance(self.value, list):
+            self.value.append(value)
+        else:
+            self.value[self.key] = value
+
+    def get_value(self):
+        """Value of the container, as it's checked."""
+        return self.value
+
+    def finish(self):
+        return good_match()
+
+    def mismatch(self, result, value):
+        """Mismatch of the current value of the container, as reported by its checker."""
+        return result
+
+
+class _RootFrame(_Frame):
+    def __init__(self, hint, check):
+        self.child = hint, check
+
+    def get_child(self):
+        return self.child
+
+
+class _SequenceFrame(_Frame):
+    def __init__(self, checker, elem_hint, check_elem):
+        self.checker = checker
+        self.key = -1
+        self.child = elem_hint, check_elem
+
+    def get_child(self):
+        self.key += 1
+        return self.child
+
+    def mismatch(self, result, value):
+        return self.checker._element_mismatch(result, self.key, value, self.child[0])
+
+
+class _TupleFrame(_Frame):
+    """JSON array checked as a tuple of fixed size, its values are kept for its mismatches."""
+    def __init__(self, checker, hint, checks):
+        self.checker = checker
+        self.hint = hint
+        self.children = list(zip(hint.__tuple_params__, checks))
+        self.key = -1
+        self.value = []
+
+    def get_child(self):
+        self.key += 1
+        if self.key >= len(self.children):
+            # extra values, the tuple is reported whole at its end
+            return _BUILD, None
+        return self.children[self.key]
+
+    def get_value(self):
+        return tuple(self.value)
+
+    def finish(self):
+        if len(self.value) != len(self.children):
+            return bad_match(self.get_value(), self.hint, 'Wrong number of elements in tuple.')
+        return good_match()
+
+    def mismatch(self, result, value):
+        return self.checker._position_mismatch(result, self.key, self.get_value(), self.hint)
+
+
+class _MappingFrame(_Frame):
+    def __init__(self, checker, k_type, check_key, v_type, check_value):
+        self.checker = checker
+        self.k_type = k_type
+        self.check_key = check_key
+        self.child = v_type, check_value
+
+    def set_key(self, k):
+        """Returns the mismatch of the key, if it's inconsistent with the hint."""
+        self.key = k
+        result = self.check_key(k)
+        if not result:
+            return self.checker._key_mismatch(result, k, self.k_type)
+        return None
+
+    def get_child(self):
+        return self.child
+
+    def mismatch(self, result, value):
+        return self.checker._value_mismatch(result, self.key, value, self.child[0])
+
+
+class _KeysFrame(_Frame):
+    """JSON object checked as an iterable, which is of its keys, its values are skipped."""
+    def __init__(self, checker, elem_hint, check_elem):
+        self.checker = checker
+        self.elem_hint = elem_hint
+        self.check_elem = check_elem
+        self.position = -1
+
+    def set_key(self, k):
+        self.key = k
+        self.position += 1
+        result = self.check_elem(k)
+        if not result:
+            return self.checker._element_mismatch(result, self.position, k, self.elem_hint)
+        return None
+
+
+class _BuildFrame(_Frame):
+    """Container, which is parsed whole, and checked at its end, if `check` is given."""
+    def __init__(self, kind, check=None):
+        self.value = kind()
+        self.check = check
+
+    def get_child(self):
+        return _BUILD, None
+
+    def finish(self):
+        if self.check is None:
+            return good_match()
+        return self.check(self.value)
+
+
+def validate_json_stream(stream, hint, chunk_size=JSON_CHUNK_SIZE):
+    """Verdict of the JSON document read from `stream` against the hint, see validate_json()."""
+    from .func import compile_checker
+
+    plans = {} # (id of the hint, dict or list) -> plan of the container, see _plan_container()
+    # mismatch of the root union, reported for any mismatch within the root, see _plan_root()
+    root_mismatch = None
+    frames = [_RootFrame(hint, compile_checker(hint).check)]
+    for event, value in iterate_events(JSONReader(stream, chunk_size)):
+        frame = frames[-1]
+        if event is KEY:
+            if isinstance(frame, (_MappingFrame, _KeysFrame)):
+                mismatch = frame.set_key(value)
+                if mismatch is not None:
+                    return _at_path(mismatch, frames[:-1], root_mismatch)
+            elif frame.value is not None:
+                frame.key = value
+            continue
+
+        if event is END_MAP or event is END_ARRAY:
+            frames.pop()
+            result = frame.finish()
+            if not result:
+                return _at_path(frames[-1].mismatch(result, frame.get_value()), frames[:-1], root_mismatch)
+            if frames[-1].value is not None:
+                frames[-1].add(frame.get_value())
+            continue
+
+        child_hint, check = frame.get_child()
+        if event is VALUE:
+            if child_hint is not _SKIP and child_hint is not _BUILD:
+                result = check(value)
+                if not result:
+                    return _at_path(frame.mismatch(result, value), frames[:-1], root_mismatch)
+            if frame.value is not None:
+                frame.add(value)
+            continue
+
+        kind = dict if event is START_MAP else list
+        if child_hint is _BUILD:
+            frames.append(_BuildFrame(kind))
+            continue
+
+        if child_hint is _SKIP:
+            plan = _SKIP
+        elif len(frames) == 1:
+            plan, root_mismatch = _plan_root(child_hint, kind, check)
+        else:
+            plan_key = id(child_hint), kind
+            plan = plans.get(plan_key)
+            if plan is None:
+                plan = _plan_container(child_hint, kind, check)
+                if isinstance(plan, IsValidType):
+                    # the container is parsed whole, to be reported as its checker reports it
+                    plan = partial(_BuildFrame, kind, check)
+                plans[plan_key] = plan
+
+        if frame.value is None:
+            frames.append(_SKIPPED if plan is _SKIP else plan())
+            continue
+        # values of the container are kept by its parent, so they're kept by it too
+        child = _Frame() if plan is _SKIP else plan()
+        if child.value is None:
+            child.value = kind()
+        frames.append(child)
+
+    return good_match()
+
+
+_SKIPPED = _Frame()
+
+
+def _at_path(result, frames, root_mismatch=None):
+    # errors of the value in the last of `frames`, with paths from the document's root
+    if root_mismatch is not None:
+        return root_mismatch
+    errors = result.errors
+    for frame in reversed(frames[1:]):
+        errors = [error.prefixed(frame.key) for error in errors]
+    return IsValidType(False, errors=errors)
+
+
+def _plan_container(hint, kind, check):
+    """How the JSON object (kind is dict) or array (list) is checked against the hint.
+
+    Returns _SKIP if it's consistent whatever its values are, its mismatch, or a function,
+    which returns the frame to check it with.
+    """
+    from .func import compile_checker
+
+    try:
+        hint = evaluate_forward_reference(_type_check(hint, '`hint` argument is not an instance of `type`.'))
+    except NameError:
+        return partial(_BuildFrame, kind, check)
+
+    if isinstance(hint, AnyMeta):
+        return _SKIP
+
+    if isinstance(hint, TypeVar):
+        if hint.__bound__ is None and not hint.__constraints__:
+            return _SKIP
+        return partial(_BuildFrame, kind, check)
+
+    if not isinstance(hint, TypingMeta):
+        if isinstance(hint, type) and issubclass(kind, hint):
+            return _SKIP
+        return bad_match(kind(), hint)
+
+    if isinstance(hint, UnionMeta):
+        plans = _plan_union_members(hint, kind)
+        if plans is None:
+            return partial(_BuildFrame, kind, check)
+        if not plans:
+            return bad_match(kind(), hint)
+        if _SKIP in plans:
+            return _SKIP
+        # mismatches of unions report the whole value
+        return partial(_BuildFrame, kind, check)
+
+    if isinstance(hint, TupleMeta):
+        if kind is not list:
+            return bad_match(kind(), hint)
+        params = hint.__tuple_params__
+        if params is None or len(params) == 0:
+            return _SKIP
+        checker = _get_check_func(hint)
+        if hint.__tuple_use_ellipsis__:
+            return partial(_SequenceFrame, checker, params[0], compile_checker(params[0]).check)
+        return partial(_TupleFrame, checker, hint, [compile_checker(param).check for param in params])
+
+    try:
+        checker = _get_check_func(hint)
+    except KeyError:
+        return partial(_BuildFrame, kind, check)
+
+    if not isinstance(hint, GenericMeta) or not isinstance(checker, (CheckIterable, CheckMapping)):
+        return partial(_BuildFrame, kind, check)
+    if not issubclass(kind, checker.builtin_type_ or hint.__extra__):
+        return bad_match(kind(), hint)
+    if checker._is_unannotated(hint):
+        return _SKIP
+
+    if isinstance(checker, CheckMapping):
+        (k_type, k_covariant, k_contravariant), (v_type, v_covariant, v_contravariant) = \
+            checker._get_parameters_variance(hint)
+        check_key = compile_checker(k_type, covariant=k_covariant, contravariant=k_contravariant).check
+        check_value = compile_checker(v_type, covariant=v_covariant, contravariant=v_contravariant).check
+        return partial(_MappingFrame, checker, k_type, check_key, v_type, check_value)
+
+    (elem_hint, covariant, contravariant), = checker._get_parameters_variance(hint)
+    check_elem = compile_checker(elem_hint, covariant=covariant, contravariant=contravariant).check
+    if kind is dict:
+        # objects are iterated by their keys
+        return partial(_KeysFrame, checker, elem_hint, check_elem)
+    return partial(_SequenceFrame, checker, elem_hint, check_elem)
+
+
+def _plan_union_members(hint, kind):
+    # plans of the members, which the container may be consistent with, or None if they're unknown
+    from .func import compile_checker
+
+    if hint.__union_params__ is None:
+        return None
+    plans = [_plan_container(member, kind, compile_checker(member).check)
+             for member in hint.__union_params__]
+    return [plan for plan in plans if not isinstance(plan, IsValidType)]
+
+
+def _plan_root(hint, kind, check):
+    """Returns plan of the root container, and the mismatch to report for any mismatch within it, or None.
+
+    Mismatches of the root union report only the class of the value, so the container is checked
+    by the only member it may be consistent with, e.g. List[Row] of Optional[List[Row]], without
+    being parsed whole.
+    """
+    plan = _plan_container(hint, kind, check)
+    if isinstance(plan, IsValidType):
+        return partial(_BuildFrame, kind, check), None
+
+    try:
+        hint = evaluate_forward_reference(_type_check(hint, '`hint` argument is not an instance of `type`.'))
+    except NameError:
+        return plan, None
+    if isinstance(hint, UnionMeta):
+        plans = _plan_union_members(hint, kind)
+        if plans is not None and len(plans) == 1:
+            return plans[0], bad_match(kind(), hint)
+    return plan, None
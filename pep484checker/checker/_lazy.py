@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+from ._result_funcs import bad_match
+
+
+def _raise_mismatch(value, hint, message, *args):
+    raise TypeError(str(bad_match(value, hint, message, *args)))
+
+
+class CheckedIterator(object):
+    """Iterator over `iterator`, every element is checked when it's pulled."""
+    def __init__(self, iterator, elem_hint, check_elem):
+        self.iterator = iterator
+        self.elem_hint = elem_hint
+        self.check_elem = check_elem
+        self.position = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        elem = next(self.iterator)
+        if not self.check_elem(elem):
+            _raise_mismatch(elem, self.elem_hint, 'Element {0} at position {1} of iterator have type {2}. '
+                                                  'Expected {3}', elem, self.position, type(elem), self.elem_hint)
+        self.position += 1
+        return elem
+
+
+class CheckedGenerator(CheckedIterator):
+    """Generator proxy, which checks yielded values, values sent into the generator
+    and its return value, as they appear."""
+    def __init__(self, generator, yield_hint, check_yield, send_hint, check_send,
+                 return_hint, check_return):
+        super().__init__(generator, yield_hint, check_yield)
+        self.send_hint = send_hint
+        self.check_send = check_send
+        self.return_hint = return_hint
+        self.check_return = check_return
+
+    def __next__(self):
+        return self._resume(self.iterator.__next__)
+
+    def send(self, value):
+        if not self.check_send(value):
+            _raise_mismatch(value, self.send_hint, 'Value {0} sent to generator have type {1}. Expected {2}',
+                            value, type(value), self.send_hint)
+        return self._resume(self.iterator.send, value)
+
+    def throw(self, *args):
+        return self._resume(self.iterator.throw, *args)
+
+    def close(self):
+        self.iterator.close()
+
+    def __getattr__(self, name):
+        # gi_frame, gi_running etc.
+        return getattr(self.iterator, name)
+
+    def _resume(self, method, *args):
+        try:
+            elem = method(*args)
+        except StopIteration as stop:
+            if not self.check_return(stop.value):
+                _raise_mismatch(stop.value, self.return_hint, 'Return value {0} of generator have type {1}. '
+                                                              'Expected {2}',
+                                stop.value, type(stop.value), self.return_hint)
+            raise
+
+        if not self.check_elem(elem):
+            _raise_mismatch(elem, self.elem_hint, 'Element {0} at position {1} of generator have type {2}. '
+                                                  'Expected {3}', elem, self.position, type(elem), self.elem_hint)
+        self.position += 1
+        return elem
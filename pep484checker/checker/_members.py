@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import threading
+from abc import get_cache_token
+
+from typing import GenericMeta, TupleMeta
+
+from ._helpers import get_type_predicate
+
+
+MEMBERS_INDEX_MAXSIZE = 1024 # classes per index, and indexes of hints checked without compilation
+
+
+class MembersIndex(object):
+    """Which members of a union, or constraints of a typevar, instances of a class may be consistent with.
+
+    Members decided by the class alone are looked up once per class. The others, such as generics,
+    are left to be tried in order, except the ones whose class the value isn't an instance of.
+    Lookups are valid until some class is registered with an ABC.
+    """
+    def __init__(self, members, covariant=True, contravariant=False):
+        self.members = tuple(members)
+        self.predicates = []
+        self.tried = [] # (position of the member, class its values have to be instances of, or None)
+        for i, member in enumerate(self.members):
+            predicate = get_type_predicate(member, covariant=covariant, contravariant=contravariant)
+            if predicate is not None:
+                self.predicates.append(predicate)
+            else:
+                self.tried.append((i, _get_required_class(member)))
+        self.all_positions = tuple(range(len(self.members)))
+
+        self._by_class = {} # class -> (consistent, positions of members to try)
+        self._token = get_cache_token()
+
+    def lookup(self, arg_type):
+        """Returns (True, ()) if instances of `arg_type` are consistent with some member,
+        otherwise (False, positions of members they have to be tried with)."""
+        token = get_cache_token()
+        if token != self._token:
+            self._by_class, self._token = {}, token
+
+        entry = self._by_class.get(arg_type)
+        if entry is None:
+            if any(predicate(arg_type) for predicate in self.predicates):
+                entry = (True, ())
+            else:
+                entry = (False, tuple(i for i, required_class in self.tried
+                                      if required_class is None or issubclass(arg_type, required_class)))
+            if len(self._by_class) < MEMBERS_INDEX_MAXSIZE:
+                self._by_class[arg_type] = entry
+        return entry
+
+    def get_positions(self, argument):
+        """Positions of members to try the argument with, None if it's consistent by its class."""
+        arg_type = type(argument)
+        if arg_type is not argument.__class__:
+            # proxies, their both classes matter
+            return self.all_positions
+
+        consistent, positions = self.lookup(arg_type)
+        return None if consistent else positions
+
+
+def _get_required_class(member):
+    from ._checkers import _get_check_func, CheckABCTypeMixin
+
+    if isinstance(member, TupleMeta):
+        return tuple
+    if not isinstance(member, GenericMeta):
+        return None
+
+    try:
+        check_func = _get_check_func(member)
+    except KeyError:
+        return None
+    if isinstance(check_func, CheckABCTypeMixin):
+        return check_func.builtin_type_ or member.__extra__
+    return None
+
+
+# id(hint) -> (hint, its index), hints are kept alive by their entries
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_members_index(hint, members, covariant=True, contravariant=False):
+    """Returns MembersIndex of `members` of the hint, built on its first check."""
+    entry = _indexes.get(id(hint))
+    if entry is not None:
+        return entry[1]
+
+    index = MembersIndex(members, covariant=covariant, contravariant=contravariant)
+    with _indexes_lock:
+        if len(_indexes) >= MEMBERS_INDEX_MAXSIZE:
+            _indexes.clear()
+        _indexes[id(hint)] = (hint, index)
+    return index
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+import threading
+import weakref
+from abc import get_cache_token
+from collections import OrderedDict, namedtuple
+
+from . import _collect
+from ._sampling import get_sampling_policy, FULL
+
+
+VerdictCacheInfo = namedtuple('VerdictCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class VerdictCache(object):
+    """LRU cache of verdicts for (immutable value, plan) pairs.
+
+    Values are keyed by identity. Values which can be weakly referenced (frozensets) are
+    dropped from the cache when they die, others (tuples) are kept alive by the cache until
+    evicted, so their id can't be reused by another object meanwhile.
+    Verdicts are dropped once some class is registered with an ABC, as they may depend on it.
+    """
+    def __init__(self, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError('Cache size has to be positive.')
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._verdicts = OrderedDict() # (id(value), id(plan)) -> (value or weakref to it, plan, verdict)
+        self._lock = threading.Lock()
+        self._dead_keys = []
+        self._token = get_cache_token()
+
+    def get(self, value, plan):
+        key = (id(value), id(plan))
+        with self._lock:
+            self._drop_stale_verdicts()
+            entry = self._verdicts.get(key)
+            if entry is not None and not _holds(entry[0], value):
+                # value died, and its id is taken by another one
+                del self._verdicts[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._verdicts.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, value, plan, verdict):
+        key = (id(value), id(plan))
+        try:
+            held = weakref.ref(value, self._dead_keys_callback(key))
+        except TypeError:
+            held = value
+
+        with self._lock:
+            self._drop_stale_verdicts()
+            while self._dead_keys:
+                dead_key = self._dead_keys.pop()
+                entry = self._verdicts.get(dead_key)
+                if entry is not None and type(entry[0]) is weakref.ref and entry[0]() is None:
+                    del self._verdicts[dead_key]
+
+            self._verdicts[key] = (held, plan, verdict)
+            if len(self._verdicts) > self.maxsize:
+                self._verdicts.popitem(last=False)
+
+    def _drop_stale_verdicts(self):
+        token = get_cache_token()
+        if token != self._token:
+            self._verdicts.clear()
+            self._token = token
+
+    def _dead_keys_callback(self, key):
+        # entries aren't removed right in the callback, it may run in the middle of
+        # another operation on the cache, when garbage is collected
+        dead_keys = self._dead_keys
+
+        def add_dead_key(_):
+            dead_keys.append(key)
+        return add_dead_key
+
+    def clear(self):
+        with self._lock:
+            self._verdicts.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        return VerdictCacheInfo(self.hits, self.misses, self.maxsize, len(self._verdicts))
+
+
+def _holds(held, value):
+    return held is value or type(held) is weakref.ref and held() is value
+
+
+_cache = None
+_memoized_types = (tuple, frozenset) # exact classes, subclasses may be mutable
+
+
+def enable_verdict_cache(maxsize=1024):
+    """Verdicts for tuples and frozensets are cached from now on, see memoize_immutable()."""
+    global _cache
+    _cache = VerdictCache(maxsize)
+
+
+def disable_verdict_cache():
+    global _cache
+    _cache = None
+
+
+def verdict_cache_info():
+    """VerdictCacheInfo(hits, misses, maxsize, currsize), or None if the cache is disabled."""
+    cache = _cache
+    return None if cache is None else cache.info()
+
+
+def memoize_immutable(plan):
+    """Returns `plan`, which uses the verdict cache when it's enabled.
+
+    Only for plans whose verdict depends on the classes of the elements only,
+    which can't change for a tuple or a frozenset.
+    """
+    def check_memoized(argument):
+        cache = _cache
+        # collected verdicts have more errors than the ones of the ordinary checks,
+        # and sampled ones may miss mismatches, which full checks find
+        if (cache is None or argument.__class__ not in _memoized_types or _collect.is_active()
+                or get_sampling_policy().strategy != FULL):
+            return plan(argument)
+
+        verdict = cache.get(argument, plan)
+        if verdict is None:
+            verdict = plan(argument)
+            cache.put(argument, plan, verdict)
+        return verdict
+    return check_memoized
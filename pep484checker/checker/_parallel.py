@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+import ctypes
+import multiprocessing
+import os
+import sys
+import threading
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+
+from typing import TypingMeta, _type_check
+
+from ._batch import find_first_mismatch
+from ._buffers import get_buffer_element_type
+from ._checkers import CheckIterable, CheckMapping, _get_check_func
+from ._helpers import evaluate_forward_reference
+from ._result_funcs import good_match
+from ._sampling import get_sampling_policy, FULL
+
+
+PARALLEL_MIN_SIZE = 100000
+
+PROCESS = 'process'
+THREAD = 'thread'
+
+# elements checked by workers between looks at whether their part is still needed
+_STEP = 1024
+
+
+class ParallelPolicy(object):
+    """Which containers are checked in parts by a pool of workers.
+
+    Sequences and mappings with at least `threshold` elements are split into parts of `chunk_size`
+    elements, checked by `max_workers` processes, or threads on builds without GIL.
+    Smaller containers, and containers nested in the parts, are checked serially by the workers.
+
+    Processes are forked for every check, so that they get the container without pickling it.
+    Forking is safe only from single-threaded callers, as other threads may hold locks the workers
+    need, so while other threads are running, or where processes aren't forked, threads are used.
+    """
+    executors = (PROCESS, THREAD)
+
+    def __init__(self, threshold=PARALLEL_MIN_SIZE, chunk_size=None, max_workers=None, executor=None):
+        if executor is not None and executor not in self.executors:
+            raise ValueError('Unknown executor {0!r}, expected one of {1}'.format(executor, self.executors))
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError('Chunk size has to be positive.')
+
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = executor or _get_default_executor()
+
+    def __repr__(self):
+        return ('ParallelPolicy(threshold={0}, chunk_size={1}, max_workers={2}, executor={3!r})'
+                .format(self.threshold, self.chunk_size, self.max_workers, self.executor))
+
+    def get_chunks(self, length):
+        # a few parts per worker, so that the ones done early take the rest
+        chunk_size = self.chunk_size or max(_STEP, -(-length // (self.max_workers * 4)))
+        return [(start, min(start + chunk_size, length)) for start in range(0, length, chunk_size)]
+
+
+def _get_default_executor():
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    if is_gil_enabled is not None and not is_gil_enabled():
+        return THREAD
+    return PROCESS
+
+
+def _can_fork_workers():
+    if threading.active_count() > 1:
+        return False
+    method = multiprocessing.get_start_method(allow_none=True)
+    if method is None:
+        # default of the platform
+        return sys.platform.startswith('linux') and sys.version_info < (3, 14)
+    return method == 'fork'
+
+
+def check_in_parallel(argument, hint, covariant, contravariant, policy):
+    """Returns the match result of the container checked in parts, or None if it's checked serially.
+
+    Workers only find position of the first mismatched element, its error is produced here,
+    by the same checker and with the same message as in the serial check.
+    """
+    try:
+        hint = evaluate_forward_reference(_type_check(hint, '`hint` argument is not an instance of `type`.'))
+    except NameError:
+        return None
+    if not isinstance(hint, TypingMeta):
+        return None
+
+    try:
+        checker = _get_check_func(hint)
+    except KeyError:
+        return None
+
+    if isinstance(checker, CheckMapping):
+        if not isinstance(argument, Mapping):
+            return None
+    elif isinstance(checker, CheckIterable):
+        if not isinstance(argument, Sequence) or get_buffer_element_type(argument) is not None:
+            return None
+    else:
+        return None
+
+    if not checker._is_consistent_with_abc(argument, hint) or checker._is_unannotated(hint):
+        return None
+
+    length = len(argument)
+    sampling = get_sampling_policy()
+    if length < policy.threshold or sampling.strategy != FULL and length > sampling.threshold:
+        return None
+
+    from .func import _check_nested_type
+
+    params = checker._get_parameters_variance(hint)
+    try:
+        position = _ChunkedCheck(argument, params, checker._get_type_predicates(hint)).run(policy)
+    except _PoolUnavailable:
+        return None
+    if position is None:
+        return good_match()
+
+    if isinstance(checker, CheckMapping):
+        (k_type, k_covariant, k_contravariant), (v_type, v_covariant, v_contravariant) = params
+        k, v = next(islice(argument.items(), position, None))
+        result = _check_nested_type(k, k_type, k_covariant, k_contravariant)
+        if not result:
+            return checker._key_mismatch(result, k, k_type)
+        return checker._value_mismatch(_check_nested_type(v, v_type, v_covariant, v_contravariant),
+                                       k, v, v_type)
+
+    (elem_hint, elem_covariant, elem_contravariant), = params
+    elem = argument[position]
+    return checker._element_mismatch(_check_nested_type(elem, elem_hint, elem_covariant, elem_contravariant),
+                                     position, elem, elem_hint)
+
+
+class _PoolUnavailable(Exception):
+    """Workers couldn't be started or died, the container is checked serially."""
+
+
+class _Bound(object):
+    # position of the first mismatch found so far, written by the main thread only
+    value = sys.maxsize
+
+
+class _ChunkedCheck(object):
+    def __init__(self, container, params, type_predicates):
+        from .func import compile_checker, _get_batch_checks
+
+        self.container = container
+        self.is_mapping = isinstance(container, Mapping)
+        # (check, check of deeply nested values, type predicate) for elements, or keys and values
+        self.checks = []
+        for (param, covariant, contravariant), type_predicate in zip(params, type_predicates):
+            compiled = compile_checker(param, covariant=covariant, contravariant=contravariant)
+            self.checks.append(_get_batch_checks(compiled) + (type_predicate,))
+        self.first = _Bound()
+
+    def run(self, policy):
+        """Position of the first mismatched element, or None."""
+        chunks = policy.get_chunks(len(self.container))
+        if policy.executor == THREAD or not _can_fork_workers():
+            with ThreadPoolExecutor(policy.max_workers) as executor:
+                return self._run_chunks(executor, self.check_chunk, chunks)
+
+        global _forked_check
+        with _forked_check_lock:
+            try:
+                self.first = multiprocessing.RawValue(ctypes.c_longlong, sys.maxsize)
+                executor = ProcessPoolExecutor(policy.max_workers)
+            except (OSError, ImportError, ValueError, TypeError) as e:
+                # e.g. no shared memory or processes on the platform
+                raise _PoolUnavailable() from e
+
+            _forked_check = self
+            try:
+                with executor:
+                    return self._run_chunks(executor, _check_forked_chunk, chunks)
+            except (BrokenProcessPool, OSError) as e:
+                raise _PoolUnavailable() from e
+            finally:
+                _forked_check = None
+
+    def _run_chunks(self, executor, check_chunk, chunks):
+        futures = {executor.submit(check_chunk, start, stop): start for start, stop in chunks}
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            position = future.result()
+            if position is not None and position < self.first.value:
+                self.first.value = position
+                # parts after the mismatch aren't needed anymore
+                for other, start in futures.items():
+                    if start > position:
+                        other.cancel()
+
+        if self.first.value == sys.maxsize:
+            return None
+        return self.first.value
+
+    def check_chunk(self, start, stop):
+        """Position of the first mismatched element of the part, or None."""
+        if self.is_mapping:
+            items = list(islice(self.container.items(), start, stop))
+            columns = [[k for k, _ in items], [v for _, v in items]]
+        elif isinstance(self.container, (list, tuple)):
+            columns = [self.container[start:stop]]
+        else:
+            columns = [[self.container[i] for i in range(start, stop)]]
+
+        for step_start in range(0, stop - start, _STEP):
+            if self.first.value < start:
+                # mismatch was found in some part before this one
+                return None
+
+            step_stop = step_start + _STEP
+            positions = [find_first_mismatch(column[step_start:step_stop], check, check_deep, type_predicate)
+                         for column, (check, check_deep, type_predicate) in zip(columns, self.checks)]
+            positions = [position for position in positions if position is not None]
+            if positions:
+                return start + step_start + min(positions)
+        return None
+
+
+# check being done by the forked workers, they get it, with the container, from the parent's memory
+_forked_check = None
+_forked_check_lock = threading.Lock()
+
+
+def _check_forked_chunk(start, stop):
+    return _forked_check.check_chunk(start, stop)
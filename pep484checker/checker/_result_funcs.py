@@ -1,5 +1,66 @@
 # -*- coding: utf-8 -*-
+import reprlib
+
+
+MAX_ARGUMENT_LENGTH = 80
+
+_repr = reprlib.Repr()
+_repr.maxstring = _repr.maxother = MAX_ARGUMENT_LENGTH
+
+
+class CheckError(object):
+    """Mismatch found by a checker.
+
+    `path` is a tuple of indices and keys leading from the checked value to the mismatched one,
+    `expected` is the hint it's inconsistent with and `actual_type` is its type.
+    The message is rendered only by str(), with arguments shortened to MAX_ARGUMENT_LENGTH.
+    """
+    __slots__ = ('message', 'args', 'expected', 'actual_type', 'path')
+
+    def __init__(self, message, args=(), expected=None, actual_type=None, path=()):
+        self.message = message
+        self.args = args
+        self.expected = expected
+        self.actual_type = actual_type
+        self.path = path
+
+    def prefixed(self, key):
+        """Same error, seen from the container which has the mismatched value at `key`."""
+        return CheckError(self.message, self.args, self.expected, self.actual_type, (key,) + self.path)
+
+    def format_path(self):
+        return ''.join('[?]' if key is _UNKNOWN_KEY else '[{0}]'.format(_repr.repr(key))
+                       for key in self.path)
+
+    def __str__(self):
+        message = self.message.format(*map(_format_argument, self.args))
+        if self.path:
+            return '{0}: {1}'.format(self.format_path(), message)
+        return message
+
+    def __repr__(self):
+        return '<CheckError {0}>'.format(self)
+
+
+# key of the elements, whose position isn't known, e.g. sampled ones
+_UNKNOWN_KEY = object()
+
+
+def _format_argument(argument):
+    if isinstance(argument, (type, IsValidType)):
+        return str(argument)
+
+    text = argument if isinstance(argument, str) else _repr.repr(argument)
+    if len(text) > MAX_ARGUMENT_LENGTH:
+        text = text[:MAX_ARGUMENT_LENGTH - 3] + '...'
+    return text
+
+
 class IsValidType(object):
+    sampled = False
+    truncated = False
+    errors = ()
+
     def __init__(self, val: bool, errors=None):
         self.val = val
         if errors:
@@ -7,15 +68,33 @@ class IsValidType(object):
 
     def __bool__(self):
         return self.val
-    # TODO: add tuple unpacking
+
+    def __str__(self):
+        if not self.errors:
+            return 'Argument is consistent with hint' if self.val else 'Argument is not consistent with hint'
+        # errors are rendered only when needed
+        return str(self.errors[0])
 
 
 def good_match():
     return True
 
 
-def bad_match(argument, hint, message=None):
+def bad_match(argument, hint, message=None, *args, path=()):
     if message is None:
-        message = 'Argument type {0} is not consistent with hint {1}'.format(type(argument), hint)
+        message = 'Argument type {0} is not consistent with hint {1}'
+        args = (type(argument), hint)
+
+    return IsValidType(False, errors=[CheckError(message, args, hint, type(argument), path)])
+
+
+def bad_element_match(result, key, element, hint, message, *args):
+    """Mismatch of the `element` at `key` of a container, found with `result`.
 
-    raise TypeError(message)
+    If the element is a container itself, the innermost mismatches are reported, with their paths
+    prefixed by `key`, otherwise the one described by `message`.
+    """
+    errors = getattr(result, 'errors', None)
+    if errors and errors[0].path:
+        return IsValidType(False, errors=[error.prefixed(key) for error in errors])
+    return bad_match(element, hint, message, *args, path=(key,))
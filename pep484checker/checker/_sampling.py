@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+import random
+import threading
+from collections import deque
+from collections.abc import Sequence
+from contextlib import contextmanager
+from itertools import islice, compress
+
+
+FULL = 'full'
+FIRST = 'first'
+LAST = 'last'
+STRIDED = 'strided'
+RANDOM = 'random'
+
+
+class SamplingPolicy(object):
+    """Which elements of large containers are checked.
+
+    Containers with more than `threshold` elements are checked by `size` elements only,
+    picked according to `strategy`: first or last ones, every n-th one, or random ones
+    (reproducible with `seed`). Sampled elements keep their order in the container.
+
+    Sequences are sampled by index, in time proportional to `size`. Other containers, e.g. sets
+    and mapping views, are sampled by iterating them: the first elements are taken in the same time,
+    the last ones too if the container can be reversed, for other strategies the container is
+    iterated whole, though only the sampled elements are checked.
+    """
+    strategies = (FULL, FIRST, LAST, STRIDED, RANDOM)
+
+    def __init__(self, strategy=FULL, size=1000, threshold=None, seed=None):
+        if strategy not in self.strategies:
+            raise ValueError('Unknown sampling strategy {0!r}, expected one of {1}'
+                             .format(strategy, self.strategies))
+        if size < 1:
+            raise ValueError('Sample size has to be positive.')
+
+        self.strategy = strategy
+        self.size = size
+        self.threshold = size if threshold is None else threshold
+        self.seed = seed
+        self._random = random.Random(seed)
+
+    def __repr__(self):
+        return ('SamplingPolicy(strategy={0!r}, size={1}, threshold={2}, seed={3!r})'
+                .format(self.strategy, self.size, self.threshold, self.seed))
+
+    def sample(self, container, length):
+        k = min(self.size, length)
+        is_sequence = isinstance(container, Sequence)
+
+        if self.strategy == FIRST:
+            return list(islice(container, k))
+
+        elif self.strategy == LAST:
+            if is_sequence:
+                return [container[i] for i in range(length - k, length)]
+            try:
+                last = list(islice(reversed(container), k))
+            except TypeError:
+                return list(deque(container, maxlen=k))
+            last.reverse()
+            return last
+
+        elif self.strategy == STRIDED:
+            step = -(-length // k) # ceil
+            if is_sequence:
+                return [container[i] for i in range(0, length, step)]
+            return list(islice(container, 0, None, step))
+
+        elif self.strategy == RANDOM:
+            indices = sorted(self._random.sample(range(length), k))
+            if is_sequence:
+                return [container[i] for i in indices]
+
+            mask = bytearray(length)
+            for i in indices:
+                mask[i] = 1
+            return list(compress(container, mask))
+
+        return list(container)
+
+
+_default_policy = SamplingPolicy(FULL)
+
+
+class _SamplingState(threading.local):
+    policy = None # overrides default policy within sampling_scope()
+    sampled = False
+
+
+_state = _SamplingState()
+
+
+def set_default_sampling_policy(policy):
+    global _default_policy
+    _default_policy = SamplingPolicy(FULL) if policy is None else policy
+
+
+def get_sampling_policy():
+    return _state.policy or _default_policy
+
+
+@contextmanager
+def sampling_scope(policy=None):
+    """Checks within the scope use `policy`, if given.
+
+    Yields the state, whose `sampled` tells if any container was checked partially.
+    """
+    previous_policy, previous_sampled = _state.policy, _state.sampled
+    if policy is not None:
+        _state.policy = policy
+    _state.sampled = False
+    try:
+        yield _state
+    finally:
+        _state.policy, _state.sampled = previous_policy, previous_sampled
+
+
+def sample_elements(container):
+    """Returns list of elements to check, or None if whole container has to be checked."""
+    policy = _state.policy or _default_policy
+    if policy.strategy == FULL:
+        return None
+
+    try:
+        length = len(container)
+    except TypeError:
+        # iterators, and everything else which can't be sampled without consuming it
+        return None
+
+    if length <= policy.threshold:
+        return None
+
+    _state.sampled = True
+    return policy.sample(container, length)
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+import threading
+
+from . import _collect
+from ._collect import get_collector
+
+
+# containers with fewer elements are checked whenever they are reached
+SHARED_NODE_MIN_SIZE = 16
+
+# containers nested deeper within a check are checked by the iterative engine, see check_iteratively(),
+# the stack below them is left for checks which recurse themselves, e.g. of pure Python ABCs before 3.7
+ITERATIVE_DEPTH = 30
+
+
+class _Check(object):
+    """Verdicts for containers within a check."""
+    __slots__ = ('verdicts', 'kept', 'depth')
+
+    def __init__(self):
+        # key of node -> verdict
+        self.verdicts = {}
+        # nodes and hints of the verdicts are kept alive until the check ends,
+        # so their ids can't be taken by other objects meanwhile
+        self.kept = []
+        # containers being checked recursively
+        self.depth = 0
+
+
+class _SharedNodesState(threading.local):
+    check = None
+
+
+_state = _SharedNodesState()
+
+
+def start_check():
+    """Starts remembering verdicts for containers within the check.
+
+    Returns False if it's nested in another check, whose verdicts are used instead.
+    """
+    if _state.check is not None:
+        return False
+    _state.check = _Check()
+    return True
+
+
+def finish_check():
+    _state.check = None
+
+
+def restart_check():
+    # containers are checked again from the start, verdicts of aborted checks can't be trusted
+    if _state.check is not None:
+        _state.check = _Check()
+
+
+def get_node_key(node, hint):
+    """Returns key of the verdict for the container `node`, or None outside of checks."""
+    if _state.check is None:
+        return None
+    if _collect.is_active():
+        # collected verdicts have more errors
+        return id(node), id(hint), get_collector() is not None
+    return id(node), id(hint)
+
+
+def get_node_verdict(key):
+    return _state.check.verdicts.get(key)
+
+
+def set_node_verdict(key, node, hint, verdict):
+    current = _state.check
+    if key not in current.verdicts:
+        current.kept.append((node, hint))
+    current.verdicts[key] = verdict
+
+
+def check_shared(node, hint, check, *args):
+    """Returns check(*args), which checks container `node` against `hint`, once per check.
+
+    Containers referenced from many places are checked at the first one, and containers which are
+    being checked already (reached through a cycle) are consistent, until they are found not to be.
+    Containers smaller than SHARED_NODE_MIN_SIZE are cheaper to check again, their verdicts are
+    forgotten once they are checked, so they are only recognized when reached through cycles.
+
+    Containers nested in ITERATIVE_DEPTH others are checked by the iterative engine instead,
+    so that deep values don't exhaust the stack, and aren't checked again from the start.
+    """
+    current = _state.check
+    if current is None:
+        return check(*args)
+
+    if current.depth >= ITERATIVE_DEPTH:
+        from ._iterative import check_iteratively
+        return check_iteratively(node, hint)
+
+    try:
+        small = len(node) < SHARED_NODE_MIN_SIZE
+    except TypeError:
+        # iterators etc., which can't be traversed twice anyway
+        return check(*args)
+
+    if _collect.is_active():
+        key = id(node), id(hint), get_collector() is not None
+    else:
+        key = id(node), id(hint)
+    verdicts = current.verdicts
+    verdict = verdicts.get(key)
+    if verdict is not None:
+        return verdict
+
+    verdicts[key] = True
+    # not restored if the check raises, the check is restarted or finished then
+    current.depth += 1
+    verdict = check(*args)
+    current.depth -= 1
+    if small:
+        del verdicts[key]
+    else:
+        verdicts[key] = verdict
+        current.kept.append((node, hint))
+    return verdict
+
+
+async def check_shared_async(current, node, hint, check, *args):
+    """Same as check_shared(), within the async check whose verdicts are in `current`, as async checks
+    of the thread run interleaved, so they can't share the one of the thread; check(*args) is awaited.
+
+    Containers nested deeper are checked by the iterative engine, without giving control back
+    to the event loop.
+    """
+    if current.depth >= ITERATIVE_DEPTH:
+        from ._iterative import check_iteratively
+        return check_iteratively(node, hint)
+
+    try:
+        small = len(node) < SHARED_NODE_MIN_SIZE
+    except TypeError:
+        return await check(*args)
+
+    key = id(node), id(hint)
+    verdicts = current.verdicts
+    verdict = verdicts.get(key)
+    if verdict is not None:
+        return verdict
+
+    verdicts[key] = True
+    current.depth += 1
+    verdict = await check(*args)
+    current.depth -= 1
+    if small:
+        del verdicts[key]
+    else:
+        verdicts[key] = verdict
+        current.kept.append((node, hint))
+    return verdict
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+import inspect
+from functools import partial, wraps
+
+from ._forward_refs import resolve_forward_reference
+from .func import compile_checker, compile_lazy_checker
+
+
+_POSITIONAL_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+
+def _resolve_annotation(annotation, globalns):
+    if isinstance(annotation, str):
+        annotation = resolve_forward_reference(annotation, globalns)
+    return annotation
+
+
+class _ArgumentsChecks(object):
+    """Where to find every annotated argument in (args, kwargs) of a call, and its check."""
+    def __init__(self, func, signature, lazy=False):
+        globalns = getattr(func, '__globals__', {})
+
+        def compile_annotation(annotation):
+            annotation = _resolve_annotation(annotation, globalns)
+            if lazy:
+                # checks return (result, value to pass on)
+                return compile_lazy_checker(annotation)
+            return compile_checker(annotation).run
+
+        self.positional = [] # (index, name, check)
+        self.keyword = [] # (name, check)
+        self.var_positional = None
+        self.var_keyword = None
+        self.names = set()
+        self.positional_count = 0
+        self.returns = None
+
+        for param in signature.parameters.values():
+            annotated = param.annotation is not param.empty
+            if param.kind in _POSITIONAL_KINDS:
+                if annotated:
+                    self.positional.append((self.positional_count, param.name,
+                                            compile_annotation(param.annotation)))
+                self.positional_count += 1
+                self.names.add(param.name)
+
+            elif param.kind == param.KEYWORD_ONLY:
+                if annotated:
+                    self.keyword.append((param.name, compile_annotation(param.annotation)))
+                self.names.add(param.name)
+
+            elif param.kind == param.VAR_POSITIONAL and annotated:
+                self.var_positional = compile_annotation(param.annotation)
+
+            elif param.kind == param.VAR_KEYWORD and annotated:
+                self.var_keyword = compile_annotation(param.annotation)
+
+        if signature.return_annotation is not signature.empty:
+            self.returns = compile_annotation(signature.return_annotation)
+
+
+def _argument_error(func, name, result):
+    return TypeError('Argument `{0}` of {1}(): {2}'.format(name, func.__qualname__, result))
+
+
+def _check_arguments(func, checks, lazy, args, kwargs):
+    # returns args and kwargs to call `func` with, lazily checked values are replaced by their proxies
+    if lazy:
+        args = list(args)
+
+    args_count = len(args)
+    for index, name, check in checks.positional:
+        if index < args_count:
+            value = args[index]
+        elif name in kwargs:
+            value = kwargs[name]
+        else: # default value
+            continue
+
+        result = check(value)
+        if lazy:
+            result, value = result
+            if index < args_count:
+                args[index] = value
+            else:
+                kwargs[name] = value
+        if not result:
+            raise _argument_error(func, name, result)
+
+    for name, check in checks.keyword:
+        if name in kwargs:
+            result = check(kwargs[name])
+            if lazy:
+                result, kwargs[name] = result
+            if not result:
+                raise _argument_error(func, name, result)
+
+    if checks.var_positional is not None:
+        for i in range(checks.positional_count, args_count):
+            result = checks.var_positional(args[i])
+            if lazy:
+                result, args[i] = result
+            if not result:
+                raise _argument_error(func, '*args[{0}]'.format(i - checks.positional_count), result)
+
+    if checks.var_keyword is not None:
+        for name, value in kwargs.items():
+            if name not in checks.names:
+                result = checks.var_keyword(value)
+                if lazy:
+                    result, kwargs[name] = result
+                if not result:
+                    raise _argument_error(func, name, result)
+    return args, kwargs
+
+
+def _check_return(func, checks, lazy, return_value):
+    if checks.returns is not None:
+        result = checks.returns(return_value)
+        if lazy:
+            result, return_value = result
+        if not result:
+            raise TypeError('Return value of {0}(): {1}'.format(func.__qualname__, result))
+    return return_value
+
+
+def typechecked(func=None, *, lazy=False):
+    """Checks arguments and return value of every call of `func` against its annotations.
+
+    Signature is read once, annotations are compiled into checkers on the first call,
+    so forward references only have to be resolvable by then.
+    Works on functions, methods, classmethods and staticmethods. Return values of coroutine
+    functions are checked when the coroutine returns them.
+
+    With @typechecked(lazy=True) iterators and generators are passed on wrapped into
+    proxies, which check their elements as they are pulled, see check_lazily().
+    """
+    if func is None:
+        return partial(typechecked, lazy=lazy)
+
+    if isinstance(func, (classmethod, staticmethod)):
+        return func.__class__(typechecked(func.__func__, lazy=lazy))
+
+    signature = inspect.signature(func)
+    compiled = []
+
+    def get_checks():
+        if not compiled:
+            compiled.append(_ArgumentsChecks(func, signature, lazy))
+        return compiled[0]
+
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def typechecked_coroutine(*args, **kwargs):
+            checks = get_checks()
+            args, kwargs = _check_arguments(func, checks, lazy, args, kwargs)
+            return _check_return(func, checks, lazy, await func(*args, **kwargs))
+
+        return typechecked_coroutine
+
+    @wraps(func)
+    def typechecked_func(*args, **kwargs):
+        checks = get_checks()
+        args, kwargs = _check_arguments(func, checks, lazy, args, kwargs)
+        return _check_return(func, checks, lazy, func(*args, **kwargs))
+
+    return typechecked_func
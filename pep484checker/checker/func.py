@@ -1,12 +1,262 @@
 # -*- coding: utf-8 -*-
-from typing import TypingMeta, _type_check, TypeVar
+from functools import lru_cache, partial
 
-from pep484checker.checker._helpers import evaluate_forward_reference, is_consistent_types
-from ._checkers import _check_func_registry
-from ._result_funcs import good_match, bad_match
+from typing import GenericMeta, TypingMeta, _ForwardRef, _type_check
 
+from pep484checker.checker._helpers import evaluate_forward_reference, is_consistent_types, get_type_predicate
+from ._checkers import _get_check_func, is_checked_in_parts
+from ._async import Cooperation
+from ._codegen import generate_validator
+from ._result_funcs import good_match, bad_match, IsValidType
+from ._collect import ErrorCollector, collecting_scope, get_collector
+from ._parallel import check_in_parallel, ParallelPolicy
+from ._json_stream import validate_json_stream, JSON_CHUNK_SIZE
+from ._batch import find_first_mismatch, get_verdicts, get_rows, get_column, get_field_verdict
+from ._iterative import check_iteratively
+from ._shared import start_check, finish_check, restart_check, check_shared_async
+from ._sampling import sampling_scope, SamplingPolicy, set_default_sampling_policy
+from ._buffers import register_buffer_type
+from ._memo import enable_verdict_cache, disable_verdict_cache, verdict_cache_info
+from ._forward_refs import resolve_forward_reference
+from . import _instrumentation
+from ._instrumentation import (enable_instrumentation, disable_instrumentation, get_check_stats,
+                               reset_check_stats, get_hot_hints)
 
-def check_type(argument, hint, covariant=True, contravariant=False):
+
+COMPILED_CHECKERS_CACHE_SIZE = 1024
+
+
+def check_type(argument, hint, covariant=True, contravariant=False, sampling=None, parallel=None):
+    if sampling is None:
+        result = _run_check_type(argument, hint, covariant, contravariant, parallel)
+    else:
+        with sampling_scope(sampling):
+            result = _run_check_type(argument, hint, covariant, contravariant, parallel)
+
+    if not result:
+        # error message is formatted only here, when mismatch is confirmed
+        raise TypeError(str(result))
+    return good_match()
+
+
+def is_consistent(argument, hint, covariant=True, contravariant=False, sampling=None,
+                  parallel=None) -> bool:
+    if sampling is None:
+        return bool(_run_check_type(argument, hint, covariant, contravariant, parallel))
+
+    with sampling_scope(sampling):
+        return bool(_run_check_type(argument, hint, covariant, contravariant, parallel))
+
+
+def validate(argument, hint, covariant=True, contravariant=False, sampling=None,
+             parallel=None) -> IsValidType:
+    """Same as is_consistent(), but returns the verdict with the errors,
+    `sampled` attribute of the verdict tells if some container was checked partially.
+
+    With ParallelPolicy as `parallel`, large lists, dicts etc. are checked in parts by a pool of workers,
+    the verdict is the same as of the serial check.
+    """
+    with sampling_scope(sampling) as state:
+        result = _run_check_type(argument, hint, covariant, contravariant, parallel)
+        sampled = state.sampled
+
+    # verdicts may be cached and shared, so the returned one is always a fresh object
+    verdict = IsValidType(bool(result), errors=getattr(result, 'errors', None))
+    verdict.sampled = sampled
+    return verdict
+
+
+def validate_all(argument, hint, covariant=True, contravariant=False, max_errors=100, max_time=None,
+                 sampling=None) -> IsValidType:
+    """Same as validate(), but containers are traversed past their first mismatch, and the verdict
+    has all the errors found, each with the path to the mismatched value.
+
+    Traversal stops after `max_errors` mismatches, or once `max_time` seconds have passed,
+    `truncated` attribute of the verdict tells if it stopped before the end.
+    Mismatches of union members aren't collected, the union itself is reported instead.
+    """
+    collector = ErrorCollector(max_errors, max_time)
+    with sampling_scope(sampling) as state, collecting_scope(collector):
+        result = _run_check_type(argument, hint, covariant, contravariant)
+        sampled = state.sampled
+
+    errors = getattr(result, 'errors', None)
+    verdict = IsValidType(bool(result), errors=errors and errors[:max_errors])
+    verdict.sampled = sampled
+    verdict.truncated = collector.truncated or bool(errors) and len(errors) > max_errors
+    return verdict
+
+
+def check_many(values, hint, covariant=True, contravariant=False, verdicts=False):
+    """Checks every one of `values` against the hint, which is resolved and compiled once.
+
+    Returns position of the first inconsistent value, or None if all of them are consistent.
+    With verdicts=True returns list of verdicts for every value instead, as validate() does.
+    """
+    compiled = compile_checker(hint, covariant=covariant, contravariant=contravariant)
+    check, check_deep = _get_batch_checks(compiled)
+    if verdicts:
+        return get_verdicts(values, check, check_deep)
+    return find_first_mismatch(values, check, check_deep,
+                               _get_batch_type_predicate(compiled, covariant, contravariant))
+
+
+def check_columns(rows, fields, verdicts=False):
+    """Checks `fields` of every one of `rows` against their hints, e.g. {'id': int, 'tags': List[str]}.
+
+    Fields of mappings and positions of tuples are looked up by index, other fields by attribute.
+    Every field is checked for all rows at once, by the plan compiled for its hint.
+    Returns position of the first row with some field missing or inconsistent, or None.
+    With verdicts=True returns list of verdicts for every row instead, with errors of its first
+    mismatched field, which is the first element of their paths.
+    """
+    rows = get_rows(rows)
+    columns = []
+    for field, hint in fields.items():
+        compiled = compile_checker(hint)
+        column, missing = get_column(rows, field)
+        columns.append((field, compiled, column, missing))
+
+    if verdicts:
+        return _get_rows_verdicts(rows, columns)
+
+    first = None
+    for field, compiled, column, missing in columns:
+        if missing and (first is None or missing[0] < first):
+            first = missing[0]
+        if first is not None:
+            # only the rows before the first bad one are left to check
+            column = column[:first]
+
+        check, check_deep = _get_batch_checks(compiled)
+        position = find_first_mismatch(column, check, check_deep, _get_batch_type_predicate(compiled))
+        if position is not None:
+            first = position
+    return first
+
+
+def _get_rows_verdicts(rows, columns):
+    rows_verdicts = [good_match()] * len(rows)
+    for field, compiled, column, missing in columns:
+        check, check_deep = _get_batch_checks(compiled)
+        missing = set(missing)
+        for i, verdict in enumerate(get_verdicts(column, check, check_deep)):
+            if rows_verdicts[i] and (not verdict or i in missing):
+                rows_verdicts[i] = get_field_verdict(rows[i], field, column[i], compiled.hint,
+                                                     verdict, i in missing)
+    return rows_verdicts
+
+
+def _get_batch_checks(compiled):
+    # plan for the values, and the check of values nested deeper than recursion limit allows
+    check = compiled.run if _instrumentation.enabled else compiled.check
+    return check, partial(_check_type_iteratively, hint=compiled.hint)
+
+
+def _get_batch_type_predicate(compiled, covariant=True, contravariant=False):
+    if _instrumentation.enabled:
+        # every value is measured by its check
+        return None
+    if isinstance(compiled.hint, TypingMeta):
+        # same as in compile_checker
+        covariant, contravariant = True, False
+    return get_type_predicate(compiled.hint, covariant=covariant, contravariant=contravariant)
+
+
+def check_json(stream, hint, chunk_size=JSON_CHUNK_SIZE):
+    """Same as check_type(json.load(stream), hint), see validate_json()."""
+    result = validate_json_stream(stream, hint, chunk_size)
+    if not result:
+        raise TypeError(str(result))
+    return good_match()
+
+
+def validate_json(stream, hint, chunk_size=JSON_CHUNK_SIZE) -> IsValidType:
+    """Same as validate(json.load(stream), hint), but the document is checked while it's read
+    from the text or binary (UTF-8) stream, by `chunk_size` parts, in memory which doesn't depend
+    on its size. Checking stops at the first mismatched value, the error has its path in the document.
+
+    JSON arrays are consistent with Tuple hints too, position by position. Containers checked
+    against unions, and the ones inconsistent by themselves, are parsed whole and checked at their end,
+    so that mismatches are reported as validate() reports them, except for the root checked against
+    a union, e.g. Optional[List[Row]], which is checked by the only member it may be consistent with.
+    Malformed documents raise ValueError.
+    """
+    return validate_json_stream(stream, hint, chunk_size)
+
+
+async def check_type_async(argument, hint, covariant=True, contravariant=False, every=1000):
+    """Same as check_type(), but elements of containers are checked in parts of `every` elements,
+    control is given back to the event loop in between. Shared, cyclic and deeply nested containers
+    are checked as by check_type(), containers nested deeper than ITERATIVE_DEPTH without giving control back.
+
+    Containers are checked by the default sampling policy, sampling_scope() can't be used
+    across awaits, as it's shared by all tasks of the thread.
+    To check awaitables and async iterators as their values are produced, use check_lazily().
+    """
+    try:
+        result = await _check_type_async(argument, hint, Cooperation(every),
+                                         covariant=covariant, contravariant=contravariant)
+    except RecursionError:
+        # e.g. deeply nested tuples, see _check_type_iteratively()
+        result = check_iteratively(argument, hint, covariant=covariant, contravariant=contravariant)
+    if not result:
+        raise TypeError(str(result))
+    return good_match()
+
+
+async def _check_type_async(argument, hint, cooperation, covariant=True, contravariant=False):
+    try:
+        resolved_hint = evaluate_forward_reference(hint)
+    except NameError:
+        resolved_hint = hint
+
+    if is_checked_in_parts(resolved_hint):
+        return await check_shared_async(cooperation.check, argument, resolved_hint,
+                                        _get_check_func(resolved_hint).check_async,
+                                        argument, resolved_hint, cooperation)
+
+    result = compile_checker(hint, covariant=covariant, contravariant=contravariant).run(argument)
+    await cooperation.checkpoint(1)
+    return result
+
+
+def _run_check_type(argument, hint, covariant, contravariant, parallel=None):
+    if parallel is not None:
+        result = check_in_parallel(argument, hint, covariant, contravariant, parallel)
+        if result is not None:
+            return result
+
+    if _instrumentation.enabled and not isinstance(hint, TypingMeta):
+        # typing hints are measured by _check_type()
+        return _instrumentation.measure(hint, partial(_check_nested_type, hint=hint, covariant=covariant,
+                                                      contravariant=contravariant), argument)
+    return _check_nested_type(argument, hint, covariant=covariant, contravariant=contravariant)
+
+
+def _check_nested_type(argument, hint, covariant=True, contravariant=False):
+    started = start_check()
+    try:
+        return _check_type(argument, hint, covariant=covariant, contravariant=contravariant)
+    except RecursionError:
+        return _check_type_iteratively(argument, hint, covariant, contravariant)
+    finally:
+        if started:
+            finish_check()
+
+
+def _check_type_iteratively(argument, hint, covariant=True, contravariant=False):
+    # containers nested deeper than ITERATIVE_DEPTH are checked iteratively as they're reached,
+    # see check_shared(), only other values, e.g. deeply nested tuples, or checks started close to
+    # the recursion limit, get here, and are checked again from the start
+    restart_check()
+    collector = get_collector()
+    if collector is not None:
+        collector.restart()
+    return check_iteratively(argument, hint, covariant=covariant, contravariant=contravariant)
+
+
+def _check_type(argument, hint, covariant=True, contravariant=False):
     # covariance/contravariance only makes sense to simple types
     hint = _type_check(hint, '`hint` argument is not an instance of `type`.')
     if hint == type(None):
@@ -18,15 +268,12 @@ def check_type(argument, hint, covariant=True, contravariant=False):
     try:
         hint = evaluate_forward_reference(hint)
     except NameError:
-        return bad_match(argument, hint, "Too early evaluation of {0}"
-                         .format(hint))
+        return bad_match(argument, hint, "Too early evaluation of {0}", hint)
 
     if isinstance(hint, TypingMeta):
-        if hint.__class__ == TypeVar:
-            hint_class = 'TypeVar'
-        else:
-            hint_class = hint.__name__ # ignores square brackers when Generic type
-        _check_func = _check_func_registry[hint_class]
+        _check_func = _get_check_func(hint)
+        if _instrumentation.enabled:
+            return _instrumentation.measure(hint, partial(_check_func, hint=hint), argument)
         return _check_func(argument, hint)
 
         # figure out if covariant/contravariant could be passed
@@ -42,4 +289,185 @@ def check_type(argument, hint, covariant=True, contravariant=False):
                                contravariant=contravariant):
             return good_match()
         else:
-            return bad_match(argument, hint)
\ No newline at end of file
+            return bad_match(argument, hint)
+
+
+class CompiledChecker(object):
+    """checker(argument) behaves like check_type(argument, hint).
+
+    `check` is the plan of the hint, it returns the match result instead of raising.
+    """
+    def __init__(self, hint, check, covariant=True, contravariant=False):
+        self.hint = hint
+        self.check = check
+        self.covariant = covariant
+        self.contravariant = contravariant
+        self._measured_check = None
+
+    def __call__(self, argument):
+        result = self.run(argument)
+        if not result:
+            raise TypeError(str(result))
+        return good_match()
+
+    def is_consistent(self, argument) -> bool:
+        return bool(self.run(argument))
+
+    def run(self, argument):
+        """Same as check(argument), measured when instrumentation is enabled."""
+        if _instrumentation.enabled:
+            return self._check_nested(argument, self.measured_check)
+        return self._check_nested(argument, self.check)
+
+    @property
+    def measured_check(self):
+        """Same as check, but it records statistics for the hint and the typing hints nested in it.
+
+        It's a separate plan, compiled on first use, so that checks don't pay for instrumentation
+        while it's disabled.
+        """
+        if self._measured_check is None:
+            with _instrumentation.compiling_measured():
+                plan = _compile_checker(self.hint, self.covariant, self.contravariant)
+            self._measured_check = _instrumentation.measured(self.hint, plan)
+        return self._measured_check
+
+    def _check_nested(self, argument, check):
+        started = start_check()
+        try:
+            return check(argument)
+        except RecursionError:
+            return _check_type_iteratively(argument, self.hint)
+        finally:
+            if started:
+                finish_check()
+
+
+def compile_checker(hint, covariant=True, contravariant=False):
+    """Returns CompiledChecker for the hint.
+
+    Hint normalization and checker lookup are done once here, for the hint and
+    all of its parameters, so repeated checks only do the per-value work.
+    """
+    hint = _type_check(hint, '`hint` argument is not an instance of `type`.')
+    if isinstance(hint, TypingMeta):
+        # same as in check_type, variance is ignored for generic types
+        covariant, contravariant = True, False
+
+    try:
+        hash(hint)
+    except TypeError:
+        return CompiledChecker(hint, _compile_checker(hint, covariant, contravariant), covariant, contravariant)
+
+    # repr() is part of the key, because TupleMeta.__eq__ ignores ellipsis,
+    # e.g. Tuple[int] == Tuple[int, ...]
+    return _cached_compile_checker(hint, repr(hint), covariant, contravariant)
+
+
+@lru_cache(maxsize=COMPILED_CHECKERS_CACHE_SIZE)
+def _cached_compile_checker(hint, hint_repr, covariant, contravariant):
+    return CompiledChecker(hint, _compile_checker(hint, covariant, contravariant), covariant, contravariant)
+
+
+def _compile_checker(hint, covariant, contravariant):
+    if isinstance(hint, _ForwardRef):
+        return _compile_forward_reference(hint, covariant, contravariant)
+
+    if hint == type(None):
+        def check_none(argument):
+            if argument is not None:
+                return bad_match(argument, hint, 'Argument is not None.')
+            else:
+                return good_match()
+        return check_none
+
+    if isinstance(hint, TypingMeta):
+        return _get_check_func(hint).compile(hint)
+
+    # simple type, same rules as in is_consistent_types
+    def check_simple_type(argument):
+        arg_type = argument.__class__
+        if (arg_type is hint
+                or covariant and issubclass(arg_type, hint)
+                or contravariant and issubclass(hint, arg_type)):
+            return good_match()
+        else:
+            return bad_match(argument, hint)
+    return check_simple_type
+
+
+def _compile_forward_reference(ref, covariant, contravariant):
+    # the reference may be to the hint it's part of, e.g. Tree = Union[int, List['Tree']],
+    # so it's compiled on the first check, when compilation of that hint is done
+    plan = None
+    measured = _instrumentation.is_compiling_measured()
+
+    def check_forward_reference(argument):
+        nonlocal plan
+        if plan is None:
+            try:
+                hint = evaluate_forward_reference(ref)
+            except NameError:
+                # can't be resolved yet, fallback to evaluation on every check
+                return _check_type(argument, ref, covariant=covariant, contravariant=contravariant)
+            compiled = compile_checker(hint, covariant=covariant, contravariant=contravariant)
+            plan = compiled.measured_check if measured else compiled.check
+        return plan(argument)
+    return check_forward_reference
+
+
+def check_lazily(argument, hint, covariant=True, contravariant=False):
+    """Same as check_type(), but returns the argument to use instead of the passed one.
+
+    Iterators (passed for Iterator, Iterable etc. hints) and generators are not consumed here,
+    they are returned wrapped into proxies, which check elements as they are pulled, and for
+    Generator hints also sent and returned values. Later mismatches raise TypeError from the proxy.
+    Every other argument is checked right away and returned as is.
+    """
+    result, argument = compile_lazy_checker(hint, covariant=covariant, contravariant=contravariant)(argument)
+    if not result:
+        raise TypeError(str(result))
+    return argument
+
+
+def compile_lazy_checker(hint, covariant=True, contravariant=False):
+    """Returns plan(argument) -> (result, argument or its checking proxy) used by check_lazily()."""
+    hint = _type_check(hint, '`hint` argument is not an instance of `type`.')
+    if isinstance(hint, GenericMeta):
+        try:
+            hash(hint)
+        except TypeError:
+            return _get_check_func(hint).compile_lazy(hint)
+        return _cached_compile_lazy_checker(hint, repr(hint))
+
+    check = compile_checker(hint, covariant=covariant, contravariant=contravariant).check
+
+    def check_eagerly(argument):
+        return check(argument), argument
+    return check_eagerly
+
+
+@lru_cache(maxsize=COMPILED_CHECKERS_CACHE_SIZE)
+def _cached_compile_lazy_checker(hint, hint_repr):
+    return _get_check_func(hint).compile_lazy(hint)
+
+
+def generate_checker(hint, covariant=True, contravariant=False):
+    """Same as compile_checker(), but the whole check is a single generated function.
+
+    Generated code only answers whether the argument is consistent with the hint,
+    the error is produced by the compiled checker, once mismatch is known.
+    Generated code doesn't track containers it's checking, so cyclic values, and values nested
+    deeper than recursion limit allows, are checked by the compiled checker too.
+    """
+    validate = generate_validator(hint, covariant=covariant, contravariant=contravariant)
+    check = compile_checker(hint, covariant=covariant, contravariant=contravariant)
+
+    def checker(argument):
+        try:
+            if validate(argument):
+                return good_match()
+        except RecursionError:
+            pass
+        return check(argument)
+    return checker
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import unittest
+from typing import AsyncIterable, AsyncIterator, Awaitable, Dict, List, Tuple, Union
+
+from pep484checker.checker.func import check_type, check_type_async, check_lazily
+
+
+class Numbers(object):
+    def __init__(self, *values):
+        self.values = list(values)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.values:
+            raise StopAsyncIteration
+        return self.values.pop(0)
+
+
+class AsyncTestCase(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+
+class TestCheckTypeAsync(AsyncTestCase):
+    def assertSameErrors(self, argument, hint):
+        with self.assertRaises(TypeError) as expected:
+            check_type(argument, hint)
+        with self.assertRaises(TypeError) as raised:
+            self.run_async(check_type_async(argument, hint, every=2))
+        self.assertEqual(str(raised.exception), str(expected.exception))
+
+    def test_same_verdicts_as_check_type(self):
+        self.run_async(check_type_async({'a': [1, 2], 'b': []}, Dict[str, List[int]], every=2))
+        self.run_async(check_type_async([(1, 'a')] * 5, List[Tuple[int, str]], every=2))
+        self.run_async(check_type_async([[1], None], List[Union[List[int], None]], every=2))
+        self.run_async(check_type_async(1, int))
+
+        self.assertSameErrors({'a': [1, 2], 'b': [3, 'c']}, Dict[str, List[int]])
+        self.assertSameErrors([1, 2, 3, 'a'], List[int])
+        self.assertSameErrors({'a': 1, 2: 'b'}, Dict[str, int])
+        self.assertSameErrors(([1], ['a']), Tuple[List[int], List[int]])
+        self.assertSameErrors([[1], 'a'], List[Union[List[int], None]])
+
+    def test_cyclic_and_deep_values(self):
+        Tree = Union[int, List['Tree']]
+        cyclic = [1] * 20
+        cyclic.append(cyclic)
+        self.run_async(check_type_async(cyclic, Tree, every=2))
+        self.assertSameErrors([cyclic, 'a'], Tree)
+
+        deep = 1
+        for _ in range(3000):
+            deep = [deep]
+        self.run_async(check_type_async(deep, Tree, every=2))
+        self.run_async(check_type_async([deep], List[List[Tree]], every=2))
+        self.assertSameErrors([deep, 'a'], Tree)
+
+        deep_tuple = ()
+        for _ in range(3000):
+            deep_tuple = (deep_tuple,)
+        self.run_async(check_type_async(deep_tuple, Tuple[Tuple[Tuple[tuple]]], every=2))
+
+    def test_control_is_given_back_to_event_loop(self):
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def check():
+            task = self.loop.create_task(ticker())
+            await check_type_async({str(i): list(range(100)) for i in range(10)},
+                                   Dict[str, List[int]], every=100)
+            task.cancel()
+
+        self.run_async(check())
+        self.assertGreaterEqual(len(ticks), 10)
+
+
+class TestAsyncProxies(AsyncTestCase):
+    def test_awaitable(self):
+        async def compute(value):
+            return value
+
+        self.assertEqual(self.run_async(check_lazily(compute(1), Awaitable[int])), 1)
+        with self.assertRaisesRegex(TypeError, 'Awaited value a'):
+            self.run_async(check_lazily(compute('a'), Awaitable[int]))
+        with self.assertRaises(TypeError):
+            check_lazily(1, Awaitable[int])
+
+    def test_async_iterators(self):
+        async def collect(async_iterable):
+            collected = []
+            async for value in async_iterable:
+                collected.append(value)
+            return collected
+
+        self.assertEqual(self.run_async(collect(check_lazily(Numbers(1, 2), AsyncIterator[int]))), [1, 2])
+        self.assertEqual(self.run_async(collect(check_lazily(Numbers(1, 2), AsyncIterable[int]))), [1, 2])
+        with self.assertRaisesRegex(TypeError, 'Element a at position 1 of async iterator'):
+            self.run_async(collect(check_lazily(Numbers(1, 'a'), AsyncIterable[int])))
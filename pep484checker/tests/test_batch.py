@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+import sqlite3
+import sys
+import unittest
+from collections import namedtuple
+from typing import Any, Dict, List, Optional, Union
+
+from pep484checker.checker import _batch, _shared
+from pep484checker.checker.func import check_many, check_columns, validate
+
+
+Point = namedtuple('Point', ['x', 'y'])
+
+
+class TestCheckMany(unittest.TestCase):
+    def test_first_bad_value(self):
+        self.assertIsNone(check_many([1, 2, True], int))
+        self.assertEqual(check_many([1, 2, 'a', 'b'], int), 2)
+        self.assertEqual(check_many([[1], [2], ['a']], List[int]), 2)
+        self.assertEqual(check_many([1, None, 'a'], Optional[int]), 2)
+        self.assertIsNone(check_many([], int))
+
+    def test_iterators(self):
+        self.assertEqual(check_many(iter([1, 'a']), int), 1)
+        self.assertIsNone(check_many((i for i in range(10)), int))
+
+    def test_variance(self):
+        self.assertEqual(check_many([True, 'a'], bool, covariant=False, contravariant=True), 1)
+        self.assertIsNone(check_many([1, object()], int, covariant=False, contravariant=True))
+
+    def test_verdicts(self):
+        verdicts = check_many([[1], ['a'], [2, 'b']], List[int], verdicts=True)
+        self.assertEqual([bool(verdict) for verdict in verdicts], [True, False, False])
+        self.assertEqual(str(verdicts[1]), str(validate(['a'], List[int])))
+        self.assertEqual(verdicts[2].errors[0].path, (1,))
+
+    def test_shared_values(self):
+        shared = list(range(100))
+        self.assertIsNone(check_many([shared] * 1000, List[int]))
+        self.assertEqual(check_many([shared, shared + ['a']], List[int]), 1)
+
+    def test_kept_nodes_are_bounded(self):
+        kept = []
+        finish_check = _shared.finish_check
+
+        def record_kept():
+            kept.append(len(_shared._state.check.kept))
+            finish_check()
+
+        _batch.finish_check = record_kept
+        try:
+            self.assertIsNone(check_many([list(range(20)) for _ in range(3000)], List[int]))
+        finally:
+            _batch.finish_check = finish_check
+        self.assertEqual(kept, [_batch.ROWS_PER_SCOPE] * 2 + [3000 - 2 * _batch.ROWS_PER_SCOPE])
+
+    def test_deeply_nested_value(self):
+        Tree = Union[int, List['Tree']]
+        deep = 1
+        for _ in range(sys.getrecursionlimit() + 100):
+            deep = [deep]
+        self.assertIsNone(check_many([1, deep, [2]], Tree))
+        self.assertEqual(check_many([deep, 'a'], Tree), 1)
+        self.assertTrue(all(check_many([deep, [deep]], Tree, verdicts=True)))
+
+
+class TestCheckColumns(unittest.TestCase):
+    def test_mappings(self):
+        rows = [{'id': 1, 'tags': ['a']}, {'id': 2, 'tags': []}, {'id': 3, 'tags': [1]}]
+        self.assertIsNone(check_columns(rows[:2], {'id': int, 'tags': List[str]}))
+        self.assertEqual(check_columns(rows, {'id': int, 'tags': List[str]}), 2)
+        self.assertEqual(check_columns(rows + [{'id': 'a', 'tags': []}], {'id': int}), 3)
+
+    def test_first_bad_row_of_all_fields(self):
+        rows = [(1, 'a'), (2, 'b'), (3, 4), ('d', 5)]
+        self.assertEqual(check_columns(rows, {0: int, 1: str}), 2)
+        self.assertEqual(check_columns(rows, {1: str, 0: int}), 2)
+
+    def test_attributes(self):
+        rows = [Point(1, 2), Point(3, 4.5)]
+        self.assertEqual(check_columns(rows, {'x': int, 'y': int}), 1)
+        self.assertIsNone(check_columns(iter(rows), {'x': int, 'y': Union[int, float]}))
+
+    def test_database_rows(self):
+        connection = sqlite3.connect(':memory:')
+        connection.row_factory = sqlite3.Row
+        rows = connection.execute("SELECT 1 AS id, 'a' AS name UNION ALL SELECT 2, 3").fetchall()
+        connection.close()
+        self.assertEqual(check_columns(rows, {'id': int, 'name': str}), 1)
+        self.assertEqual(check_columns(rows, {0: int, 'name': str}), 1)
+
+    def test_missing_fields(self):
+        rows = [{'id': 1}, {'id': 'a'}, {}]
+        self.assertEqual(check_columns(rows, {'id': int}), 1)
+        self.assertEqual(check_columns([{'id': 1}, {}, {'id': 'a'}], {'id': int}), 1)
+
+    def test_fields_named_as_methods_of_mappings(self):
+        rows = [{'id': 1}, {'id': 2, 'items': None}]
+        verdicts = check_columns(rows, {'items': Optional[List[int]]}, verdicts=True)
+        self.assertEqual([bool(verdict) for verdict in verdicts], [False, True])
+        self.assertIn('no field', str(verdicts[0]))
+        self.assertEqual(check_columns(rows, {'items': Any}), 0)
+        self.assertIsNone(check_columns(rows[1:], {'items': Any}))
+
+    def test_verdicts(self):
+        rows = [{'id': 1, 'tags': ['a']}, {'tags': ['b']}, {'id': 3, 'tags': ['c', 4]}]
+        verdicts = check_columns(rows, {'id': int, 'tags': List[str]}, verdicts=True)
+        self.assertEqual([bool(verdict) for verdict in verdicts], [True, False, False])
+        self.assertIn('no field', str(verdicts[1]))
+        self.assertEqual(verdicts[2].errors[0].path, ('tags', 1))
+
+    def test_nested_hints(self):
+        rows = [{'scores': {'a': 1}}, {'scores': {'a': 'b'}}]
+        self.assertEqual(check_columns(rows, {'scores': Dict[str, int]}), 1)
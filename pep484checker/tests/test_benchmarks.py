@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from pep484checker.benchmarks.checkers import get_cases, compare
+from pep484checker.checker.func import check_type
+
+
+class TestCheckersBenchmark(unittest.TestCase):
+    def test_benchmarked_values_are_consistent(self):
+        for group, case, hint, value in get_cases(max_size=100):
+            with self.subTest(group=group, case=case):
+                check_type(value, hint)
+
+    def test_regressions_against_baseline(self):
+        baseline = {'compiled/list/10': 1.0, 'compiled/list/100': 1.0}
+        results = {'compiled/list/10': 1.1, 'compiled/list/100': 1.3, 'compiled/dict/10': 5.0}
+        self.assertEqual(compare(results, baseline, threshold=0.2), [('compiled/list/100', 1.0, 1.3)])
+
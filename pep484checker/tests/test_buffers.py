@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import unittest
+from array import array
+from typing import Iterable, Sequence, List, Union
+
+from pep484checker.checker.func import generate_checker, is_consistent, register_buffer_type
+from pep484checker.tests._base import CheckerTestCase
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Column(object):
+    def __init__(self, elem_type):
+        self.elem_type = elem_type
+
+    def __iter__(self):
+        raise AssertionError('Elements of column must not be iterated.')
+
+register_buffer_type(Column, lambda column: column.elem_type)
+
+
+def is_consistent_generated(argument, hint):
+    try:
+        generate_checker(hint)(argument)
+    except TypeError:
+        return False
+    return True
+
+
+class TestBuffers(CheckerTestCase):
+    def test_arrays(self):
+        # arrays are registered as sequences only since Python 3.10
+        self.assertCorrectType(array('q', range(1000)), Iterable[int])
+        self.assertCorrectType(array('d', [1.0]), Iterable[Union[float, str]])
+        self.assertIncorrectType(array('d', [1.0]), Iterable[int])
+        self.assertIncorrectType(array('d', [1.0]), List[float])
+
+    def test_memoryview(self):
+        self.assertCorrectType(memoryview(b'abc'), Sequence[int])
+        self.assertCorrectType(memoryview(array('f', [1.0])), Sequence[float])
+        self.assertIncorrectType(memoryview(array('f', [1.0])), Sequence[int])
+
+    def test_range_and_bytes(self):
+        self.assertCorrectType(range(10 ** 9), Sequence[int])
+        self.assertCorrectType(b'abc', Sequence[int])
+        self.assertCorrectType(bytearray(b'abc'), Iterable[int])
+        self.assertIncorrectType(b'abc', Sequence[str])
+
+    def test_registered_type_is_not_iterated(self):
+        self.assertCorrectType(Column(int), Iterable[int])
+        self.assertIncorrectType(Column(str), Iterable[int])
+
+    def test_value_dependent_hints_iterate(self):
+        self.assertIncorrectType(b'abc', Sequence[List[int]])
+
+    def test_generated_checker(self):
+        for argument, hint in ((array('q', [1]), Iterable[int]), (array('d', [1.0]), Iterable[int]),
+                               (Column(int), Iterable[int]), (Column(str), Iterable[int])):
+            self.assertEqual(is_consistent(argument, hint), is_consistent_generated(argument, hint))
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_numpy_arrays(self):
+        # elements are numpy scalars, which are subclasses of builtin types only for some dtypes
+        arrays = (numpy.arange(10, dtype=numpy.int64), numpy.zeros(10, dtype=numpy.float64),
+                  numpy.zeros(10, dtype=numpy.float32), numpy.zeros(10, dtype=bool),
+                  numpy.array(['a', 'b']), numpy.array([1, 'a'], dtype=object))
+        for array_ in arrays:
+            for hint in (Iterable[int], Iterable[float], Iterable[bool], Iterable[str]):
+                self.assertEqual(is_consistent(array_, hint), is_consistent(list(array_), hint),
+                                 msg=(array_.dtype, hint))
+        self.assertCorrectType(numpy.zeros(10, dtype=numpy.float64), Iterable[float])
+        self.assertIncorrectType(numpy.arange(10, dtype=numpy.int64), Iterable[int])
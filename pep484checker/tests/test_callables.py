@@ -73,4 +73,44 @@ class TestFunctionCheck(CheckerTestCase):
     def test_none_in_return_type(self):
         def callback(s: str, i: int) -> None:
             pass
-        self.assertCorrectType(callback, Callable[[str, int], None])
\ No newline at end of file
+        self.assertCorrectType(callback, Callable[[str, int], None])
+
+
+class TestSignatureCache(CheckerTestCase):
+    def test_verdicts_are_cached_per_function(self):
+        from pep484checker.checker import _checkers
+
+        def callback(s: str) -> int:
+            pass
+        self.assertCorrectType(callback, Callable[[str], int])
+        self.assertIncorrectType(callback, Callable[[int], int])
+        _, verdicts = _checkers._signature_verdicts[callback]
+        self.assertEqual(len(verdicts), 2)
+
+    def test_replaced_annotations(self):
+        def callback(s: str) -> int:
+            pass
+        self.assertCorrectType(callback, Callable[[str], int])
+        callback.__annotations__ = {'s': int, 'return': int}
+        self.assertIncorrectType(callback, Callable[[str], int])
+        self.assertCorrectType(callback, Callable[[int], int])
+
+    def test_bound_methods(self):
+        class Foo():
+            def method(self, s: str) -> int:
+                pass
+        self.assertCorrectType(Foo().method, Callable[[str], int])
+        self.assertCorrectType(Foo().method, Callable[[str], int])
+        self.assertIncorrectType(Foo.method, Callable[[str], int])
+        self.assertCorrectType(Foo.method, Callable[[Foo, str], int])
+
+    def test_partial(self):
+        from functools import partial
+
+        def callback(i: int, s: str) -> int:
+            pass
+        self.assertCorrectType(partial(callback, 1), Callable[[str], int])
+        self.assertIncorrectType(partial(callback, 1), Callable[[int, str], int])
+
+    def test_builtins_without_signature(self):
+        self.assertCorrectType(max, Callable[[int, int], int])
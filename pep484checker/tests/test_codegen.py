@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+from typing import (Any, Callable, Dict, List, Tuple, Union, TypeVar,
+                    Iterable, Mapping, MutableSequence, Sized)
+
+from pep484checker.checker.func import generate_checker
+from pep484checker.checker._codegen import generate_validator
+from pep484checker.tests._base import CheckerTestCase
+
+
+class Foo():
+    pass
+class Bar(Foo):
+    pass
+
+
+class GeneratedCheckerTestCase(CheckerTestCase):
+    def assertCorrectType(self, argument, hint, error_msg=None):
+        try:
+            generate_checker(hint)(argument)
+        except TypeError as e:
+            self.fail(e.args[0])
+
+    def assertIncorrectType(self, argument, hint, error_msg=None):
+        with self.assertRaises(TypeError):
+            generate_checker(hint)(argument)
+
+
+class TestGeneratedChecker(GeneratedCheckerTestCase):
+    def test_simple_types(self):
+        self.assertCorrectType(None, None)
+        self.assertCorrectType(22, int)
+        self.assertCorrectType(Bar(), Foo)
+        self.assertIncorrectType(Foo(), Bar)
+        self.assertCorrectType([1], Any)
+        self.assertCorrectType([1], Sized)
+
+    def test_nested_containers(self):
+        self.assertCorrectType({'a': [1, 2], 'b': []}, Dict[str, List[int]])
+        self.assertCorrectType([[1], [2, 3]], List[List[int]])
+        self.assertIncorrectType({'a': [1, '2']}, Dict[str, List[int]])
+        self.assertIncorrectType({'a': (1, 2)}, Mapping[str, List[int]])
+
+    def test_variance_of_parameters(self):
+        self.assertCorrectType([Foo(), Bar()], Iterable[Foo])
+        self.assertIncorrectType([Foo(), Bar()], MutableSequence[Foo])
+
+    def test_tuples(self):
+        self.assertCorrectType((1, 'a'), Tuple[int, str])
+        self.assertIncorrectType((1, 'a'), Tuple[int])
+        self.assertCorrectType((1, 2), Tuple[int, ...])
+        self.assertIncorrectType([1, 2], Tuple[int, ...])
+
+    def test_union_and_typevar(self):
+        T = TypeVar('T', Bar, int, contravariant=True)
+        self.assertCorrectType(None, Union[str, List[int], None])
+        self.assertCorrectType([1], Union[str, List[int], None])
+        self.assertIncorrectType(['1'], Union[str, List[int], None])
+        self.assertCorrectType(Foo(), T)
+        self.assertIncorrectType('1', T)
+
+    def test_cyclic_and_deep_values(self):
+        Tree = Union[int, List['Tree']]
+        cyclic = [1] * 20
+        cyclic.append(cyclic)
+        self.assertCorrectType(cyclic, Tree)
+        self.assertIncorrectType([cyclic, 'a'], Tree)
+
+        deep = 1
+        for _ in range(3000):
+            deep = [deep]
+        self.assertCorrectType(deep, Tree)
+        self.assertIncorrectType([deep, 'a'], Tree)
+
+    def test_callable_signature_falls_back_to_checker(self):
+        def callback(s: str) -> int:
+            pass
+        self.assertCorrectType([callback], List[Callable[[str], int]])
+        self.assertIncorrectType([callback], List[Callable[[int], int]])
+
+
+class TestGeneratedSource(CheckerTestCase):
+    def test_no_calls_for_simple_elements(self):
+        source = generate_validator(Dict[str, List[int]]).__source__
+        self.assertEqual(source.count('def '), 1)
+        self.assertEqual(source.count('for '), 2)
+
+    def test_validator_is_cached(self):
+        self.assertIs(generate_validator(List[int]), generate_validator(List[int]))
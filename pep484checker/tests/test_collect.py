@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+import unittest
+from typing import Dict, List, Tuple, Union, TypeVar
+
+from pep484checker.checker import _collect
+from pep484checker.checker.func import (validate, validate_all, compile_checker,
+                                        enable_verdict_cache, disable_verdict_cache)
+
+
+class TestValidateAll(unittest.TestCase):
+    def paths(self, verdict):
+        return [error.path for error in verdict.errors]
+
+    def test_valid(self):
+        verdict = validate_all({'a': [1, 2]}, Dict[str, List[int]])
+        self.assertTrue(verdict)
+        self.assertFalse(verdict.truncated)
+
+    def test_all_elements(self):
+        verdict = validate_all([1, 'a', 2, None, 3.0], List[int])
+        self.assertFalse(verdict)
+        self.assertEqual(self.paths(verdict), [(1,), (3,), (4,)])
+        self.assertFalse(verdict.truncated)
+
+    def test_nested(self):
+        value = {'a': [1, 'x'], 1: [2], 'b': ['y', 'z']}
+        verdict = validate_all(value, Dict[str, List[int]])
+        self.assertEqual(self.paths(verdict), [('a', 1), (1,), ('b', 0), ('b', 1)])
+
+    def test_key_and_value_of_same_item(self):
+        verdict = validate_all({1: 'a'}, Dict[str, int])
+        self.assertEqual(len(verdict.errors), 2)
+        self.assertIn('Type of key 1', str(verdict.errors[0]))
+        self.assertIn('Type of value `a`', str(verdict.errors[1]))
+
+    def test_tuple(self):
+        verdict = validate_all((1, 'a', [None]), Tuple[int, int, List[int]])
+        self.assertEqual(self.paths(verdict), [(1,), (2, 0)])
+
+    def test_first_error_is_the_one_of_validate(self):
+        value = [[1], [2, 'a'], ['b']]
+        self.assertEqual(str(validate_all(value, List[List[int]]).errors[0]),
+                         str(validate(value, List[List[int]])))
+
+    def test_union_members_are_not_collected(self):
+        verdict = validate_all([['a', 'b'], 1], List[Union[List[int], int]])
+        self.assertEqual(self.paths(verdict), [(0,)])
+        verdict = validate_all([1, 'a', None], List[TypeVar('T', int, float)])
+        self.assertEqual(self.paths(verdict), [(1,), (2,)])
+
+    def test_max_errors(self):
+        verdict = validate_all([[None] * 10] * 10, List[List[int]], max_errors=15)
+        self.assertEqual(len(verdict.errors), 15)
+        self.assertTrue(verdict.truncated)
+
+    def test_max_time(self):
+        start = time.monotonic()
+        verdict = validate_all([['a'] * 1000 for _ in range(1000)], List[List[int]],
+                               max_errors=10 ** 6, max_time=0.01)
+        self.assertTrue(verdict.truncated)
+        self.assertLess(len(verdict.errors), 10 ** 6)
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_verdict_cache_is_bypassed(self):
+        enable_verdict_cache()
+        try:
+            value = (1, 'a', 'b')
+            compile_checker(Tuple[int, int, int]).is_consistent(value)
+            self.assertEqual(len(validate_all(value, Tuple[int, int, int]).errors), 2)
+        finally:
+            disable_verdict_cache()
+
+    def test_scope_is_per_thread(self):
+        seen = []
+        with _collect.collecting_scope(_collect.ErrorCollector()):
+            thread = threading.Thread(target=lambda: seen.append(
+                (_collect.is_active(), len(validate([1, 'a', 'b'], List[int]).errors))))
+            thread.start()
+            thread.join()
+            self.assertTrue(_collect.is_active())
+        self.assertEqual(seen, [(False, 1)])
+
+    def test_scope_is_left(self):
+        validate_all([1, 'a'], List[int])
+        self.assertFalse(_collect.is_active())
+        self.assertIsNone(_collect.get_collector())
+        self.assertEqual(len(validate([1, 'a', 'b'], List[int]).errors), 1)
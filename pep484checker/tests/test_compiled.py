@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+from typing import Dict, List, Tuple, Union, TypeVar, Iterable, MutableSequence
+
+from pep484checker.checker.func import compile_checker
+from pep484checker.tests._base import CheckerTestCase
+
+
+class Foo():
+    pass
+class Bar(Foo):
+    pass
+
+
+class CompiledCheckerTestCase(CheckerTestCase):
+    def assertCorrectType(self, argument, hint, error_msg=None):
+        try:
+            compile_checker(hint)(argument)
+        except TypeError as e:
+            self.fail(e.args[0])
+
+    def assertIncorrectType(self, argument, hint, error_msg=None):
+        with self.assertRaises(TypeError):
+            compile_checker(hint)(argument)
+
+
+class TestCompiledChecker(CompiledCheckerTestCase):
+    def test_simple_types(self):
+        self.assertCorrectType(None, None)
+        self.assertCorrectType(22, int)
+        self.assertCorrectType(Bar(), Foo)
+        self.assertIncorrectType(Foo(), Bar)
+        self.assertIncorrectType(22, None)
+
+    def test_nested_containers(self):
+        self.assertCorrectType({'a': [1, 2], 'b': []}, Dict[str, List[int]])
+        self.assertCorrectType([[1], [2, 3]], List[List[int]])
+        self.assertIncorrectType({'a': [1, '2']}, Dict[str, List[int]])
+        self.assertIncorrectType([[1], ['2']], List[List[int]])
+
+    def test_variance_of_parameters(self):
+        self.assertCorrectType([Foo(), Bar()], Iterable[Foo])
+        self.assertIncorrectType([Foo(), Bar()], MutableSequence[Foo])
+
+    def test_tuples(self):
+        self.assertCorrectType((1, 'a'), Tuple[int, str])
+        self.assertIncorrectType((1, 2), Tuple[int])
+        self.assertCorrectType((1, 2), Tuple[int, ...])
+        self.assertIncorrectType((1, 'a'), Tuple[int, ...])
+
+    def test_union_and_typevar(self):
+        T = TypeVar('T', str, int)
+        self.assertCorrectType(1, Union[str, int])
+        self.assertIncorrectType(1.0, Union[str, int])
+        self.assertCorrectType('1', T)
+        self.assertIncorrectType(Foo(), T)
+
+    def test_forward_reference(self):
+        class Baz():
+            pass
+        self.assertCorrectType(Baz(), Union['Baz', str])
+
+
+class TestCompiledCheckersCache(CompiledCheckerTestCase):
+    def test_same_hint_is_compiled_once(self):
+        self.assertIs(compile_checker(Dict[str, List[int]]),
+                      compile_checker(Dict[str, List[int]]))
+
+    def test_tuple_with_ellipsis_is_not_confused(self):
+        self.assertIsNot(compile_checker(Tuple[int]), compile_checker(Tuple[int, ...]))
+        self.assertCorrectType((1, 2, 3), Tuple[int, ...])
+        self.assertIncorrectType((1, 2, 3), Tuple[int])
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from typing import Dict, List, Iterable, Tuple, Union
+
+from pep484checker.checker import _helpers
+from pep484checker.checker.func import check_type, compile_checker
+from pep484checker.tests._base import CheckerTestCase
+
+
+class CountingMeta(type):
+    checks = 0
+
+    def __subclasscheck__(cls, subclass):
+        CountingMeta.checks += 1
+        return super().__subclasscheck__(subclass)
+
+
+class Foo(metaclass=CountingMeta):
+    pass
+class Bar(Foo):
+    pass
+
+
+class TestDistinctTypesPrepass(CheckerTestCase):
+    def setUp(self):
+        CountingMeta.checks = 0
+        _helpers.get_type_verdicts().clear()
+
+    def test_one_check_per_distinct_type(self):
+        self.assertCorrectType([Bar() for _ in range(100)], Iterable[Foo])
+        self.assertEqual(CountingMeta.checks, 1)
+
+    def test_compiled_one_check_per_distinct_type(self):
+        checker = compile_checker(Dict[str, Union[Foo, int]])
+        CountingMeta.checks = 0
+        checker({str(i): Bar() for i in range(100)})
+        self.assertEqual(CountingMeta.checks, 1)
+
+    def test_mismatch_reports_first_wrong_element(self):
+        with self.assertRaisesRegex(TypeError, 'Element 2.0 of iterable'):
+            check_type([1, 2, 2.0, 'a'], List[int])
+        with self.assertRaisesRegex(TypeError, 'Element a of iterable'):
+            check_type(('a', 1), Tuple[Union[int, float], ...])
+
+    def test_mismatch_in_mapping(self):
+        self.assertCorrectType({'a': 1, 'b': None}, Dict[str, Union[int, None]])
+        with self.assertRaisesRegex(TypeError, 'Type of key 1 for mapping'):
+            check_type({'a': 1, 1: 2}, Dict[str, int])
+        with self.assertRaisesRegex(TypeError, 'Type of value `b` for key `a`'):
+            check_type({'a': 'b'}, Dict[str, List[int]])
+
+    def test_iterators_are_traversed_once(self):
+        self.assertCorrectType(iter([1, 2]), Iterable[int])
+        self.assertIncorrectType(iter([1, '2']), Iterable[int])
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import unittest
+from typing import Dict, List, Tuple
+
+from pep484checker.checker.func import check_type, validate, compile_checker, SamplingPolicy
+from pep484checker.checker._result_funcs import MAX_ARGUMENT_LENGTH
+
+
+class TestErrorPaths(unittest.TestCase):
+    def test_nested_path(self):
+        error = validate([[1], [2, 'a']], List[List[int]]).errors[0]
+        self.assertEqual(error.path, (1, 1))
+        self.assertEqual(error.expected, int)
+        self.assertIs(error.actual_type, str)
+        self.assertTrue(str(error).startswith('[1][1]: Element a of iterable'))
+
+    def test_mapping_path(self):
+        error = validate([{'a': [1]}, {'b': [1, None]}], List[Dict[str, List[int]]]).errors[0]
+        self.assertEqual(error.path, (1, 'b', 1))
+        self.assertEqual(error.format_path(), "[1]['b'][1]")
+
+    def test_tuple_path(self):
+        error = validate((1, [1, 'a']), Tuple[int, List[int]]).errors[0]
+        self.assertEqual(error.path, (1, 1))
+        self.assertEqual(compile_checker(Tuple[int, List[int]]).run((1, [1, 'a'])).errors[0].path, (1, 1))
+        with self.assertRaisesRegex(TypeError, r'^\[1\]\[1\]: Element a'):
+            check_type((1, [1, 'a']), Tuple[int, List[int]])
+
+    def test_top_level_mismatch_has_no_path(self):
+        error = validate('a', int).errors[0]
+        self.assertEqual(error.path, ())
+        self.assertEqual(str(error), "Argument type <class 'str'> is not consistent with hint <class 'int'>")
+
+    def test_consistent_verdict(self):
+        result = validate([1], List[int])
+        self.assertEqual(result.errors, ())
+        self.assertEqual(str(result), 'Argument is consistent with hint')
+
+    def test_sampled_elements_have_unknown_position(self):
+        values = list(range(100)) + ['a']
+        result = validate(values, List[int], sampling=SamplingPolicy('last', size=10))
+        self.assertTrue(str(result).startswith('[?]: '))
+
+    def test_long_arguments_are_shortened(self):
+        value = 'x' * 10000
+        message = str(validate([value], List[int]))
+        self.assertLess(len(message), 3 * MAX_ARGUMENT_LENGTH)
+        self.assertIn('...', message)
+
+    def test_message_is_rendered_lazily(self):
+        rendered = []
+
+        class Value(object):
+            def __repr__(self):
+                rendered.append(self)
+                return 'Value()'
+
+        result = validate([Value()], List[int])
+        self.assertFalse(result)
+        self.assertEqual(rendered, [])
+        self.assertIn('Element Value() of iterable', str(result))
+        self.assertEqual(len(rendered), 1)
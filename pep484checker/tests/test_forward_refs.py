@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import unittest
+from typing import List, Union
+
+from pep484checker.checker._forward_refs import ForwardRefResolver
+from pep484checker.checker.func import check_type
+
+
+class CountingNamespace(dict):
+    lookups = 0
+
+    def __getitem__(self, name):
+        self.lookups += 1
+        return super().__getitem__(name)
+
+
+class TestForwardRefResolver(unittest.TestCase):
+    def setUp(self):
+        self.resolver = ForwardRefResolver()
+
+    def test_resolved_expressions_are_cached_per_module(self):
+        namespace = {'__name__': 'app.models', 'List': List, 'Model': int}
+        self.assertEqual(self.resolver.resolve('List[Model]', namespace), List[int])
+
+        namespace['Model'] = str
+        self.assertEqual(self.resolver.resolve('List[Model]', namespace), List[int])
+        other_module = dict(namespace, __name__='app.views')
+        self.assertEqual(self.resolver.resolve('List[Model]', other_module), List[str])
+
+    def test_unresolved_are_retried_when_names_appear(self):
+        namespace = CountingNamespace(__name__='app.models')
+        with self.assertRaises(NameError):
+            self.resolver.resolve('Model', namespace)
+        lookups = namespace.lookups
+
+        with self.assertRaisesRegex(NameError, 'Names Model of forward reference'):
+            self.resolver.resolve('Model', namespace)
+        self.assertEqual(namespace.lookups, lookups) # not evaluated again
+
+        namespace['Model'] = int
+        self.assertIs(self.resolver.resolve('Model', namespace), int)
+
+    def test_local_names_are_not_cached(self):
+        namespace = {'__name__': 'app.models'}
+        self.assertIs(self.resolver.resolve('Model', namespace, {'Model': int}), int)
+        self.assertIs(self.resolver.resolve('Model', namespace, {'Model': str}), str)
+
+
+class TestForwardRefObjects(unittest.TestCase):
+    def test_frame_is_dropped_after_resolution(self):
+        class Node(object):
+            pass
+        hint = Union['Node', int]
+        ref, = [param for param in hint.__union_params__ if param is not int]
+        self.assertIsNotNone(ref.__forward_frame__)
+
+        check_type(Node(), hint)
+        self.assertIsNone(ref.__forward_frame__)
+        check_type(Node(), hint)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+from typing import Dict, Generic, KeysView, List, TypeVar
+
+from pep484checker.checker.func import generate_checker
+from pep484checker.tests._base import CheckerTestCase
+from pep484checker.tests.test_compiled import CompiledCheckerTestCase
+
+
+T = TypeVar('T')
+
+
+class Stack(Generic[T]):
+    pass
+
+
+class Rows(List[T]):
+    pass
+
+
+class Index(Dict[str, T]):
+    pass
+
+
+class Matrix(List[List[int]]):
+    pass
+
+
+class TestUserGenerics(CheckerTestCase):
+    def test_generic_subclasses(self):
+        self.assertCorrectType(Stack(), Stack)
+        self.assertCorrectType(Stack(), Stack[int])
+        self.assertIncorrectType([], Stack[int])
+
+    def test_subclasses_of_containers(self):
+        self.assertCorrectType(Rows([1, 2]), Rows[int])
+        self.assertIncorrectType(Rows([1, 'a']), Rows[int])
+        self.assertIncorrectType([1, 2], Rows[int])
+
+        self.assertCorrectType(Index(a=1), Index)
+        self.assertIncorrectType(Index({1: 'b'}), Index)
+
+        self.assertCorrectType(Matrix([[1]]), Matrix)
+        self.assertIncorrectType(Matrix([['a']]), Matrix)
+
+    def test_unregistered_typing_generics(self):
+        self.assertCorrectType({'a': 1}.keys(), KeysView[str])
+        self.assertIncorrectType({'a': 1}.keys(), KeysView[int])
+
+    def test_generated_checkers(self):
+        checker = generate_checker(List[Rows[int]])
+        checker([Rows([1])])
+        with self.assertRaises(TypeError):
+            checker([Rows(['a'])])
+
+
+class TestCompiledUserGenerics(CompiledCheckerTestCase, TestUserGenerics):
+    pass
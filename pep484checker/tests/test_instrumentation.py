@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+import unittest
+from typing import Dict, List
+
+from pep484checker.checker import typechecked
+from pep484checker.checker.func import (is_consistent, compile_checker, enable_instrumentation,
+                                        disable_instrumentation, get_check_stats, reset_check_stats,
+                                        get_hot_hints)
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        reset_check_stats()
+        enable_instrumentation()
+
+    def tearDown(self):
+        disable_instrumentation()
+        reset_check_stats()
+
+    def test_checks_failures_and_elements_per_hint(self):
+        is_consistent([1, 2, 3], List[int])
+        is_consistent([1, 'a'], List[int])
+        compile_checker(Dict[str, List[int]]).is_consistent({'a': [1, 2], 'b': []})
+
+        stats = get_check_stats()
+        # 2 checks of their own, 2 nested in the dict
+        self.assertEqual(stats[repr(List[int])]['checks'], 4)
+        self.assertEqual(stats[repr(List[int])]['failures'], 1)
+        self.assertEqual(stats[repr(List[int])]['elements'], 7)
+        self.assertEqual(stats[repr(Dict[str, List[int]])]['checks'], 1)
+        self.assertEqual(stats[repr(Dict[str, List[int]])]['elements'], 4) # 2 items, 2 elements
+        self.assertEqual(sum(stats[repr(List[int])]['histogram'].values()), 4)
+
+    def test_typechecked_functions(self):
+        @typechecked
+        def total(values: List[int]) -> int:
+            return sum(values)
+
+        total([1, 2])
+        stats = get_check_stats()
+        self.assertEqual(stats[repr(List[int])]['checks'], 1)
+        self.assertEqual(stats[repr(int)]['checks'], 1)
+
+    def test_hot_hints(self):
+        for _ in range(3):
+            is_consistent(1, int)
+        is_consistent('a', str)
+        (hottest, stats), _ = get_hot_hints(2, key='checks')
+        self.assertEqual((hottest, stats['checks']), (repr(int), 3))
+
+    def test_nested_hints(self):
+        disable_instrumentation()
+        checker = compile_checker(Dict[str, List[List[int]]])
+        enable_instrumentation()
+
+        rows = {str(i): [[j] for j in range(10)] for i in range(10)}
+        is_consistent(rows, Dict[str, List[List[int]]])
+        checker.is_consistent(rows)
+        stats = dict(get_hot_hints(3, key='checks'))
+        self.assertEqual(stats[repr(List[int])]['checks'], 200)
+        self.assertEqual(stats[repr(List[List[int]])]['checks'], 20)
+        self.assertEqual(stats[repr(Dict[str, List[List[int]]])]['checks'], 2)
+
+    def test_dump_hook(self):
+        dumps = []
+        enable_instrumentation(dump_hook=dumps.append, dump_interval=0)
+        is_consistent(1, int)
+        is_consistent(2, int)
+        self.assertEqual([dump[repr(int)]['checks'] for dump in dumps], [1, 2])
+
+    def test_disabled(self):
+        disable_instrumentation()
+        is_consistent(1, int)
+        self.assertEqual(get_check_stats(), {})
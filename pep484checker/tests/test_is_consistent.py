@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+import unittest
+from typing import List, Tuple, Union, TypeVar
+
+from pep484checker.checker.func import check_type, is_consistent
+
+
+class Foo():
+    reprs = 0
+
+    def __repr__(self):
+        Foo.reprs += 1
+        return 'Foo()'
+
+
+class TestIsConsistent(unittest.TestCase):
+    def test_returns_bool(self):
+        self.assertIs(is_consistent(1, int), True)
+        self.assertIs(is_consistent('1', int), False)
+        self.assertIs(is_consistent([1, '2'], List[int]), False)
+        self.assertIs(is_consistent((1, '2'), Tuple[int, str]), True)
+
+    def test_union_and_constraints_dont_raise(self):
+        T = TypeVar('T', int, str)
+        self.assertTrue(is_consistent('1', Union[int, float, str]))
+        self.assertFalse(is_consistent(b'1', Union[int, float, str]))
+        self.assertFalse(is_consistent(1.0, T))
+
+    def test_message_is_formatted_only_for_check_type(self):
+        Foo.reprs = 0
+        self.assertFalse(is_consistent([Foo()], List[int]))
+        self.assertFalse(is_consistent([Foo()], Union[List[int], List[str]]))
+        self.assertEqual(Foo.reprs, 0)
+
+        with self.assertRaisesRegex(TypeError, r'Element Foo\(\) of iterable'):
+            check_type([Foo()], List[int])
+        self.assertEqual(Foo.reprs, 1)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+import unittest
+from contextlib import contextmanager
+from array import array
+from typing import Any, Dict, List, Mapping, Set, Tuple, TypeVar, Union
+
+from pep484checker.checker import func
+from pep484checker.checker._iterative import check_iteratively
+from pep484checker.checker.func import (_check_type, check_type, compile_checker, validate, validate_all,
+                                        SamplingPolicy)
+
+
+Tree = Union[int, List['Tree']]
+Lists = List['Lists']
+
+T = TypeVar('T', int, str)
+
+
+@contextmanager
+def iterative_engine():
+    recursive_check_type = func._check_type
+    func._check_type = check_iteratively
+    try:
+        yield
+    finally:
+        func._check_type = recursive_check_type
+
+
+def nest(leaf, depth):
+    value = leaf
+    for _ in range(depth):
+        value = [value, 1]
+    return value
+
+
+class TestIterativeEngine(unittest.TestCase):
+    cases = [
+        (1, int),
+        ('a', int),
+        (None, type(None)),
+        ([1, 2, 3], List[int]),
+        ([1, 'a', 2.0], List[int]),
+        (array('i', [1, 2]), List[int]),
+        ({'a': [1, 2], 'b': [3]}, Dict[str, List[int]]),
+        ({'a': [1, 'x'], 1: []}, Dict[str, List[int]]),
+        ({1, 2}, Set[str]),
+        ((1, 'a', [1.0]), Tuple[int, str, List[float]]),
+        ((1, 'a', [None]), Tuple[int, str, List[float]]),
+        ((1, 2), Tuple[int]),
+        (([1], [2, 'b']), Tuple[List[int], ...]),
+        ([[1], 'a', [None]], List[Union[List[int], str]]),
+        ([1, 'a', 2.0], List[T]),
+        ({'a': {'b': [{'c': None}]}}, Mapping[str, Any]),
+        (nest(1, 20), Tree),
+        (nest('a', 20), Tree),
+        ([[[]], [[], [1]]], Lists),
+    ]
+
+    def test_same_results_and_errors(self):
+        for value, hint in self.cases:
+            recursive, iterative = _check_type(value, hint), check_iteratively(value, hint)
+            self.assertEqual(bool(recursive), bool(iterative), (value, hint))
+            if not recursive:
+                self.assertEqual(str(recursive), str(iterative))
+
+    def test_same_collected_errors(self):
+        for value, hint in self.cases:
+            collected = validate_all(value, hint)
+            with iterative_engine():
+                iteratively_collected = validate_all(value, hint)
+            self.assertEqual([str(error) for error in getattr(collected, 'errors', [])],
+                             [str(error) for error in getattr(iteratively_collected, 'errors', [])])
+
+    def test_same_sampled_errors(self):
+        policy = SamplingPolicy('last', size=3)
+        value = list(range(10)) + ['a']
+        self.assertEqual(str(validate(value, List[int], sampling=policy)).split(':')[0], '[?]')
+        with iterative_engine():
+            self.assertEqual(str(validate(value, List[int], sampling=policy)).split(':')[0], '[?]')
+
+
+class TestDeeplyNested(unittest.TestCase):
+    def test_no_depth_limit(self):
+        check_type(nest(1, 10000), Tree)
+        with self.assertRaisesRegex(TypeError, 'not consistent with hint'):
+            check_type(nest('a', 10000), Tree)
+
+    def test_compiled_checker(self):
+        checker = compile_checker(Tree)
+        checker(nest(1, 10000))
+        self.assertFalse(checker.is_consistent(nest('a', 10000)))
+
+    def test_collected(self):
+        value = ['a', 'b']
+        for _ in range(5000):
+            value = [value]
+        verdict = validate_all(value, Lists)
+        self.assertEqual([error.path for error in verdict.errors], [(0,) * 5000 + (0,), (0,) * 5000 + (1,)])
+
+    def test_deep_values_are_checked_once(self):
+        # containers below ITERATIVE_DEPTH are handed to the iterative engine, the check isn't restarted
+        def fail(*args, **kwargs):
+            self.fail('checked again from the start')
+
+        restarted_check, func._check_type_iteratively = func._check_type_iteratively, fail
+        try:
+            check_type(nest(1, 10000), Tree)
+            self.assertFalse(validate(nest('a', 10000), Tree))
+            self.assertTrue(compile_checker(Tree).is_consistent(nest(1, 10000)))
+            value = ['a', 'b']
+            for _ in range(5000):
+                value = [value]
+            verdict = validate_all(value, Lists)
+            self.assertEqual([error.path for error in verdict.errors], [(0,) * 5000 + (0,), (0,) * 5000 + (1,)])
+        finally:
+            func._check_type_iteratively = restarted_check
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+import unittest
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from pep484checker.checker._json_stream import JSONReader, iterate_events
+from pep484checker.checker.func import check_json, validate_json, validate
+
+
+def _stream(document, binary=False):
+    text = json.dumps(document)
+    return io.BytesIO(text.encode('utf-8')) if binary else io.StringIO(text)
+
+
+class TestJSONReader(unittest.TestCase):
+    def get_events(self, text, chunk_size=1):
+        return list(iterate_events(JSONReader(io.StringIO(text), chunk_size)))
+
+    def test_tokens_split_between_reads(self):
+        document = {'name': 'a "quoted" é \\ string', 'values': [-1.5e3, 12345678, True, False, None],
+                    'nested': {'': []}}
+        text = json.dumps(document)
+        for chunk_size in (1, 2, 3, 7, 64):
+            events = self.get_events(text, chunk_size)
+            self.assertEqual(events, self.get_events(text, 4096))
+        self.assertIn(('value', -1.5e3), events)
+        self.assertIn(('key', 'name'), events)
+        self.assertIn(('value', document['name']), events)
+
+    def test_utf8_bytes(self):
+        stream = io.BytesIO('["é中"]'.encode('utf-8'))
+        events = list(iterate_events(JSONReader(stream, 1)))
+        self.assertEqual(events[1], ('value', 'é中'))
+
+    def test_malformed_documents(self):
+        for text in ('', '[1, 2', '[1,]', '{"a" 1}', '{1: 2}', '[1] 2', '[tru]', '"abc', '{"a": 1,}'):
+            with self.assertRaises(ValueError, msg=text):
+                self.get_events(text)
+
+
+class TestValidateJSON(unittest.TestCase):
+    def assertSameVerdict(self, document, hint):
+        verdict = validate_json(_stream(document), hint, chunk_size=3)
+        expected = validate(json.load(_stream(document)), hint)
+        self.assertEqual(bool(verdict), bool(expected))
+        self.assertEqual(bool(validate_json(_stream(document, binary=True), hint)), bool(verdict))
+        if not expected:
+            self.assertEqual(str(verdict), str(expected))
+            self.assertEqual([error.path for error in verdict.errors], [error.path for error in expected.errors])
+            self.assertEqual([error.actual_type for error in verdict.errors],
+                             [error.actual_type for error in expected.errors])
+        return verdict
+
+    def test_consistent_documents(self):
+        self.assertSameVerdict({'a': [1, 2], 'b': []}, Dict[str, List[int]])
+        self.assertSameVerdict([{'a': 1.5}, {}], Sequence[Mapping[str, float]])
+        self.assertSameVerdict([1, None, 2], List[Optional[int]])
+        self.assertSameVerdict({'a': {'b': [1, 'c']}}, Dict[str, Any])
+        self.assertSameVerdict({'a': [[1], {'b': 2}]}, Dict[str, list])
+        self.assertSameVerdict('a', str)
+        self.assertSameVerdict([], List[int])
+
+    def test_paths_of_mismatches(self):
+        verdict = self.assertSameVerdict({'a': [1, 2], 'b': [3, 'x', 'y']}, Dict[str, List[int]])
+        self.assertEqual(verdict.errors[0].path, ('b', 1))
+        self.assertEqual(str(verdict), str(validate({'b': [3, 'x']}, Dict[str, List[int]])))
+
+        verdict = self.assertSameVerdict([{'id': 1}, {'id': [2]}], List[Dict[str, int]])
+        self.assertEqual(verdict.errors[0].path, (1, 'id'))
+
+    def test_mismatched_containers(self):
+        verdict = self.assertSameVerdict({'a': {'b': 1}}, Dict[str, List[int]])
+        self.assertEqual(verdict.errors[0].path, ('a',))
+        self.assertEqual(verdict.errors[0].actual_type, dict)
+
+        self.assertSameVerdict([1], Dict[str, int])
+        self.assertSameVerdict([1], Set[int])
+        self.assertSameVerdict({'a': [1]}, Dict[str, Union[int, str]])
+        self.assertSameVerdict([[1]], List[int])
+        self.assertSameVerdict({'a': [[1, 2], {'b': [3]}]}, Dict[str, List[List[int]]])
+        self.assertSameVerdict([[1, 'a'], [[2]]], List[Union[int, List[int]]])
+        self.assertSameVerdict({'a': {'b': {'c': 1}}}, Dict[str, Dict[str, int]])
+
+    def test_objects_as_iterables(self):
+        # objects are iterated by their keys
+        self.assertSameVerdict({'a': 1}, Iterable[int])
+        self.assertSameVerdict({'a': 1, 'b': [2]}, Iterable[str])
+        verdict = self.assertSameVerdict({'a': {}, 'b': {'c': 1}}, Dict[str, Iterable[int]])
+        self.assertEqual(verdict.errors[0].path, ('b', 0))
+        self.assertSameVerdict([{'a': 1}, {'b': 2, 'c': 3}], List[Iterable[str]])
+
+    def test_keys(self):
+        verdict = self.assertSameVerdict({'a': 1}, Dict[int, int])
+        self.assertEqual(verdict.errors[0].path, ('a',))
+        self.assertIn('key', str(verdict))
+
+    def test_unions(self):
+        self.assertSameVerdict([[1], {'a': 'b'}], List[Union[List[int], Dict[str, str]]])
+        verdict = self.assertSameVerdict([[1], {'a': 2}], List[Union[List[int], Dict[str, str]]])
+        self.assertEqual(verdict.errors[0].path, (1,))
+        self.assertSameVerdict({'a': [1, 'b']}, Dict[str, Optional[List[int]]])
+
+        # checked whole, as either member may match
+        self.assertSameVerdict([['a'], [1]], List[Union[List[int], List[str]]])
+        verdict = self.assertSameVerdict([['a'], [1, 'b']], List[Union[List[int], List[str]]])
+        self.assertEqual(verdict.errors[0].path, (1,))
+
+    def test_root_unions(self):
+        self.assertSameVerdict([[1], [2]], Optional[List[List[int]]])
+        self.assertSameVerdict([[1], [2, 'a']], Optional[List[List[int]]])
+        self.assertSameVerdict({'a': [1, 'b']}, Union[Dict[str, List[int]], List[int], None])
+        self.assertSameVerdict([[1], {'a': 2}], Optional[List[Union[List[int], Dict[str, str]]]])
+        self.assertSameVerdict([1, 'a'], Optional[Tuple[int, int]])
+        self.assertSameVerdict([1, 2, 3], Optional[Tuple[int, int]])
+
+        class Stream(io.StringIO):
+            reads = 0
+
+            def read(self, size=-1):
+                self.reads += 1
+                return super().read(size)
+
+        # the document isn't parsed whole, to be checked at its end
+        stream = Stream('["a", 1' + ', 2' * 100000 + ']')
+        self.assertFalse(validate_json(stream, Optional[List[str]], chunk_size=16))
+        self.assertLess(stream.reads, 5)
+
+    def test_tuples(self):
+        # JSON arrays are checked as tuples, and reported as validate() reports the tuples
+        self.assertTrue(validate_json(io.StringIO('[[1, "a"], [2, "b"]]'), List[Tuple[int, str]]))
+        self.assertTrue(validate_json(io.StringIO('[1, 2, 3]'), Tuple[int, ...]))
+        documents = [
+            ('[[1, "a"], [2, 3]]', [(1, 'a'), (2, 3)], List[Tuple[int, str]]),
+            ('[[1, "a", 2]]', [(1, 'a', 2)], List[Tuple[int, str]]),
+            ('[[1, "a", [2, {"b": 3}]]]', [(1, 'a', [2, {'b': 3}])], List[Tuple[int, str]]),
+            ('{"a": [[1]]}', {'a': [(1,)]}, Dict[str, List[Tuple[int, str]]]),
+            ('[[1, [2, "b"]], [1, [2, 3]]]', [(1, (2, 'b')), (1, (2, 3))], List[Tuple[int, Tuple[int, str]]]),
+            ('[[1, [2]], [1, [2, 3]]]', [(1, (2,)), (1, (2, 3))], List[Tuple[int, Tuple[int, str]]]),
+            ('[[1, {"a": [2]}]]', [(1, {'a': [2]})], List[Tuple[int, Dict[str, List[str]]]]),
+            ('[[1, {"a": [2]}]]', [(1, {'a': [2]})], List[Tuple[int, Iterable[int]]]),
+            ('[1, "a"]', (1, 'a'), Tuple[int, ...]),
+        ]
+        for text, document, hint in documents:
+            verdict = validate_json(io.StringIO(text), hint, chunk_size=3)
+            expected = validate(document, hint)
+            self.assertFalse(verdict, msg=text)
+            self.assertEqual(str(verdict), str(expected))
+            self.assertEqual(verdict.errors[0].path, expected.errors[0].path)
+
+    def test_stops_at_first_mismatch(self):
+        class Stream(io.StringIO):
+            reads = 0
+
+            def read(self, size=-1):
+                self.reads += 1
+                return super().read(size)
+
+        stream = Stream('["a", 1' + ', 2' * 100000 + ']')
+        self.assertFalse(validate_json(stream, List[str], chunk_size=16))
+        self.assertLess(stream.reads, 5)
+
+    def test_long_strings_are_read_in_growing_chunks(self):
+        class Stream(io.StringIO):
+            reads = 0
+
+            def read(self, size=-1):
+                self.reads += 1
+                return super().read(size)
+
+        text = 'a\\"' * 100000
+        stream = Stream(json.dumps([text, 'b']))
+        self.assertTrue(validate_json(stream, List[str], chunk_size=16))
+        self.assertLess(stream.reads, 30)
+
+    def test_check_json(self):
+        check_json(_stream({'a': [1]}), Dict[str, List[int]])
+        with self.assertRaises(TypeError):
+            check_json(_stream({'a': ['b']}), Dict[str, List[int]])
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import unittest
+from typing import Generator, Iterable, Iterator, List
+
+from pep484checker.checker import typechecked
+from pep484checker.checker.func import check_lazily
+
+
+def numbers(*values):
+    yield from values
+
+
+class TestCheckLazily(unittest.TestCase):
+    def test_iterator_is_not_consumed(self):
+        iterator = iter([1, 2, 'a', 3])
+        checked = check_lazily(iterator, Iterator[int])
+        self.assertEqual(next(iterator), 1) # nothing was pulled by the check itself
+
+        self.assertEqual(next(checked), 2)
+        with self.assertRaisesRegex(TypeError, 'Element a at position 1 of iterator'):
+            next(checked)
+
+    def test_iterators_passed_as_iterables(self):
+        self.assertEqual(list(check_lazily(numbers(1, 2), Iterable[int])), [1, 2])
+        with self.assertRaises(TypeError):
+            list(check_lazily(numbers(1, 'a'), Iterable[int]))
+
+    def test_other_arguments_are_checked_at_once(self):
+        value = [1, 2]
+        self.assertIs(check_lazily(value, List[int]), value)
+        self.assertIs(check_lazily(value, Iterable[int]), value)
+        with self.assertRaises(TypeError):
+            check_lazily([1, 'a'], Iterable[int])
+        with self.assertRaises(TypeError):
+            check_lazily([1], Iterator[int])
+        self.assertEqual(check_lazily(1, int), 1)
+
+    def test_generator(self):
+        def accumulate():
+            total = 0
+            while total < 10:
+                total += yield total
+            return str(total)
+
+        checked = check_lazily(accumulate(), Generator[int, int, str])
+        self.assertEqual(next(checked), 0)
+        self.assertEqual(checked.send(5), 5)
+        with self.assertRaisesRegex(TypeError, 'Value a sent to generator'):
+            checked.send('a')
+        with self.assertRaises(StopIteration) as raised:
+            checked.send(5)
+        self.assertEqual(raised.exception.value, '10')
+
+        checked = check_lazily(accumulate(), Generator[int, int, int])
+        next(checked)
+        with self.assertRaisesRegex(TypeError, 'Return value 10 of generator'):
+            checked.send(10)
+
+    def test_typechecked_lazy(self):
+        @typechecked(lazy=True)
+        def double(values: Iterator[int]) -> Iterator[int]:
+            return (value * 2 for value in values)
+
+        self.assertEqual(list(double(iter([1, 2]))), [2, 4])
+        doubled = double(iter([1, 'a']))
+        self.assertEqual(next(doubled), 2)
+        with self.assertRaises(TypeError):
+            next(doubled)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import abc
+import unittest
+from typing import Any, Dict, List, Sequence, TypeVar, Union
+
+from pep484checker.checker._members import MembersIndex
+from pep484checker.checker.func import compile_checker, is_consistent
+from pep484checker.tests._base import CheckerTestCase
+
+
+class Message(object):
+    pass
+
+
+messages = [type('Message{0}'.format(i), (Message,), {}) for i in range(40)]
+Messages = Union[tuple(messages) + (List[int], Dict[str, int])]
+
+
+class TestMembersIndex(unittest.TestCase):
+    def test_classes_are_looked_up(self):
+        index = MembersIndex([int, str, List[int], Dict[str, int], Sequence[int]])
+        self.assertEqual(index.lookup(bool), (True, ()))
+        consistent, positions = index.lookup(list)
+        self.assertFalse(consistent)
+        self.assertEqual([index.members[i] for i in positions], [List[int], Sequence[int]])
+        self.assertEqual(index.lookup(float), (False, ()))
+
+    def test_any(self):
+        self.assertEqual(MembersIndex([int, Any]).lookup(object), (True, ()))
+
+    def test_abc_registrations(self):
+        class Base(metaclass=abc.ABCMeta):
+            pass
+        class Registered(object):
+            pass
+
+        index = MembersIndex([int, Base])
+        self.assertEqual(index.lookup(Registered), (False, ()))
+        Base.register(Registered)
+        self.assertEqual(index.lookup(Registered), (True, ()))
+
+
+class TestIndexedUnion(CheckerTestCase):
+    def test_wide_union(self):
+        for message_class in messages:
+            self.assertCorrectType(message_class(), Messages)
+        self.assertCorrectType([1], Messages)
+        self.assertCorrectType({'a': 1}, Messages)
+        self.assertIncorrectType(Message(), Messages)
+        self.assertIncorrectType(['a'], Messages)
+
+        checker = compile_checker(Messages)
+        self.assertTrue(checker.is_consistent(messages[-1]()))
+        self.assertTrue(checker.is_consistent({'a': 1}))
+        self.assertFalse(checker.is_consistent({'a': 'b'}))
+        self.assertFalse(checker.is_consistent('a'))
+
+    def test_subclasses(self):
+        class Derived(messages[5]):
+            pass
+        self.assertCorrectType(Derived(), Messages)
+        self.assertTrue(compile_checker(Messages).is_consistent(Derived()))
+
+    def test_proxies(self):
+        class Proxy(object):
+            @property
+            def __class__(self):
+                return messages[0]
+        self.assertTrue(is_consistent(Proxy(), Messages))
+
+    def test_typevar_constraints(self):
+        T = TypeVar('T', int, str, List[int])
+        for value in (1, 'a', [1]):
+            self.assertCorrectType(value, T)
+            self.assertTrue(compile_checker(T).is_consistent(value))
+        self.assertIncorrectType(1.0, T)
+        self.assertIncorrectType(['a'], T)
+        self.assertFalse(compile_checker(T).is_consistent(['a']))
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+import abc
+import gc
+import unittest
+from typing import FrozenSet, List, Tuple
+
+from pep484checker.checker._sampling import SamplingPolicy, FIRST, sampling_scope
+from pep484checker.checker.func import (compile_checker, enable_verdict_cache, disable_verdict_cache,
+                                        verdict_cache_info)
+
+
+class TestVerdictCache(unittest.TestCase):
+    def setUp(self):
+        enable_verdict_cache(maxsize=2)
+
+    def tearDown(self):
+        disable_verdict_cache()
+
+    def test_repeated_checks_hit_cache(self):
+        checker = compile_checker(Tuple[int, ...])
+        value = tuple(range(10000))
+        self.assertTrue(checker.is_consistent(value))
+        self.assertTrue(checker.is_consistent(value))
+        self.assertFalse(checker.is_consistent(value + ('a',)))
+        self.assertEqual(verdict_cache_info()[:2], (1, 2))
+
+    def test_errors_are_cached_too(self):
+        checker = compile_checker(Tuple[int, str])
+        value = (1, 2)
+        for _ in range(2):
+            with self.assertRaisesRegex(TypeError, 'At position 1 in tuple'):
+                checker(value)
+        self.assertEqual(verdict_cache_info().hits, 1)
+
+    def test_least_recently_used_are_evicted(self):
+        checker = compile_checker(Tuple[int, ...])
+        values = [(1,), (2,), (3,)]
+        for value in values:
+            checker(value)
+        self.assertEqual(verdict_cache_info().currsize, 2)
+        checker(values[0])
+        self.assertEqual(verdict_cache_info().misses, 4)
+
+    def test_dead_frozensets_are_dropped(self):
+        checker = compile_checker(FrozenSet[int])
+        value = frozenset([1, 2])
+        checker(value)
+        checker(value)
+        self.assertEqual(verdict_cache_info().hits, 1)
+
+        del value
+        gc.collect()
+        other = frozenset(['a'])
+        self.assertFalse(checker.is_consistent(other))
+        self.assertEqual(verdict_cache_info().currsize, 1)
+
+    def test_mutable_contents_are_not_cached(self):
+        checker = compile_checker(Tuple[List[int], ...])
+        value = ([1],)
+        self.assertTrue(checker.is_consistent(value))
+        value[0].append('a')
+        self.assertFalse(checker.is_consistent(value))
+        self.assertEqual(verdict_cache_info().misses, 0)
+
+    def test_sampled_verdicts_are_not_cached(self):
+        checker = compile_checker(Tuple[int, ...])
+        value = tuple(range(100)) + ('a',)
+        with sampling_scope(SamplingPolicy(FIRST, size=10)) as state:
+            self.assertTrue(checker.is_consistent(value))
+            self.assertTrue(state.sampled)
+        self.assertFalse(checker.is_consistent(value))
+        with sampling_scope(SamplingPolicy(FIRST, size=10)) as state:
+            self.assertTrue(checker.is_consistent(value[:-1]))
+            self.assertTrue(state.sampled)
+        self.assertEqual(verdict_cache_info().currsize, 1)
+
+    def test_registrations_with_abc_drop_verdicts(self):
+        class Base(metaclass=abc.ABCMeta):
+            pass
+
+        class Registered(object):
+            pass
+
+        checker = compile_checker(Tuple[Base, ...])
+        value = (Registered(),)
+        self.assertFalse(checker.is_consistent(value))
+        Base.register(Registered)
+        self.assertTrue(checker.is_consistent(value))
+
+    def test_disabled_by_default(self):
+        disable_verdict_cache()
+        self.assertIsNone(verdict_cache_info())
+        self.assertTrue(compile_checker(Tuple[int, ...]).is_consistent((1, 2)))
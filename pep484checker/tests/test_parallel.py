@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+import threading
+import unittest
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pep484checker.checker import _parallel
+from pep484checker.checker._parallel import ParallelPolicy, PROCESS, THREAD
+from pep484checker.checker._sampling import SamplingPolicy, FIRST
+from pep484checker.checker.func import check_type, is_consistent, validate
+
+
+class TestParallelPolicy(unittest.TestCase):
+    def test_chunks(self):
+        policy = ParallelPolicy(chunk_size=3, max_workers=2)
+        self.assertEqual(policy.get_chunks(7), [(0, 3), (3, 6), (6, 7)])
+        self.assertEqual(ParallelPolicy(max_workers=2).get_chunks(10), [(0, 10)])
+
+    def test_wrong_arguments(self):
+        with self.assertRaises(ValueError):
+            ParallelPolicy(executor='cluster')
+        with self.assertRaises(ValueError):
+            ParallelPolicy(chunk_size=0)
+
+
+class ParallelChecksMixin(object):
+    executor = None
+
+    def get_policy(self):
+        return ParallelPolicy(threshold=100, chunk_size=50, max_workers=3, executor=self.executor)
+
+    def assertSameVerdict(self, argument, hint):
+        serial = validate(argument, hint)
+        parallel = validate(argument, hint, parallel=self.get_policy())
+        self.assertEqual(bool(parallel), bool(serial))
+        if not serial:
+            self.assertEqual(str(parallel), str(serial))
+            self.assertEqual([error.path for error in parallel.errors],
+                             [error.path for error in serial.errors])
+
+    def test_lists(self):
+        values = list(range(1000))
+        self.assertSameVerdict(values, List[int])
+        self.assertSameVerdict(values + ['a'], List[int])
+        self.assertSameVerdict(values[:500] + ['a'] + values[500:] + [None], List[int])
+        self.assertSameVerdict(['a'] + values, List[int])
+
+    def test_nested_values(self):
+        rows = [[i, i] for i in range(1000)]
+        self.assertSameVerdict(rows, List[List[int]])
+        self.assertSameVerdict(rows[:700] + [[1, 'a']] + rows[700:], List[List[int]])
+        self.assertSameVerdict(tuple(rows) + ((1, 'a'),), Sequence[Tuple[int, int]])
+
+    def test_mappings(self):
+        mapping = {str(i): i for i in range(1000)}
+        self.assertSameVerdict(mapping, Dict[str, int])
+        self.assertSameVerdict(dict(mapping, a='b'), Dict[str, int])
+        self.assertSameVerdict(dict(mapping, **{'1': None}), Dict[str, Optional[int]])
+
+        bad_key = dict(mapping)
+        bad_key[5] = 5
+        self.assertSameVerdict(bad_key, Dict[str, int])
+
+    def test_check_type(self):
+        values = ['a'] * 1000
+        check_type(values, List[str], parallel=self.get_policy())
+        with self.assertRaises(TypeError):
+            check_type(values + [1], List[str], parallel=self.get_policy())
+        self.assertFalse(is_consistent(values, List[int], parallel=self.get_policy()))
+
+    def test_serial_checks(self):
+        # small containers, other hints, and mismatches of the container itself
+        self.assertSameVerdict(list(range(10)) + ['a'], List[int])
+        self.assertSameVerdict({'a': list(range(1000))}, Dict[str, List[str]])
+        self.assertSameVerdict(tuple(range(1000)), List[int])
+        self.assertSameVerdict(list(range(1000)), int)
+
+    def test_sampled_containers(self):
+        values = list(range(1000)) + ['a']
+        self.assertTrue(is_consistent(values, List[int], sampling=SamplingPolicy(FIRST, size=100),
+                                      parallel=self.get_policy()))
+
+
+class TestThreadPool(ParallelChecksMixin, unittest.TestCase):
+    executor = THREAD
+
+
+class TestProcessPool(ParallelChecksMixin, unittest.TestCase):
+    executor = PROCESS
+
+
+class TestProcessPoolFromThreads(unittest.TestCase):
+    def test_threads_are_used_while_other_threads_run(self):
+        released = threading.Event()
+        thread = threading.Thread(target=released.wait)
+        thread.start()
+        try:
+            self.assertFalse(_parallel._can_fork_workers())
+            policy = ParallelPolicy(threshold=100, chunk_size=50, max_workers=3, executor=PROCESS)
+            values = list(range(1000))
+            self.assertTrue(is_consistent(values, List[int], parallel=policy))
+            self.assertEqual(validate(values + ['a'], List[int], parallel=policy).errors[0].path, (1000,))
+        finally:
+            released.set()
+            thread.join()
+
+
+class TestUnavailableProcessPool(unittest.TestCase):
+    def test_containers_are_checked_serially(self):
+        def unavailable(max_workers):
+            raise OSError('no processes')
+
+        policy = ParallelPolicy(threshold=100, chunk_size=50, max_workers=3, executor=PROCESS)
+        process_pool = _parallel.ProcessPoolExecutor
+        _parallel.ProcessPoolExecutor = unavailable
+        try:
+            values = list(range(1000))
+            self.assertTrue(is_consistent(values, List[int], parallel=policy))
+            self.assertEqual(validate(values + ['a'], List[int], parallel=policy).errors[0].path, (1000,))
+        finally:
+            _parallel.ProcessPoolExecutor = process_pool
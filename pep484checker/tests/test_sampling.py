@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import unittest
+from typing import Dict, List, Tuple, AbstractSet
+
+from pep484checker.checker.func import (check_type, is_consistent, validate,
+                                        SamplingPolicy, set_default_sampling_policy)
+
+
+class TestSamplingPolicy(unittest.TestCase):
+    def setUp(self):
+        self.values = list(range(100))
+
+    def test_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            SamplingPolicy('every-other')
+
+    def test_first_and_last(self):
+        self.assertEqual(SamplingPolicy('first', size=3).sample(self.values, 100), [0, 1, 2])
+        self.assertEqual(SamplingPolicy('last', size=3).sample(self.values, 100), [97, 98, 99])
+        self.assertEqual(SamplingPolicy('last', size=3).sample(set(self.values), 100), [97, 98, 99])
+
+    def test_strided(self):
+        self.assertEqual(SamplingPolicy('strided', size=4).sample(self.values, 100), [0, 25, 50, 75])
+
+    def test_random_is_seeded_and_ordered(self):
+        sample = SamplingPolicy('random', size=10, seed=1).sample(self.values, 100)
+        self.assertEqual(sample, SamplingPolicy('random', size=10, seed=1).sample(self.values, 100))
+        self.assertEqual(sample, sorted(sample))
+        self.assertEqual(len(set(sample)), 10)
+
+        from_set = SamplingPolicy('random', size=10, seed=1).sample(frozenset(self.values), 100)
+        self.assertEqual(len(from_set), 10)
+
+
+    def test_sequences_are_sampled_by_index(self):
+        class Indexed(list):
+            def __iter__(self):
+                raise AssertionError('iterated')
+
+        values = Indexed(self.values)
+        self.assertEqual(SamplingPolicy('last', size=3).sample(values, 100), [97, 98, 99])
+        self.assertEqual(SamplingPolicy('strided', size=4).sample(values, 100), [0, 25, 50, 75])
+        self.assertEqual(len(SamplingPolicy('random', size=10).sample(values, 100)), 10)
+
+    def test_last_of_reversible_containers(self):
+        class Reversible(dict):
+            def __iter__(self):
+                raise AssertionError('iterated')
+
+            def __reversed__(self):
+                return reversed(list(self.keys()))
+
+        self.assertEqual(SamplingPolicy('last', size=3).sample(Reversible.fromkeys(self.values), 100),
+                         [97, 98, 99])
+
+
+class TestSampledChecks(unittest.TestCase):
+    def setUp(self):
+        self.values = list(range(1000)) + ['wrong']
+
+    def tearDown(self):
+        set_default_sampling_policy(None)
+
+    def test_full_check_by_default(self):
+        self.assertFalse(is_consistent(self.values, List[int]))
+
+    def test_per_call_policy(self):
+        first = SamplingPolicy('first', size=10)
+        self.assertTrue(is_consistent(self.values, List[int], sampling=first))
+        self.assertTrue(check_type(tuple(self.values), Tuple[int, ...], sampling=first))
+        self.assertFalse(is_consistent(self.values, List[int], sampling=SamplingPolicy('last', size=10)))
+
+    def test_threshold(self):
+        policy = SamplingPolicy('first', size=10, threshold=5000)
+        self.assertFalse(is_consistent(self.values, List[int], sampling=policy))
+
+    def test_default_policy(self):
+        set_default_sampling_policy(SamplingPolicy('first', size=10))
+        self.assertTrue(validate(set(range(1000)), AbstractSet[int]).sampled)
+        self.assertTrue(is_consistent({i: str(i) for i in range(1000)}, Dict[int, str]))
+
+    def test_mapping_sampling(self):
+        mapping = {i: i for i in range(100)}
+        mapping['wrong'] = 'wrong'
+        self.assertFalse(is_consistent(mapping, Dict[int, int], sampling=SamplingPolicy('last', size=10)))
+        self.assertTrue(is_consistent(mapping, Dict[int, int], sampling=SamplingPolicy('first', size=10)))
+
+    def test_verdict_reports_sampling(self):
+        self.assertFalse(validate([1, 2], List[int], sampling=SamplingPolicy('first', size=10)).sampled)
+
+        verdict = validate(self.values, List[int], sampling=SamplingPolicy('first', size=10))
+        self.assertTrue(verdict)
+        self.assertTrue(verdict.sampled)
+
+        verdict = validate(self.values, List[int])
+        self.assertFalse(verdict)
+        self.assertFalse(verdict.sampled)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import unittest
+from typing import Dict, List, Union
+
+from pep484checker.checker import _shared, func
+from pep484checker.checker.func import check_type, compile_checker, is_consistent, validate, validate_all
+
+
+Nested = List[Union[int, 'Nested']]
+NestedDict = Dict[str, Union[int, 'NestedDict']]
+
+
+class CountingList(list):
+    iterations = 0
+
+    def __iter__(self):
+        CountingList.iterations += 1
+        return super().__iter__()
+
+
+class TestSharedNodes(unittest.TestCase):
+    def setUp(self):
+        CountingList.iterations = 0
+
+    def test_shared_node_is_checked_once(self):
+        shared = CountingList(range(100))
+        value = {str(i): shared for i in range(1000)}
+        check_type(value, Dict[str, List[int]])
+        self.assertLessEqual(CountingList.iterations, 2)
+
+        CountingList.iterations = 0
+        compile_checker(Dict[str, List[int]])(value)
+        self.assertLessEqual(CountingList.iterations, 2)
+
+    def test_checked_once_per_hint(self):
+        shared = CountingList(range(100))
+        self.assertTrue(is_consistent([shared, shared], Union[List[List[str]], List[List[int]]]))
+        self.assertFalse(is_consistent([shared, shared], Union[List[List[str]], List[List[bytes]]]))
+
+    def test_cycles(self):
+        large = list(range(20))
+        large.append(large)
+        check_type(large, Nested)
+
+        small = [1]
+        small.append(small)
+        check_type(small, Nested)
+        self.assertTrue(compile_checker(Nested).is_consistent(small))
+
+        mapping = {str(i): i for i in range(20)}
+        mapping['self'] = mapping
+        check_type(mapping, NestedDict)
+
+    def test_small_cycles_are_found_without_iterative_engine(self):
+        def fail(*args, **kwargs):
+            self.fail('checked iteratively')
+
+        check_iteratively, func.check_iteratively = func.check_iteratively, fail
+        try:
+            small = [1]
+            small.append(small)
+            check_type(small, Nested)
+            self.assertTrue(compile_checker(Nested).is_consistent(small))
+            small.append('a')
+            self.assertEqual(validate(small, Nested).errors[0].path, (2,))
+        finally:
+            func.check_iteratively = check_iteratively
+
+    def test_mismatch_in_cycle(self):
+        large = list(range(20))
+        large.append(large)
+        large.append('a')
+        self.assertFalse(is_consistent(large, Nested))
+        self.assertEqual(validate(large, Nested).errors[0].path, (21,))
+
+    def test_errors_of_shared_node_are_reported_for_every_reference(self):
+        shared = list(range(20)) + ['a']
+        verdict = validate_all({'a': shared, 'b': shared}, Dict[str, List[int]])
+        self.assertEqual([error.path for error in verdict.errors], [('a', 20), ('b', 20)])
+
+    def test_memo_is_discarded(self):
+        check_type([list(range(20))] * 2, List[List[int]])
+        self.assertIsNone(_shared._state.check)
+        with self.assertRaises(TypeError):
+            check_type([list(range(20)) + ['a']] * 2, List[List[int]])
+        self.assertIsNone(_shared._state.check)
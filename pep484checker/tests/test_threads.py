@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+import threading
+from typing import Dict, List
+
+from pep484checker.checker.func import is_consistent
+from pep484checker.tests._base import CheckerTestCase
+
+
+class TestConcurrentChecks(CheckerTestCase):
+    def test_nested_parameters_of_same_origin(self):
+        self.assertCorrectType([[1, 2], [3]], List[List[int]])
+        self.assertIncorrectType([[1, 2], ['3']], List[List[int]])
+        self.assertCorrectType({'a': {1: 'b'}}, Dict[str, Dict[int, str]])
+        self.assertIncorrectType({'a': {'b': 1}}, Dict[str, Dict[int, str]])
+
+    def test_threads_dont_see_each_others_parameters(self):
+        cases = [([1, 2], List[int], True), (['a'], List[str], True),
+                 ([1, 2], List[str], False), (['a'], List[int], False)]
+        wrong = []
+
+        def check_all(shift):
+            for i in range(2000):
+                value, hint, verdict = cases[(i + shift) % len(cases)]
+                if is_consistent(value, hint) != verdict:
+                    wrong.append((value, hint))
+
+        threads = [threading.Thread(target=check_all, args=(shift,)) for shift in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(wrong, [])
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import collections.abc
+from abc import ABCMeta
+from typing import Iterable, List
+
+from pep484checker.checker import _helpers
+from pep484checker.tests._base import CheckerTestCase
+
+
+class CountingMeta(type):
+    checks = 0
+
+    def __subclasscheck__(cls, subclass):
+        CountingMeta.checks += 1
+        return super().__subclasscheck__(subclass)
+
+
+class Shape(metaclass=CountingMeta):
+    pass
+
+
+class Circle(Shape):
+    pass
+
+
+class Plugin(metaclass=ABCMeta):
+    pass
+
+
+class TestTypeVerdicts(CheckerTestCase):
+    def setUp(self):
+        _helpers.get_type_verdicts().clear()
+        CountingMeta.checks = 0
+
+    def test_subclass_checks_are_done_once(self):
+        for _ in range(10):
+            self.assertCorrectType([Circle(), Circle()], Iterable[Shape])
+            self.assertIncorrectType([Circle(), 1], List[Shape])
+        self.assertEqual(CountingMeta.checks, 1)
+
+    def test_registration_with_abc_is_seen(self):
+        class Extension(object):
+            pass
+        self.assertIncorrectType(Extension(), Plugin)
+        Plugin.register(Extension)
+        self.assertCorrectType(Extension(), Plugin)
+
+    def test_registration_with_abc_is_seen_by_generics(self):
+        # registered with an ABC of the test, which is a subclass of the one of the hint
+        class Pages(collections.abc.Iterable):
+            pass
+
+        class Sentence(object):
+            pass
+        self.assertIncorrectType(Sentence(), Iterable[str])
+        Pages.register(Sentence)
+        self.assertCorrectType(Sentence(), Iterable)
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import inspect
+import unittest
+from typing import Dict, List, Optional
+
+from pep484checker.checker import typechecked
+
+
+class Node(object):
+    @typechecked
+    def add_child(self, child: 'Node', weight: float = 1.0) -> 'Node':
+        return child
+
+    @typechecked
+    @classmethod
+    def create(cls, name: str) -> 'Node':
+        return cls()
+
+    @staticmethod
+    @typechecked
+    def parse(text: str) -> Optional[int]:
+        return int(text) if text else None
+
+
+@typechecked
+def count_words(words: List[str], *, min_length: int = 0) -> Dict[str, int]:
+    return {word: len(word) for word in words if len(word) >= min_length}
+
+
+@typechecked
+def wrong_return(value: int) -> str:
+    return value
+
+
+@typechecked
+def varargs(*values: int, **options: bool) -> None:
+    pass
+
+
+@typechecked
+async def double(value: int, wrong: bool = False) -> int:
+    await asyncio.sleep(0)
+    return str(value) if wrong else value * 2
+
+
+class TestTypechecked(unittest.TestCase):
+    def test_correct_calls(self):
+        self.assertEqual(count_words(['a', 'bb'], min_length=2), {'bb': 2})
+        self.assertEqual(count_words(words=['a']), {'a': 1})
+        varargs(1, 2, debug=True)
+
+    def test_wrong_arguments(self):
+        with self.assertRaisesRegex(TypeError, 'Argument `words` of count_words()'):
+            count_words(['a', 1])
+        with self.assertRaisesRegex(TypeError, 'Argument `min_length`'):
+            count_words(['a'], min_length='2')
+        with self.assertRaisesRegex(TypeError, r'Argument `\*args\[1\]`'):
+            varargs(1, '2')
+        with self.assertRaisesRegex(TypeError, 'Argument `debug`'):
+            varargs(1, debug=1)
+
+    def test_wrong_return_value(self):
+        with self.assertRaisesRegex(TypeError, r'Return value of wrong_return\(\)'):
+            wrong_return(1)
+
+    def test_methods_and_forward_references(self):
+        node = Node()
+        self.assertIs(node.add_child(node), node)
+        self.assertIs(node.add_child(node, weight=2.0), node)
+        with self.assertRaises(TypeError):
+            node.add_child('node')
+        with self.assertRaises(TypeError):
+            node.add_child(node, 2)
+
+    def test_classmethods_and_staticmethods(self):
+        self.assertIsInstance(Node.create('root'), Node)
+        with self.assertRaises(TypeError):
+            Node.create(1)
+        self.assertEqual(Node.parse('1'), 1)
+        self.assertIsNone(Node().parse(''))
+        with self.assertRaises(TypeError):
+            Node.parse(1)
+
+    def test_metadata_is_kept(self):
+        self.assertEqual(count_words.__name__, 'count_words')
+        self.assertIn('words', count_words.__annotations__)
+
+    def test_coroutine_functions(self):
+        self.assertTrue(inspect.iscoroutinefunction(double))
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(loop.run_until_complete(double(2)), 4)
+            with self.assertRaisesRegex(TypeError, r'Return value of double\(\)'):
+                loop.run_until_complete(double(2, wrong=True))
+            with self.assertRaisesRegex(TypeError, 'Argument `value` of double()'):
+                loop.run_until_complete(double('2'))
+        finally:
+            loop.close()